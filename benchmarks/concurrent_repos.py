@@ -0,0 +1,115 @@
+"""
+Multi-threaded stress benchmark for the concurrent repositories.
+
+Runs a mixed workload of subscribes, updates, deletes, lookups and `active_subscriptions_report`
+calls from a thread pool against the `myproj.service.concurrent_repo` repositories, and against
+the plain repositories with every operation serialized behind a single lock for comparison. After the run, the
+secondary indexes of the concurrent subscription repository are checked against its contents.
+
+Usage:
+    python -m benchmarks.concurrent_repos [--threads N] [--ops N] [--reports-every N] [--subscriptions N]
+"""
+
+import argparse
+import random
+import threading
+import time
+from contextlib import AbstractContextManager, nullcontext
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from decimal import Decimal
+
+from myproj.model.service import Service
+from myproj.model.subscription import Subscription
+from myproj.model.user import User, Destination
+from myproj.service.concurrent_repo import ConcurrentServiceRepo, ConcurrentSubscriptionRepo, ConcurrentUserRepo
+from myproj.service.service import ServiceRepo
+from myproj.service.subscription import SubscriptionRepo
+from myproj.service.user import UserRepo, UserService
+
+USERS = 1_000
+SERVICES = 100
+
+
+def build_user_service(concurrent: bool, subscriptions: int) -> UserService:
+    """
+    Creates a user service over synthetic users, services and subscriptions.
+    """
+    user_repo, service_repo, subscription_repo = ((ConcurrentUserRepo, ConcurrentServiceRepo, ConcurrentSubscriptionRepo)
+                                                  if concurrent else (UserRepo, ServiceRepo, SubscriptionRepo))
+    users = [User('User', str(i), Destination.PN, date(1980 + i % 30, 1, 1), i) for i in range(1, USERS + 1)]
+    services = [Service(i, f'Service {i}', 'Food', Decimal('9.99')) for i in range(1, SERVICES + 1)]
+    rows = [Subscription(i % USERS + 1, i % SERVICES + 1, 1, None, i, bool(i % 4)) for i in range(1, subscriptions + 1)]
+    return UserService(user_repo(users), service_repo(services), subscription_repo(rows))
+
+
+def worker(user_service: UserService, guard: AbstractContextManager, seed: int, ops: int, reports_every: int) -> None:
+    """
+    Runs a mixed workload of roughly 70% reads and 30% writes, each operation inside the guard.
+    """
+    rng = random.Random(seed)
+    repo = user_service.subscription_repo
+    own_ids = []
+    for i in range(ops):
+        roll = rng.random()
+        with guard:
+            if reports_every and i % reports_every == 0:
+                user_service.active_subscriptions_report()
+            elif roll < 0.15:
+                own_ids.append(user_service.subscribe_user_to_service(rng.randint(1, USERS),
+                                                                      rng.randint(1, SERVICES), 1).id_)
+            elif roll < 0.25 and own_ids:
+                repo.update(rng.choice(own_ids), {'quantity_per_month': rng.randint(1, 5)})
+            elif roll < 0.30 and own_ids:
+                repo.delete(own_ids.pop())
+            elif roll < 0.65:
+                user_service.subscriptions_for_user_id(rng.randint(1, USERS))
+            else:
+                user_service.users_subscribed_to_service(rng.randint(1, SERVICES))
+
+
+def run(user_service: UserService, guard: AbstractContextManager, threads: int, ops: int, reports_every: int) -> float:
+    """
+    Runs the workload on a thread pool and returns the elapsed seconds.
+    """
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        futures = [executor.submit(worker, user_service, guard, seed, ops, reports_every) for seed in range(threads)]
+        for future in futures:
+            future.result()
+    return time.perf_counter() - start
+
+
+def check_indexes(repo: ConcurrentSubscriptionRepo) -> None:
+    """
+    Verifies that the secondary indexes agree with the stored subscriptions.
+    """
+    subscriptions = repo.get_subscriptions()
+    active = {sub.id_ for sub in subscriptions.values() if sub.is_active()}
+    assert {sub.id_ for sub in repo.get_all_active_subscriptions()} == active, 'active index is inconsistent'
+    for user_id in range(1, USERS + 1):
+        expected = {sub.id_ for sub in subscriptions.values() if sub.user_id == user_id}
+        assert {sub.id_ for sub in repo.get_subscriptions_by_user_id(user_id)} == expected, 'user index is inconsistent'
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--threads', type=int, default=8, help='number of worker threads')
+    parser.add_argument('--ops', type=int, default=20_000, help='operations per thread')
+    parser.add_argument('--reports-every', type=int, default=500, help='operations between reports, 0 for none')
+    parser.add_argument('--subscriptions', type=int, default=50_000, help='number of initial subscriptions')
+    args = parser.parse_args()
+
+    print(f"{'mode':<14}{'seconds':>10}{'ops/s':>12}")
+    for mode in ('global lock', 'concurrent'):
+        concurrent = mode == 'concurrent'
+        user_service = build_user_service(concurrent, args.subscriptions)
+        guard = nullcontext() if concurrent else threading.Lock()
+        elapsed = run(user_service, guard, args.threads, args.ops, args.reports_every)
+        print(f'{mode:<14}{elapsed:>10.2f}{args.threads * args.ops / elapsed:>12,.0f}')
+        if concurrent:
+            check_indexes(user_service.subscription_repo)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,233 @@
+"""
+Synthetic dataset generator for the `data_*.csv` and `data_*.json` formats.
+
+Writes `users`, `services` and `subscriptions` files in the exact shapes accepted by
+`RegexPatterns` (user names with Polish and Spanish letters included), as CSV with a header and/or
+as JSON arrays with the keys of the sample files in `data/`. Rows are generated and written in
+chunks, so memory use does not grow with the number of rows.
+
+    - Valid rows get consecutive IDs starting at 1, and subscriptions only reference valid user and
+      service IDs, so every generated subscription joins in `active_subscriptions_report`.
+    - Service popularity follows a Zipf distribution: the service with ID k is picked with a
+      weight proportional to 1 / k ** zipf (0 for uniform).
+    - A fraction of the subscriptions is active, see `--active-ratio`.
+    - A fraction of the rows of every file is invalid (a malformed value or a missing field) and
+      is rejected by the validators; invalid rows do not use up IDs.
+
+Usage:
+    python -m benchmarks.generate_dataset [--users N] [--services N] [--subscriptions N]
+                                          [--format {csv,json} ...] [--output-dir DIR] [--zipf S]
+                                          [--active-ratio R] [--invalid-fraction F] [--seed N]
+"""
+
+import argparse
+import os
+import random
+import time
+from contextlib import ExitStack
+from datetime import date
+from itertools import accumulate
+from typing import Callable, Iterator
+
+FIRST_NAMES = ['Alejandro', 'Sofia', 'Paweł', 'Isabella', 'Łukasz', 'Martín', 'Agnieszka', 'José', 'Małgorzata',
+               'Lucía', 'Jakub', 'María', 'Wojciech', 'Andrés', 'Zofia', 'Iñigo', 'Krzysztof', 'Begoña', 'Michał',
+               'Ángel', 'Katarzyna', 'Raúl', 'Grzegorz', 'Sebastián', 'Joanna', 'Víctor', 'Bożena', 'Inés', 'Piotr',
+               'Óscar', 'Magdalena', 'Rubén', 'Tomasz', 'Nuria', 'Jędrzej', 'Adrián', 'Ewa', 'Mónica', 'Kamil', 'Ana']
+SURNAMES = ['García', 'Rodríguez', 'Bączkowski', 'López', 'Nowak', 'Muñoz', 'Wójcik', 'Pérez', 'Żak', 'Sánchez',
+            'Kowalczyk', 'Martínez', 'Zieliński', 'Gómez', 'Szymański', 'Fernández', 'Woźniak', 'Díaz', 'Dąbrowski',
+            'Hernández', 'Kozłowski', 'Jiménez', 'Jankowski', 'Álvarez', 'Mazur', 'Romero', 'Krawczyk', 'Núñez',
+            'Piotrowska', 'Ruiz', 'Grabowski', 'Navarro', 'Pawłowski', 'Ibáñez', 'Michalski', 'Domínguez', 'Król',
+            'Vázquez', 'Wieczorek', 'Logroño']
+ORIGINS = ['PENINSULA', 'BALEARICS ISLANDS', 'CANARY ISLANDS', 'CEUTA OR MELILLA TERITORY']
+ADJECTIVES = ['Delicious', 'Vintage', 'Spicy', 'Golden', 'Fresh', 'Royal', 'Rustic', 'Urban', 'Wild', 'Classic']
+NOUNS = ['Bites', 'Vineyard', 'Sensation', 'Harmony', 'Roasters', 'Pantry', 'Cellar', 'Garden', 'Market', 'Box']
+CATEGORIES = ['Food', 'Wine', 'Spices', 'Tea', 'Coffee', 'Cheese', 'Snacks', 'Beer', 'Fruit', 'Bakery', 'Meat',
+              'Seafood', 'Vegan', 'Sweets', 'Oils', 'Juice', 'Spirits', 'Pasta', 'Sauces', 'Honey']
+
+CHUNK_ROWS = 65_536
+
+# Per entity: CSV header, JSON keys and the positions of the fields written as JSON numbers
+_LAYOUTS = {
+    'users': (('Name', 'Surname', 'Origin', 'Datebirth', 'ID'), ('name', 'surname', 'origin', 'birthdate', 'id_'),
+              frozenset({4})),
+    'services': (('ID', 'Name', 'Category', 'Price'), ('id', 'name', 'category', 'price'), frozenset({0, 3})),
+    'subscriptions': (('User', 'Service', 'QuantityMonth', 'Discount', 'ID', 'Active'),
+                      ('User_id', 'Service_id', 'QuantityMonth', 'Discount', 'ID', 'Active'),
+                      frozenset(range(6))),
+}
+
+_FIRST_BIRTHDATE = date(1940, 1, 1).toordinal()
+_LAST_BIRTHDATE = date(2006, 12, 31).toordinal()
+
+
+def user_rows(count: int, rng: random.Random) -> Iterator[tuple[str, ...]]:
+    """
+    Yields `count` valid user rows with IDs 1 to `count`.
+    """
+    for id_ in range(1, count + 1):
+        yield (rng.choice(FIRST_NAMES), rng.choice(SURNAMES), rng.choice(ORIGINS),
+               date.fromordinal(rng.randint(_FIRST_BIRTHDATE, _LAST_BIRTHDATE)).isoformat(), str(id_))
+
+
+def service_rows(count: int, rng: random.Random) -> Iterator[tuple[str, ...]]:
+    """
+    Yields `count` valid service rows with IDs 1 to `count`.
+    """
+    for id_ in range(1, count + 1):
+        suffix = ''.join(chr(65 + id_ // 26 ** power % 26) for power in range(4))
+        yield (str(id_), f'{rng.choice(ADJECTIVES)} {rng.choice(NOUNS)} {suffix}', rng.choice(CATEGORIES),
+               f'{rng.randint(1, 199)}.{rng.randint(0, 99):02d}')
+
+
+def subscription_rows(count: int, users: int, services: int, rng: random.Random, zipf: float = 1.1,
+                      active_ratio: float = 0.7) -> Iterator[tuple[str, ...]]:
+    """
+    Yields `count` valid subscription rows with IDs 1 to `count`, referencing users 1 to `users`
+    and services 1 to `services` with Zipf-distributed popularity.
+    """
+    if count and (users < 1 or services < 1):
+        raise ValueError("Subscriptions need at least one user and one service")
+    service_ids = range(1, services + 1)
+    cum_weights = list(accumulate(k ** -zipf for k in service_ids))
+    for start in range(1, count + 1, CHUNK_ROWS):
+        size = min(CHUNK_ROWS, count + 1 - start)
+        picked = rng.choices(service_ids, cum_weights=cum_weights, k=size)
+        for id_, service_id in zip(range(start, start + size), picked):
+            yield (str(rng.randint(1, users)), str(service_id), str(rng.randint(1, 10)), str(rng.randint(0, 30)),
+                   str(id_), '1' if rng.random() < active_ratio else '0')
+
+
+def _invalidate(row: tuple[str, ...], rng: random.Random) -> tuple[str, ...]:
+    """
+    Returns a copy of a valid row that the validators reject: a field is dropped, or a value gets
+    a character its pattern does not allow.
+    """
+    position = rng.randrange(len(row))
+    if rng.random() < 0.3:
+        return row[:position] + row[position + 1:]
+    value = row[position]
+    corrupted = value.replace('-', '/') if value.count('-') == 2 else f'{value}#'
+    return row[:position] + (corrupted,) + row[position + 1:]
+
+
+def with_invalid_rows(rows: Iterator[tuple[str, ...]], fraction: float, rng: random.Random) -> Iterator[tuple[str, ...]]:
+    """
+    Interleaves invalid copies of valid rows, so that about `fraction` of the yielded rows are invalid.
+    """
+    if fraction <= 0:
+        yield from rows
+        return
+    if fraction >= 1:
+        raise ValueError("The invalid fraction must be below 1")
+    for row in rows:
+        while rng.random() < fraction:
+            yield _invalidate(row, rng)
+        yield row
+
+
+def _json_value(value: str, numeric: bool) -> str:
+    if numeric and value.replace('.', '', 1).isdigit():
+        return value
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def write_rows(directory: str, name: str, rows: Iterator[tuple[str, ...]], formats: list[str]) -> list[str]:
+    """
+    Streams rows to `<name>.csv` and/or `<name>.json` in the directory.
+
+    Returns:
+        list[str]: The written paths.
+    """
+    header, keys, numeric = _LAYOUTS[name]
+    paths = [os.path.join(directory, f'{name}.{extension}') for extension in formats]
+    with ExitStack() as stack:
+        files = {extension: stack.enter_context(open(path, 'w', encoding='utf-8', newline=''))
+                 for extension, path in zip(formats, paths)}
+        if 'csv' in files:
+            files['csv'].write(','.join(header) + '\n')
+        if 'json' in files:
+            files['json'].write('[')
+        first = True
+        while True:
+            chunk = [row for _, row in zip(range(CHUNK_ROWS), rows)]
+            if not chunk:
+                break
+            if 'csv' in files:
+                files['csv'].write(''.join(','.join(row) + '\n' for row in chunk))
+            if 'json' in files:
+                records = ('{' + ', '.join(f'"{key}": {_json_value(value, position in numeric)}'
+                                           for position, (key, value) in enumerate(zip(keys, row))) + '}'
+                           for row in chunk)
+                files['json'].write(('\n' if first else ',\n') + ',\n'.join(records))
+            first = False
+        if 'json' in files:
+            files['json'].write('\n]\n')
+    return paths
+
+
+def generate(directory: str, users: int, services: int, subscriptions: int, formats: tuple[str, ...] = ('csv', 'json'),
+             zipf: float = 1.1, active_ratio: float = 0.7, invalid_fraction: float = 0.0, seed: int = 0,
+             progress: Callable[[str, float], None] | None = None) -> list[str]:
+    """
+    Writes a synthetic dataset to a directory, see the module documentation.
+
+    Args:
+        directory (str): The output directory; it is created if missing.
+        users (int): The number of valid users.
+        services (int): The number of valid services.
+        subscriptions (int): The number of valid subscriptions.
+        formats (tuple[str, ...]): 'csv' and/or 'json'.
+        zipf (float): The Zipf exponent of service popularity; 0 picks services uniformly.
+        active_ratio (float): The probability of a subscription being active.
+        invalid_fraction (float): The expected fraction of invalid rows in every file, below 1.
+        seed (int): The seed of the random generator; equal arguments produce equal files.
+        progress (Callable[[str, float], None] | None): Called with each entity and the seconds it took.
+
+    Returns:
+        list[str]: The written paths.
+
+    Raises:
+        ValueError: If a format is unknown, the invalid fraction is not below 1, or subscriptions
+            are requested without users or services.
+    """
+    if not set(formats) <= {'csv', 'json'}:
+        raise ValueError("Unsupported data type")
+    os.makedirs(directory, exist_ok=True)
+    rng = random.Random(seed)
+    entities = (
+        ('users', user_rows(users, rng)),
+        ('services', service_rows(services, rng)),
+        ('subscriptions', subscription_rows(subscriptions, users, services, rng, zipf, active_ratio)),
+    )
+    paths = []
+    for name, rows in entities:
+        start = time.perf_counter()
+        paths += write_rows(directory, name, with_invalid_rows(rows, invalid_fraction, rng), list(formats))
+        if progress is not None:
+            progress(name, time.perf_counter() - start)
+    return paths
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--users', type=int, default=100_000, help='number of valid users')
+    parser.add_argument('--services', type=int, default=1_000, help='number of valid services')
+    parser.add_argument('--subscriptions', type=int, default=500_000, help='number of valid subscriptions')
+    parser.add_argument('--format', nargs='+', choices=['csv', 'json'], default=['csv', 'json'], dest='formats',
+                        help='output formats')
+    parser.add_argument('--output-dir', default='data/generated', help='output directory')
+    parser.add_argument('--zipf', type=float, default=1.1, help='Zipf exponent of service popularity, 0 for uniform')
+    parser.add_argument('--active-ratio', type=float, default=0.7, help='fraction of active subscriptions')
+    parser.add_argument('--invalid-fraction', type=float, default=0.0, help='fraction of invalid rows per file')
+    parser.add_argument('--seed', type=int, default=0, help='random seed')
+    args = parser.parse_args()
+
+    paths = generate(args.output_dir, args.users, args.services, args.subscriptions, tuple(args.formats), args.zipf,
+                     args.active_ratio, args.invalid_fraction, args.seed,
+                     lambda name, seconds: print(f'{name:<14}{seconds:>8.2f} s'))
+    for path in paths:
+        print(f'{path} ({os.path.getsize(path) / 1024 ** 2:.1f} MB)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+Memory benchmark for the slotted `Service`, `Subscription` and `User` models.
+
+Compares the per-instance footprint of the models against unslotted dataclasses with the same
+fields, which is how the models were declared before they became slotted.
+
+Usage:
+    python -m benchmarks.models_memory [--count N]
+"""
+
+import argparse
+import tracemalloc
+from dataclasses import fields, make_dataclass
+from datetime import date
+from decimal import Decimal
+from typing import Callable
+
+from myproj.model.service import Service
+from myproj.model.subscription import Subscription
+from myproj.model.user import User, Destination
+
+
+def unslotted(cls: type, frozen: bool = False) -> type:
+    """
+    Returns an unslotted dataclass with the same fields as the given dataclass.
+    """
+    return make_dataclass(f'Unslotted{cls.__name__}', [(f.name, f.type, f) for f in fields(cls)], frozen=frozen)
+
+
+def bytes_per_instance(factory: Callable[[int], object], count: int) -> float:
+    """
+    Measures the average number of bytes allocated per instance created by the factory.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [factory(i) for i in range(count)]
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del instances
+    return allocated / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=100_000, help='number of instances per model')
+    args = parser.parse_args()
+
+    price = Decimal('12.99')
+    birthdate = date(1990, 1, 1)
+    cases = {
+        'Service': (Service, unslotted(Service),
+                    lambda cls: lambda i: cls(i, 'Gourmet Burger', 'Burgers', price)),
+        'Subscription': (Subscription, unslotted(Subscription),
+                         lambda cls: lambda i: cls(i, i, 2, None, i, True)),
+        'User': (User, unslotted(User, frozen=True),
+                 lambda cls: lambda i: cls('John', 'Doe', Destination.PN, birthdate, i)),
+    }
+
+    print(f"{'model':<14}{'unslotted B':>14}{'slotted B':>12}{'saved':>8}")
+    for name, (slotted_cls, unslotted_cls, factory) in cases.items():
+        before = bytes_per_instance(factory(unslotted_cls), args.count)
+        after = bytes_per_instance(factory(slotted_cls), args.count)
+        print(f'{name:<14}{before:>14.1f}{after:>12.1f}{1 - after / before:>8.0%}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""
+Memory benchmark for interned service categories and user names.
+
+Generates synthetic user and service rows with realistic cardinalities (a few hundred first names
+and surnames, a few dozen categories, four origins), loads them through the typed text pipeline
+into `UserRepo` and `ServiceRepo`, and compares the memory held by the repositories against the
+same pipeline with interning disabled, which keeps one string per row and field.
+
+Usage:
+    python -m benchmarks.string_interning [--users N] [--services N]
+
+The full-size dataset is `--users 10000000 --services 100000`; it needs several GB of memory.
+"""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from dataclasses import replace
+from typing import Callable
+
+from myproj.file_repo.file_reader_factory import FactoryType, RecordSchemas, ToTypedRecordDataConverter
+from myproj.service.service import ServiceRepo
+from myproj.service.user import UserRepo
+
+FIRST_NAMES = [f'Name{chr(65 + i % 26)}{"abcdefghij"[i // 26 % 10]}' for i in range(300)]
+SURNAMES = [f'Surname{chr(65 + i % 26)}{"abcdefghijklmnopqrst"[i // 26 % 20]}' for i in range(500)]
+CATEGORIES = [f'Category {chr(65 + i % 26)}{"ab"[i // 26]}' for i in range(40)]
+ORIGINS = ['PENINSULA', 'BALEARICS ISLANDS', 'CANARY ISLANDS', 'CEUTA OR MELILLA TERITORY']
+
+
+def user_rows(count: int) -> list[str]:
+    """
+    Returns CSV rows of users, without a header.
+    """
+    return [f'{FIRST_NAMES[i * 7 % len(FIRST_NAMES)]},{SURNAMES[i * 13 % len(SURNAMES)]},{ORIGINS[i % 4]},'
+            f'{1940 + i % 60}-{1 + i % 12:02d}-{1 + i % 28:02d},{i}' for i in range(1, count + 1)]
+
+
+def service_rows(count: int) -> list[str]:
+    """
+    Returns CSV rows of services, without a header.
+    """
+    return [f'{i},Service {chr(65 + i % 26)}{chr(65 + i // 26 % 26)}{chr(65 + i // 676 % 26)},'
+            f'{CATEGORIES[i % len(CATEGORIES)]},{i % 100}.99' for i in range(1, count + 1)]
+
+
+def converter(factory_type: FactoryType, interned: bool) -> ToTypedRecordDataConverter:
+    """
+    Returns the typed converter of the factory type, optionally with `sys.intern` replaced by `str`.
+    """
+    schema = RecordSchemas[factory_type.value].value
+    if not interned:
+        schema = tuple(replace(spec, parse=str) if spec.parse is sys.intern else spec for spec in schema)
+    return ToTypedRecordDataConverter(schema)
+
+
+def retained_bytes(build: Callable[[], object]) -> int:
+    """
+    Measures the number of bytes still allocated by the object the callable builds.
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    built = build()
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del built
+    return retained
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--users', type=int, default=1_000_000, help='number of users')
+    parser.add_argument('--services', type=int, default=100_000, help='number of services')
+    args = parser.parse_args()
+
+    cases = {
+        'UserRepo': (UserRepo, FactoryType.FROM_USER, user_rows(args.users)),
+        'ServiceRepo': (ServiceRepo, FactoryType.FROM_SERVICE, service_rows(args.services)),
+    }
+
+    print(f"{'repository':<14}{'plain MB':>12}{'interned MB':>14}{'saved':>8}")
+    for name, (repo_cls, factory_type, rows) in cases.items():
+        sizes = [retained_bytes(lambda: repo_cls(converter(factory_type, interned).convert(rows)))
+                 for interned in (False, True)]
+        before, after = (size / 1024 ** 2 for size in sizes)
+        print(f'{name:<14}{before:>12.1f}{after:>14.1f}{1 - after / before:>8.0%}')
+
+
+if __name__ == '__main__':
+    main()
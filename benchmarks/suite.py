@@ -0,0 +1,242 @@
+"""
+Benchmark suite for the file_repo pipeline and the repository hot paths.
+
+For every dataset size, synthetic users, services and subscriptions are written as CSV and JSON
+files, and the suite times:
+
+    - `DataProcessor.process` for every `DataFormat` x `FactoryType`,
+    - the validator of every `FactoryType` on the CSV rows, without loading and converting,
+    - the construction of `UserRepo`, `ServiceRepo` and `SubscriptionRepo`,
+    - `SubscriptionRepo.get_subscriptions_by_user_id`, `UserRepo.get_users_older_than` and
+      `UserService.active_subscriptions_report`.
+
+Each case records its throughput (rows or calls per second at the median latency), its latency
+percentiles and, unless disabled, its peak traced memory. Results are written to a JSON file;
+with `--baseline`, the median latencies are compared against an earlier results file and the
+command exits with status 1 when a case slowed down by more than `--threshold`.
+
+Usage:
+    python -m benchmarks.suite [--sizes N [N ...]] [--repeat N] [--queries N] [--no-memory]
+                               [--output FILE] [--baseline FILE] [--threshold RATIO]
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterator
+
+from benchmarks.generate_dataset import generate
+from myproj.file_repo.file_reader_factory import DataProcessor, DataFormat, FactoryType, RegexPatterns, create_validator_for
+from myproj.service.service import ServiceRepo
+from myproj.service.subscription import SubscriptionRepo
+from myproj.service.user import UserRepo, UserService
+
+_EXTENSIONS = {DataFormat.JSON: 'json', DataFormat.TEXT: 'csv', DataFormat.MAPPED_TEXT: 'csv'}
+_FILES = {FactoryType.FROM_USER: 'users', FactoryType.FROM_SERVICE: 'services',
+          FactoryType.FROM_SUBSCRIPTION: 'subscriptions'}
+
+
+@dataclass
+class CaseResult:
+    """
+    The measurements of one benchmark case.
+
+    Attributes:
+        name (str): The case, e.g. 'process/TEXT/FROM_USER'.
+        size (int): The dataset size the case ran on.
+        calls (int): The number of timed calls.
+        throughput (float): Rows (for whole-dataset cases) or calls per second at the median latency.
+        p50 (float): The median latency in seconds.
+        p95 (float): The 95th percentile latency in seconds.
+        p99 (float): The 99th percentile latency in seconds.
+        peak_memory (int | None): The peak traced memory of one call in bytes, None if not measured.
+    """
+    name: str
+    size: int
+    calls: int
+    throughput: float
+    p50: float
+    p95: float
+    p99: float
+    peak_memory: int | None = None
+
+
+def write_dataset(directory: str, size: int, seed: int = 0) -> None:
+    """
+    Writes `size` users and subscriptions and `size // 100` (at least 10) services as CSV and JSON.
+    """
+    generate(directory, size, max(size // 100, 10), size, seed=seed)
+
+
+def percentile(timings: list[float], q: float) -> float:
+    """
+    Returns the nearest-rank percentile of sorted timings.
+    """
+    return timings[min(len(timings) - 1, max(0, round(q / 100 * len(timings)) - 1))]
+
+
+def measure(name: str, size: int, units: int, calls: int, call: Callable[[int], Any],
+            track_memory: bool) -> CaseResult:
+    """
+    Times `calls` calls of `call(i)`, then measures the peak memory of one more call.
+
+    Args:
+        name (str): The case name.
+        size (int): The dataset size.
+        units (int): The rows handled per call, for the throughput; 1 for per-call cases.
+        calls (int): The number of timed calls.
+        call (Callable[[int], Any]): The benchmarked callable, receiving the call index.
+        track_memory (bool): Whether to measure the peak memory.
+
+    Returns:
+        CaseResult: The measurements.
+    """
+    timings = []
+    for i in range(calls):
+        start = time.perf_counter()
+        call(i)
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+
+    peak = None
+    if track_memory:
+        tracemalloc.start()
+        call(calls)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    p50 = percentile(timings, 50)
+    return CaseResult(name, size, calls, units / p50 if p50 else float('inf'), p50,
+                      percentile(timings, 95), percentile(timings, 99), peak)
+
+
+def cases(directory: str, size: int, repeat: int, queries: int) -> Iterator[tuple[str, int, int, Callable[[int], Any]]]:
+    """
+    Yields the cases of a dataset as `(name, units per call, calls, callable)`.
+    """
+    for data_type in DataFormat:
+        for factory_type in FactoryType:
+            path = os.path.join(directory, f'{_FILES[factory_type]}.{_EXTENSIONS[data_type]}')
+            processor = DataProcessor.create_processor(data_type, factory_type)
+            units = size if factory_type is not FactoryType.FROM_SERVICE else max(size // 100, 10)
+            yield (f'process/{data_type.value}/{factory_type.value}', units, repeat,
+                   lambda i, processor=processor, path=path: processor.process(path))
+
+    for factory_type in FactoryType:
+        with open(os.path.join(directory, f'{_FILES[factory_type]}.csv'), encoding='utf-8') as f:
+            rows = f.read().splitlines()
+        validator = create_validator_for(RegexPatterns[factory_type.value].value)
+        yield (f'validate/{factory_type.value}', len(rows), repeat,
+               lambda i, validator=validator, rows=rows: list(validator.validate_fields_iter(rows)))
+
+    repos = {}
+    for repo_cls, factory_type in ((UserRepo, FactoryType.FROM_USER), (ServiceRepo, FactoryType.FROM_SERVICE),
+                                   (SubscriptionRepo, FactoryType.FROM_SUBSCRIPTION)):
+        path = os.path.join(directory, f'{_FILES[factory_type]}.csv')
+        data = DataProcessor.create_processor(DataFormat.TEXT, factory_type).process(path)
+        repos[repo_cls] = repo_cls(data)
+        yield (f'repo/{repo_cls.__name__}', len(data.get_content()), repeat,
+               lambda i, repo_cls=repo_cls, data=data: repo_cls(data))
+
+    user_service = UserService(repos[UserRepo], repos[ServiceRepo], repos[SubscriptionRepo])
+    rng = random.Random(size)
+    user_ids = [rng.randint(1, size) for _ in range(queries + 1)]
+    ages = [rng.randint(18, 80) for _ in range(queries + 1)]
+    yield ('query/get_subscriptions_by_user_id', 1, queries,
+           lambda i: user_service.subscription_repo.get_subscriptions_by_user_id(user_ids[i]))
+    yield ('query/get_users_older_than', 1, queries, lambda i: user_service.user_repo.get_users_older_than(ages[i]))
+    yield ('query/active_subscriptions_report', 1, repeat, lambda i: user_service.active_subscriptions_report())
+
+
+def run_suite(sizes: list[int], repeat: int = 5, queries: int = 1000, track_memory: bool = True,
+              progress: Callable[[CaseResult], None] | None = None) -> dict:
+    """
+    Runs every case on every dataset size.
+
+    Args:
+        sizes (list[int]): The dataset sizes.
+        repeat (int): The number of timed calls of whole-dataset cases.
+        queries (int): The number of timed calls of per-key query cases.
+        track_memory (bool): Whether to measure the peak memory of each case.
+        progress (Callable[[CaseResult], None] | None): Called with each result as it completes.
+
+    Returns:
+        dict: The results document written to the JSON file, with 'meta' and 'results' keys.
+    """
+    results = []
+    for size in sizes:
+        with tempfile.TemporaryDirectory(prefix='myproj-bench-') as directory:
+            write_dataset(directory, size)
+            for name, units, calls, call in cases(directory, size, repeat, queries):
+                result = measure(name, size, units, calls, call, track_memory)
+                results.append(asdict(result))
+                if progress is not None:
+                    progress(result)
+    meta = {'created': datetime.now(timezone.utc).isoformat(timespec='seconds'), 'python': sys.version.split()[0],
+            'platform': platform.platform(), 'sizes': sizes, 'repeat': repeat, 'queries': queries}
+    return {'meta': meta, 'results': results}
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[tuple[str, int, float, float]]:
+    """
+    Finds the cases whose median latency exceeds the baseline by more than the threshold.
+
+    Args:
+        results (dict): The current results document.
+        baseline (dict): An earlier results document.
+        threshold (float): The tolerated slowdown, e.g. 0.2 for 20%.
+
+    Returns:
+        list[tuple[str, int, float, float]]: The regressed cases as `(name, size, baseline p50, p50)`.
+    """
+    previous = {(result['name'], result['size']): result['p50'] for result in baseline['results']}
+    regressions = []
+    for result in results['results']:
+        before = previous.get((result['name'], result['size']))
+        if before and result['p50'] > before * (1 + threshold):
+            regressions.append((result['name'], result['size'], before, result['p50']))
+    return regressions
+
+
+def print_result(result: CaseResult) -> None:
+    memory = f'{result.peak_memory / 1024 ** 2:>10.1f}' if result.peak_memory is not None else f"{'-':>10}"
+    print(f'{result.name:<44}{result.size:>10}{result.throughput:>14,.0f}{result.p50 * 1e3:>10.3f}'
+          f'{result.p95 * 1e3:>10.3f}{result.p99 * 1e3:>10.3f}{memory}')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000], help='dataset sizes in rows')
+    parser.add_argument('--repeat', type=int, default=5, help='timed calls of whole-dataset cases')
+    parser.add_argument('--queries', type=int, default=1000, help='timed calls of per-key queries')
+    parser.add_argument('--no-memory', action='store_true', help='skip the peak memory measurements')
+    parser.add_argument('--output', default='benchmark_results.json', help='the JSON results file to write')
+    parser.add_argument('--baseline', help='a JSON results file to compare against')
+    parser.add_argument('--threshold', type=float, default=0.2, help='tolerated slowdown against the baseline')
+    args = parser.parse_args()
+
+    print(f"{'case':<44}{'size':>10}{'rows|calls/s':>14}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'peak MB':>10}")
+    results = run_suite(args.sizes, args.repeat, args.queries, not args.no_memory, print_result)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f'Results written to {args.output}')
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        for name, size, before, after in regressions:
+            print(f'REGRESSION {name} @ {size}: p50 {before * 1e3:.3f} ms -> {after * 1e3:.3f} ms')
+        if regressions:
+            sys.exit(1)
+        print(f'No regressions against {args.baseline} (threshold {args.threshold:.0%})')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,164 @@
+"""
+Opt-in on-disk cache for the results of `DataProcessor.process`.
+
+Entries are keyed on the absolute path of the source file, its size, its modification time (or,
+optionally, a hash of its content) and a namespace describing how the file is processed, so any
+change to the file or to the processing pipeline results in a miss. Results are stored with
+`pickle`, which restores `TextData`/`JsonData` much faster than re-parsing the source file. Once
+the cache directory grows beyond `max_bytes`, the least recently used entries are evicted.
+
+ Example:
+        ```python
+        from myproj.file_repo.cache import ProcessedDataCache
+        from myproj.file_repo.file_reader_factory import DataProcessor, DataFormat, FactoryType
+
+        cache = ProcessedDataCache('.cache/processed', max_bytes=256 * 1024 ** 2)
+        processor = DataProcessor.create_processor(DataFormat.TEXT, FactoryType.FROM_SERVICE, cache=cache)
+
+        # The first call parses the file, later calls on the unchanged file read the cached result
+        data = processor.process('data/data_service.csv')
+        ```
+"""
+
+import hashlib
+import os
+import pickle
+
+from typing import Any
+
+
+class ProcessedDataCache:
+    """
+    Directory of pickled processing results with least-recently-used eviction by total size.
+
+    Attributes:
+        directory (str): The directory holding the cache entries; it is created if missing.
+        max_bytes (int): The maximum total size of the entries in bytes.
+        use_content_hash (bool): Whether source files are identified by a hash of their content
+            instead of their modification time. Hashing reads the whole file on every lookup, but
+            survives touches and copies that keep the content unchanged.
+
+    Methods:
+        key_for: Builds the cache key of a file processed under a namespace.
+        get: Returns the cached result for a key, or None on a miss.
+        put: Stores the result for a key.
+        clear: Removes all entries.
+    """
+    SUFFIX = '.pickle'
+
+    def __init__(self, directory: str, max_bytes: int = 1024 ** 3, use_content_hash: bool = False):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.use_content_hash = use_content_hash
+        os.makedirs(directory, exist_ok=True)
+
+    def key_for(self, path: str, namespace: str) -> str:
+        """
+        Builds the cache key of a file processed under the given namespace.
+
+        Compute the key before processing the file, so that a change made while it is being
+        processed leads to a miss on the next lookup instead of a stale hit.
+
+        Args:
+            path (str): The path of the source file.
+            namespace (str): Describes how the file is processed, e.g. the repr of the data factory.
+
+        Returns:
+            str: The key of the entry.
+
+        Raises:
+            FileNotFoundError: If the source file is not found.
+        """
+        stat = os.stat(path)
+        if self.use_content_hash:
+            with open(path, 'rb') as f:
+                version = hashlib.file_digest(f, 'blake2b').hexdigest()
+        else:
+            version = str(stat.st_mtime_ns)
+        identity = '\0'.join((os.path.abspath(path), str(stat.st_size), version, namespace))
+        return hashlib.blake2b(identity.encode('utf-8'), digest_size=20).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.directory, key + self.SUFFIX)
+
+    def get(self, key: str) -> Any | None:
+        """
+        Returns the cached result for a key, or None on a miss.
+
+        A hit marks the entry as recently used. Unreadable entries are dropped and reported as a miss.
+
+        Args:
+            key (str): A key built by `key_for`.
+
+        Returns:
+            Any | None: A fresh copy of the cached result, or None.
+        """
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, 'rb') as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            self._remove(entry_path)
+            return None
+        try:
+            os.utime(entry_path)
+        except FileNotFoundError:
+            pass
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """
+        Stores a result and evicts least recently used entries beyond `max_bytes`.
+
+        Args:
+            key (str): A key built by `key_for`.
+            value (Any): The picklable processing result.
+        """
+        entry_path = self._entry_path(key)
+        tmp_path = f'{entry_path}.{os.getpid()}.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, entry_path)
+        except BaseException:
+            self._remove(tmp_path)
+            raise
+        self._evict()
+
+    def clear(self) -> None:
+        """
+        Removes all entries.
+        """
+        for entry in self._entries():
+            self._remove(entry.path)
+
+    def _entries(self) -> list[os.DirEntry]:
+        with os.scandir(self.directory) as entries:
+            return [entry for entry in entries if entry.name.endswith(self.SUFFIX)]
+
+    def _evict(self) -> None:
+        """
+        Removes the least recently used entries until the total size fits in `max_bytes`.
+        """
+        entries = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry_path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(entry_path)
+            total -= size
+
+    @staticmethod
+    def _remove(entry_path: str) -> None:
+        try:
+            os.remove(entry_path)
+        except FileNotFoundError:
+            pass
@@ -32,13 +32,24 @@ Uses abstract factory pattern to implement data processing for different data fo
 """
 
 import json
+import mmap
+import os
 import re
+import sys
 
 from abc import ABC, abstractmethod
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from decimal import Decimal
 from enum import Enum
-from typing import Any, Self
+from functools import lru_cache
+from typing import Any, Callable, ClassVar, Iterable, Iterator, Self
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields, is_dataclass
+
+from myproj.file_repo.cache import ProcessedDataCache
+from myproj.file_repo.instrumentation import ProcessStats, measure_stage
 
 # ------------------
 # ENUM
@@ -51,9 +62,11 @@ class DataFormat(Enum):
     Attributes:
         JSON: Represents JSON data format.
         TEXT: Represents plain text data format.
+        MAPPED_TEXT: Represents plain text data format, read through a memory map.
     """
     JSON = 'JSON'
     TEXT = 'TEXT'
+    MAPPED_TEXT = 'MAPPED_TEXT'
 
 class FactoryType(Enum):
     """
@@ -130,6 +143,115 @@ class JsonData:
         """
         return self.data
 
+@dataclass
+class RecordData:
+    """
+    Data class for handling typed records.
+
+    Attributes:
+        records: A list of tuples holding already parsed values (ints, Decimals, dates, enums) in the
+            order of the model constructor arguments.
+
+    Methods:
+        get_content: Returns the records.
+    """
+    records: list[tuple]
+
+    def get_content(self) -> list[tuple]:
+        """
+        Returns the records.
+
+        Returns:
+            A list of tuples holding the parsed values.
+        """
+        return self.records
+
+# -----------------------------------------------------------
+# SCHEMA
+# -----------------------------------------------------------
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """
+    Describes how a single field is validated and parsed.
+
+    Attributes:
+        name: The name of the field.
+        regex: The pattern the textual form of the value must fully match.
+        parse: A callable turning the validated text into the typed value; a ValueError marks the
+            value as invalid.
+    """
+    name: str
+    regex: str
+    parse: Callable[[str], Any]
+
+_LETTERS = r'[A-Za-ząćęłńóśźżÁÉÍÓÚÜÑáéíóúüñĄĆĘŁŃÓŚŹŻ]+'
+
+def _parse_flag(value: str) -> bool:
+    """
+    Parses a '0'/'1' style flag into a bool.
+    """
+    return bool(int(value))
+
+class RecordSchemas(Enum):
+    """
+    Enum for storing the field schemas of typed records for different data types.
+
+    The field patterns accept the same values as the corresponding `RegexPatterns` groups.
+    Low-cardinality strings (service categories, user names, surnames and origins) are parsed with
+    `sys.intern`, so each distinct value is stored once however many rows repeat it. Parsers into
+    model types, such as `Destination` for origins, are injected with `record_schema`.
+
+    Attributes:
+        FROM_SERVICE: Schema for service records (id, name, category, price).
+        FROM_USER: Schema for user records (name, surname, origin, birthdate, id).
+        FROM_SUBSCRIPTION: Schema for subscription records (user_id, service_id, quantity_per_month,
+            discount, id, active).
+    """
+    FROM_SERVICE = (
+        FieldSpec('id_', r'\d+', int),
+        FieldSpec('name', r'[A-Za-z\s]+', str),
+        FieldSpec('category', r'[A-Za-z\s]+', sys.intern),
+        FieldSpec('price', r'\d+\.\d+', Decimal),
+    )
+    FROM_USER = (
+        FieldSpec('name', _LETTERS, sys.intern),
+        FieldSpec('surname', _LETTERS, sys.intern),
+        FieldSpec('origin', r'[A-Z ]+', sys.intern),
+        FieldSpec('birthdate', r'\d{4}-\d{2}-\d{2}', date.fromisoformat),
+        FieldSpec('id_', r'\d+', int),
+    )
+    FROM_SUBSCRIPTION = (
+        FieldSpec('user_id', r'\d+', int),
+        FieldSpec('service_id', r'\d+', int),
+        FieldSpec('quantity_per_month', r'\d+', int),
+        FieldSpec('discount', r'\d+', Decimal),
+        FieldSpec('id_', r'\d+', int),
+        FieldSpec('active', r'\d', _parse_flag),
+    )
+
+def record_schema(factory_type: FactoryType,
+                  parsers: dict[str, Callable[[str], Any]] | None = None) -> tuple[FieldSpec, ...]:
+    """
+    Returns the record schema of a factory type, with some field parsers replaced.
+
+    Args:
+        factory_type: The FactoryType selecting the schema.
+        parsers: Parsers by field name, e.g. `{'origin': Destination}`, replacing the default ones.
+
+    Returns:
+        The field specifications, in record order.
+
+    Raises:
+        KeyError: If a parser is given for a field the schema does not have.
+    """
+    schema = RecordSchemas[factory_type.value].value
+    if not parsers:
+        return schema
+    if not parsers.keys() <= {spec.name for spec in schema}:
+        raise KeyError("Field Not Found")
+    return tuple(FieldSpec(spec.name, spec.regex, parsers.get(spec.name, spec.parse)) for spec in schema)
+
 # -----------------------------------------------------------
 # LOADER
 # -----------------------------------------------------------
@@ -154,41 +276,249 @@ class DataLoader(ABC):
         """
         pass            # pragma: no cover
 
+    def load_iter(self, path: str) -> Iterator[str]:
+        """
+        Loads data from a given path as a lazy stream of lines.
+
+        The default implementation falls back to `load`; subclasses override it to avoid
+        materializing the whole file.
+
+        Args:
+            path: The path to the data file.
+
+        Returns:
+            An iterator over strings representing the loaded data.
+        """
+        return iter(self.load(path))
+
+_JSON_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_JSON_SEPARATOR = re.compile(r'[ \t\n\r]*([,\]])')
+
+def _read_more(f, buffer: str, pos: int, chunk_size: int) -> tuple[str, int, bool]:
+    """
+    Drops the consumed part of the buffer and appends the next chunk of the file.
+
+    The chunk grows with the pending data, so a single large record is read in a logarithmic
+    number of steps.
+
+    Returns:
+        The new buffer, the new position (always 0) and whether the end of the file was reached.
+    """
+    chunk = f.read(max(chunk_size, len(buffer) - pos))
+    return buffer[pos:] + chunk, 0, not chunk
+
+def iter_json_records(f, json_lines: bool = False, chunk_size: int = 1 << 16,
+                      parse_float: Callable[[str], Any] | None = None) -> Iterator[Any]:
+    """
+    Incrementally decodes the records of a JSON file.
+
+    A top-level JSON array is parsed element by element from fixed-size chunks, so memory is bounded
+    by a single record plus the read buffer. With `json_lines` every non-blank line is decoded as one
+    record. Any other top-level JSON document is decoded whole and iterated, as `json.load` would be.
+
+    Args:
+        f: An open text file object.
+        json_lines: Whether the file is in JSON Lines format.
+        chunk_size: The number of characters read from the file at a time.
+        parse_float: Called with the text of every JSON float, as by `json.loads`; `float` by default.
+
+    Returns:
+        An iterator over the decoded records.
+
+    Raises:
+        ValueError: If the file is not valid JSON.
+    """
+    if json_lines:
+        for line in f:
+            if line.strip():
+                yield json.loads(line, parse_float=parse_float)
+        return
+
+    decode = json.JSONDecoder(parse_float=parse_float).raw_decode
+    buffer = f.read(chunk_size)
+    pos = _JSON_WHITESPACE.match(buffer).end()
+    if not buffer.startswith('[', pos):
+        yield from json.loads(buffer + f.read(), parse_float=parse_float)
+        return
+
+    buffer, pos, eof = _read_more(f, buffer, pos + 1, chunk_size)
+    while True:
+        pos = _JSON_WHITESPACE.match(buffer, pos).end()
+        if pos < len(buffer) and buffer[pos] == ']':
+            break
+        if pos == len(buffer):
+            if eof:
+                raise ValueError('Unexpected end of JSON array')
+            buffer, pos, eof = _read_more(f, buffer, pos, chunk_size)
+            continue
+        break
+
+    while pos < len(buffer) and buffer[pos] != ']':
+        # Decode the element and the following separator; if either runs into the end of the
+        # buffer (e.g. a number cut in half), read more and decode the element again.
+        try:
+            record, end = decode(buffer, pos)
+            separator = _JSON_SEPARATOR.match(buffer, end)
+        except json.JSONDecodeError:
+            separator = None
+        if separator is None:
+            if eof:
+                raise ValueError('Invalid JSON array element')
+            buffer, pos, eof = _read_more(f, buffer, pos, chunk_size)
+            continue
+        yield record
+        if separator.group(1) == ']':
+            pos = separator.start(1)
+            break
+        pos = _JSON_WHITESPACE.match(buffer, separator.end()).end()
+        while pos == len(buffer) and not eof:
+            buffer, pos, eof = _read_more(f, buffer, pos, chunk_size)
+            pos = _JSON_WHITESPACE.match(buffer, pos).end()
+        if pos < len(buffer) and buffer[pos] == ']':
+            raise ValueError('Trailing comma in JSON array')
+
+    if pos == len(buffer):
+        raise ValueError('Unexpected end of JSON array')
+    if (buffer[pos + 1:] + f.read()).strip():
+        raise ValueError('Extra data after JSON array')
+
+def _check_json_extension(path: str) -> None:
+    """
+    Raises AttributeError unless the path has a '.json' or '.jsonl' extension.
+    """
+    if not (path.endswith('json') or path.endswith('jsonl')):
+        raise AttributeError('File has incorrect extension')
+
+def _open_json_records(path: str) -> Iterator[Any]:
+    """
+    Opens a '.json' or '.jsonl' file and returns an iterator over its records.
+
+    JSON floats are kept as their text, so prices reach the validators exactly as written instead
+    of going through a binary float.
+
+    Raises:
+        AttributeError: If the file does not have a '.json' or '.jsonl' extension.
+        FileNotFoundError: If the file cannot be opened.
+    """
+    _check_json_extension(path)
+    try:
+        f = open(path, 'r', encoding='utf-8')
+    except Exception as e:
+        raise FileNotFoundError(f'File not found: {e}')
+    return _closing_iter(f, iter_json_records(f, json_lines=path.endswith('jsonl'), parse_float=str))
+
+def _closing_iter(f, items: Iterator[Any]) -> Iterator[Any]:
+    """
+    Yields the items and closes `f`, a file or MappedLines, once they are exhausted or the
+    iterator is closed.
+    """
+    with f:
+        yield from items
+
 class JsonDataLoader(DataLoader):
     """
-    Data loader for JSON files.
+    Data loader for JSON and JSON Lines files.
 
     Methods:
         load: Loads data from a JSON file.
+        load_iter: Loads data from a JSON file as a lazy stream of records.
     """
     def load(self, path: str) -> list[str]:
         """
         Loads data from a JSON file.
 
         Args:
-            path: The path to the JSON file.
+            path: The path to the JSON or JSON Lines file.
 
         Returns:
             A list of strings representing the loaded data.
 
         Raises:
-            AttributeError: If the file does not have a '.json' extension.
+            AttributeError: If the file does not have a '.json' or '.jsonl' extension.
+            FileNotFoundError: If the file is not found or cannot be decoded.
+        """
+        _check_json_extension(path)
+        try:
+            return list(self.load_iter(path))
+        except FileNotFoundError:
+            raise
+        except Exception as e:
+            raise FileNotFoundError(f'File not found: {e}')
+
+    def load_iter(self, path: str) -> Iterator[str]:
+        """
+        Loads data from a JSON file and yields one joined record at a time.
+
+        Records are decoded incrementally by `iter_json_records`, so only the current record is
+        held in memory.
+
+        Args:
+            path: The path to the JSON or JSON Lines file.
+
+        Returns:
+            An iterator over strings representing the loaded records.
+
+        Raises:
+            AttributeError: If the file does not have a '.json' or '.jsonl' extension.
             FileNotFoundError: If the file is not found.
+            ValueError: While iterating, if the file is not valid JSON.
         """
-        if not path.endswith('json'):
-            raise AttributeError('File has incorrect extension')
+        return (','.join(map(str, (item.values()))) for item in _open_json_records(path))
+
+class JsonRecordLoader(DataLoader):
+    """
+    Data loader for JSON and JSON Lines files that keeps the decoded records as dictionaries.
+
+    Methods:
+        load: Loads the records of a JSON file.
+        load_iter: Loads the records of a JSON file as a lazy stream.
+    """
+    def load(self, path: str) -> list[dict[str, Any]]:
+        """
+        Loads the records of a JSON file.
+
+        Args:
+            path: The path to the JSON or JSON Lines file.
+
+        Returns:
+            A list of the decoded JSON records.
+
+        Raises:
+            AttributeError: If the file does not have a '.json' or '.jsonl' extension.
+            FileNotFoundError: If the file is not found or cannot be decoded.
+        """
+        _check_json_extension(path)
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                return [','.join(map(str, (item.values()))) for item in json.load(f)]
+            return list(self.load_iter(path))
+        except FileNotFoundError:
+            raise
         except Exception as e:
             raise FileNotFoundError(f'File not found: {e}')
 
+    def load_iter(self, path: str) -> Iterator[dict[str, Any]]:
+        """
+        Loads the records of a JSON file as a lazy stream.
+
+        Args:
+            path: The path to the JSON or JSON Lines file.
+
+        Returns:
+            An iterator over the decoded JSON records.
+
+        Raises:
+            AttributeError: If the file does not have a '.json' or '.jsonl' extension.
+            FileNotFoundError: If the file is not found.
+            ValueError: While iterating, if the file is not valid JSON.
+        """
+        return _open_json_records(path)
+
 class TextDataLoader(DataLoader):
     """
     Data loader for text files.
 
     Methods:
         load: Loads data from a text file.
+        load_iter: Loads data from a text file as a lazy stream of lines.
     """
     def load(self, path: str) -> list[str]:
         """
@@ -204,14 +534,257 @@ class TextDataLoader(DataLoader):
             AttributeError: If the file does not have a '.csv' or '.txt' extension.
             FileNotFoundError: If the file is not found.
         """
+        self._check_extension(path)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return list(self._read_lines(f))
+        except Exception as e:
+            raise FileNotFoundError(f'File not found: {e}')
+
+    def load_iter(self, path: str) -> Iterator[str]:
+        """
+        Loads data from a text file, yielding one line at a time.
+
+        The file stays open until the returned iterator is exhausted or garbage collected,
+        so only the current line is held in memory.
+
+        Args:
+            path: The path to the text file.
+
+        Returns:
+            An iterator over strings representing the loaded lines, without the header line.
+
+        Raises:
+            AttributeError: If the file does not have a '.csv' or '.txt' extension.
+            FileNotFoundError: If the file is not found.
+        """
+        self._check_extension(path)
+        try:
+            f = open(path, 'r', encoding='utf-8')
+        except Exception as e:
+            raise FileNotFoundError(f'File not found: {e}')
+        return self._read_lines(f)
+
+    @staticmethod
+    def _check_extension(path: str) -> None:
+        """
+        Checks that the path points to a '.csv' or '.txt' file.
+
+        Raises:
+            AttributeError: If the file does not have a '.csv' or '.txt' extension.
+        """
         if not (path.endswith('csv') or path.endswith('txt')):
             raise AttributeError('File has incorrect extension')
+
+    @staticmethod
+    def _read_lines(f) -> Iterator[str]:
+        """
+        Yields the lines of an open text file without the header line and trailing newlines.
+
+        Args:
+            f: An open text file object. It is closed once all lines have been read.
+
+        Returns:
+            An iterator over the stripped lines.
+        """
+        with f:
+            next(f, None)
+            for line in f:
+                yield line.rstrip('\n')
+
+def text_chunk_ranges(path: str, chunk_size: int = 1 << 24) -> list[tuple[int, int]]:
+    """
+    Splits a text file into byte ranges of roughly `chunk_size` bytes, aligned on line boundaries.
+
+    The header line is skipped. Every range starts at the beginning of a line and ends just after a
+    newline (or at the end of the file), so the ranges can be read and decoded independently.
+
+    Args:
+        path: The path to the text file.
+        chunk_size: The target size of a range in bytes.
+
+    Returns:
+        A list of (start, end) byte offsets, in file order.
+
+    Raises:
+        ValueError: If `chunk_size` is not positive.
+    """
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be positive")
+    ranges = []
+    with open(path, 'rb') as f:
+        f.readline()
+        start = f.tell()
+        size = f.seek(0, 2)
+        while start < size:
+            f.seek(min(start + chunk_size, size) - 1)
+            f.readline()
+            end = f.tell()
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def read_text_chunk(path: str, start: int, end: int) -> list[str]:
+    """
+    Reads the lines of a byte range produced by `text_chunk_ranges`.
+
+    Args:
+        path: The path to the text file.
+        start: The offset of the first byte of the range.
+        end: The offset just past the last byte of the range.
+
+    Returns:
+        A list of the lines in the range, see `split_text_lines`.
+    """
+    with open(path, 'rb') as f:
+        f.seek(start)
+        return split_text_lines(f.read(end - start))
+
+
+def split_text_lines(data: bytes) -> list[str]:
+    """
+    Decodes UTF-8 bytes holding whole lines and splits them into lines.
+
+    Line endings are handled like the text-mode loader: Windows and old Mac line endings are
+    accepted, and no line ending is kept in the returned lines.
+
+    Args:
+        data: The bytes to split, starting at the beginning of a line.
+
+    Returns:
+        A list of the lines.
+    """
+    text = data.decode('utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    lines = text.split('\n')
+    if lines[-1] == '':
+        lines.pop()
+    return lines
+
+
+class MappedLines:
+    """
+    The data lines of a memory-mapped text file.
+
+    Line boundaries are found once by scanning the raw bytes for newlines; iterating yields each
+    line as a `memoryview` slice of the map, so no line is copied or decoded until a validator
+    keeps it. The map is read-only and backed by the page cache, so processes mapping the same
+    file share its pages.
+
+    Attributes:
+        buffer: The memory map, or empty bytes for an empty file.
+        spans: Flat array of (start, end) byte offsets per line, without the header line and
+            without line endings.
+
+    Methods:
+        open: Maps a file and scans its line boundaries.
+        close: Releases the memory map.
+    """
+    def __init__(self, buffer: mmap.mmap | bytes, spans: array):
+        self.buffer = buffer
+        self.spans = spans
+
+    @classmethod
+    def open(cls, path: str) -> Self:
+        """
+        Maps a file and scans its line boundaries.
+
+        Args:
+            path: The path to the text file.
+
+        Returns:
+            A MappedLines instance over the lines of the file after the header line.
+        """
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                buffer = b''
+            else:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(buffer, cls._scan(buffer))
+
+    @staticmethod
+    def _scan(buffer: mmap.mmap | bytes) -> array:
+        """
+        Returns the (start, end) offsets of every line after the header, excluding line endings.
+        """
+        spans = array('q')
+        size = len(buffer)
+        find = buffer.find
+        pos = find(b'\n') + 1
+        while 0 < pos < size:
+            end = find(b'\n', pos)
+            if end < 0:
+                end = size
+            next_pos = end + 1
+            if end > pos and buffer[end - 1] == 13:
+                end -= 1
+            spans.append(pos)
+            spans.append(end)
+            pos = next_pos
+        return spans
+
+    def __len__(self) -> int:
+        return len(self.spans) // 2
+
+    def __iter__(self) -> Iterator[memoryview]:
+        with memoryview(self.buffer) as view:
+            spans = self.spans
+            for i in range(0, len(spans), 2):
+                yield view[spans[i]:spans[i + 1]]
+
+    def close(self) -> None:
+        """
+        Releases the memory map. Lines obtained by iterating must no longer be in use.
+        """
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+class MappedTextDataLoader(DataLoader):
+    """
+    Data loader for text files that memory-maps the file instead of decoding it.
+
+    Methods:
+        load: Maps a text file and returns its lines as raw bytes.
+        load_iter: Maps a text file and returns its lines as raw bytes.
+    """
+    def load(self, path: str) -> MappedLines:
+        """
+        Maps a text file and returns its lines as raw bytes.
+
+        Args:
+            path: The path to the text file.
+
+        Returns:
+            A MappedLines instance whose lines are undecoded `memoryview` slices, to be checked by a
+            bytes validator such as BytesRegexValidator.
+
+        Raises:
+            AttributeError: If the file does not have a '.csv' or '.txt' extension.
+            FileNotFoundError: If the file is not found.
+        """
+        TextDataLoader._check_extension(path)
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                return [re.sub(r'\n', '', line) for line in f.readlines()][1:]
+            return MappedLines.open(path)
         except Exception as e:
             raise FileNotFoundError(f'File not found: {e}')
 
+    def load_iter(self, path: str) -> MappedLines:
+        """
+        Maps a text file and returns its lines as raw bytes, see `load`.
+
+        The lines are already produced lazily; the MappedLines instance is returned instead of an
+        iterator over it so that the caller can close the map.
+        """
+        return self.load(path)
+
 # -----------------------------------------------------------
 # VALIDATOR
 # -----------------------------------------------------------
@@ -220,9 +793,17 @@ class Validator(ABC):
     """
     Abstract base class for data validators.
 
+    Attributes:
+        splits_fields: Whether the validator splits rows into fields while validating them; when set,
+            `DataProcessor` takes the rows from `validate_fields_iter` and skips the converter's split.
+
     Methods:
         validate: Abstract method to validate data.
+        validate_iter: Lazily validates a stream of data.
+        validate_fields_iter: Lazily validates a stream of data and splits it into fields.
     """
+    splits_fields: ClassVar[bool] = False
+
     @abstractmethod
     def validate(self, data: list[str]) -> list[str]:
         """
@@ -236,6 +817,33 @@ class Validator(ABC):
         """
         pass            # pragma: no cover
 
+    def validate_iter(self, data: Iterable[str]) -> Iterator[str]:
+        """
+        Validates a stream of data lazily.
+
+        The default implementation falls back to `validate`; subclasses override it to
+        check one item at a time.
+
+        Args:
+            data: An iterable of strings representing the data to be validated.
+
+        Returns:
+            An iterator over the validated strings.
+        """
+        return iter(self.validate(list(data)))
+
+    def validate_fields_iter(self, data: Iterable[str]) -> Iterator[list[str]]:
+        """
+        Lazily validates a stream of data and splits every valid item into its fields.
+
+        Args:
+            data: An iterable of strings representing the data to be validated.
+
+        Returns:
+            An iterator over lists of strings, one per valid item.
+        """
+        return (d.split(',') for d in self.validate_iter(data))
+
 @dataclass
 class RegexValidator(Validator):
     """
@@ -243,23 +851,328 @@ class RegexValidator(Validator):
 
     Attributes:
         regex: The regular expression pattern used for validation.
+        pattern: The compiled form of `regex`, built once when the validator is created.
 
     Methods:
         validate: Validates data using the provided regular expression.
+        validate_iter: Lazily validates a stream of data using the provided regular expression.
+    """
+    regex: str = None
+    pattern: re.Pattern | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.regex is not None:
+            self.pattern = re.compile(self.regex)
+
+    def validate(self, data: list[str]) -> list[str]:
+        """
+        Validates data using the provided regular expression.
+
+        Args:
+            data: A list of strings representing the data to be validated.
+
+        Returns:
+            A list of strings that match the regular expression.
+        """
+        return list(self.validate_iter(data))
+
+    def validate_iter(self, data: Iterable[str]) -> Iterator[str]:
+        """
+        Lazily validates a stream of data using the provided regular expression.
+
+        Args:
+            data: An iterable of strings representing the data to be validated.
+
+        Returns:
+            An iterator over the strings that match the regular expression.
+        """
+        match = self.pattern.match
+        return (d for d in data if match(d) is not None)
+
+def to_bytes_regex(regex: str) -> bytes:
+    """
+    Translates a str regular expression into an equivalent bytes pattern over UTF-8 input.
+
+    ASCII parts are kept as they are. Non-ASCII literals become their UTF-8 byte sequences and
+    character classes containing non-ASCII characters become alternations of an ASCII class and
+    byte sequences grouped by lead bytes, so `[a-zñó]` matches the same text before and after
+    translation. Shorthand classes such as digits and whitespace take their ASCII meaning.
+
+    Args:
+        regex: The regular expression to translate.
+
+    Returns:
+        The translated pattern.
+
+    Raises:
+        ValueError: If the pattern has a negated class or a range with non-ASCII characters.
+    """
+    out = []
+    i, n = 0, len(regex)
+    while i < n:
+        char = regex[i]
+        if char == '\\':
+            out.append(regex[i:i + 2])
+            i += 2
+        elif char == '[':
+            end = i + 1
+            if end < n and regex[end] == '^':
+                end += 1
+            if end < n and regex[end] == ']':
+                end += 1
+            while regex[end] != ']':
+                end += 2 if regex[end] == '\\' else 1
+            body = regex[i + 1:end]
+            out.append(_class_to_bytes_regex(body) if not body.isascii() else f'[{body}]')
+            i = end + 1
+        elif not char.isascii():
+            out.append('(?:' + ''.join(f'\\x{b:02x}' for b in char.encode('utf-8')) + ')')
+            i += 1
+        else:
+            out.append(char)
+            i += 1
+    return ''.join(out).encode('ascii')
+
+def _class_to_bytes_regex(body: str) -> str:
+    """
+    Rewrites the body of a character class with non-ASCII members as a bytes alternation.
+
+    Multi-byte members sharing their leading bytes are merged, e.g. the members encoded as C3 B1 and
+    C3 B3 become C3 followed by the class [B1B3].
     """
+    if body.startswith('^'):
+        raise ValueError('Negated character classes with non-ASCII characters are not supported')
+    ascii_part = []
+    by_prefix: dict[bytes, dict[int, None]] = {}
+    i = 0
+    while i < len(body):
+        if body[i] == '\\':
+            ascii_part.append(body[i:i + 2])
+            i += 2
+        elif i + 2 < len(body) and body[i + 1] == '-':
+            if not body[i:i + 3].isascii():
+                raise ValueError('Ranges with non-ASCII characters are not supported')
+            ascii_part.append(body[i:i + 3])
+            i += 3
+        elif body[i].isascii():
+            ascii_part.append(body[i])
+            i += 1
+        else:
+            encoded = body[i].encode('utf-8')
+            by_prefix.setdefault(encoded[:-1], {})[encoded[-1]] = None
+            i += 1
+    alternatives = ['[' + ''.join(ascii_part) + ']'] if ascii_part else []
+    for prefix, last_bytes in by_prefix.items():
+        alternatives.append(''.join(f'\\x{b:02x}' for b in prefix)
+                            + '[' + ''.join(f'\\x{b:02x}' for b in last_bytes) + ']')
+    return '(?:' + '|'.join(alternatives) + ')'
+
+@dataclass
+class BytesRegexValidator(Validator):
+    """
+    Validator matching undecoded lines against a bytes regular expression.
+
+    Lines are given as bytes-like objects, such as the `memoryview` slices of MappedLines; only the
+    lines that match are decoded from UTF-8.
+
+    Attributes:
+        regex: The str regular expression used for validation; it is translated with `to_bytes_regex`.
+        pattern: The compiled bytes pattern.
+
+    Methods:
+        validate: Validates lines and returns the decoded matches.
+        validate_iter: Lazily validates lines and yields the decoded matches.
+    """
+    splits_fields: ClassVar[bool] = True
+
     regex: str = None
+    pattern: re.Pattern | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.regex is not None:
+            self.pattern = re.compile(to_bytes_regex(self.regex))
+
+    def validate(self, data: Iterable[bytes]) -> list[str]:
+        """
+        Validates lines using the bytes regular expression.
+
+        Args:
+            data: An iterable of bytes-like lines.
+
+        Returns:
+            A list of the decoded lines that match the regular expression.
+        """
+        return list(self.validate_iter(data))
+
+    def validate_iter(self, data: Iterable[bytes]) -> Iterator[str]:
+        """
+        Lazily validates lines using the bytes regular expression.
+
+        Args:
+            data: An iterable of bytes-like lines.
+
+        Returns:
+            An iterator over the decoded lines that match the regular expression.
+        """
+        match = self.pattern.match
+        return (str(d, 'utf-8') for d in data if match(d) is not None)
+
+@dataclass
+class SubscriptionValidator(Validator):
+    """
+    Regex-free validator for subscription rows.
+
+    Accepts exactly the rows matched by `RegexPatterns.FROM_SUBSCRIPTION`: six comma-separated
+    decimal numbers, the last one a single digit. Rows are split and checked in one step, so
+    `validate_fields_iter` hands the fields on without a second split in the converter.
+
+    Methods:
+        validate: Validates subscription rows.
+        validate_iter: Lazily validates a stream of subscription rows.
+        validate_fields_iter: Lazily validates a stream of subscription rows and yields their fields.
+    """
+    splits_fields: ClassVar[bool] = True
+
+    @staticmethod
+    def _split(row: str) -> list[str] | None:
+        """
+        Splits and checks a single subscription row.
+
+        Args:
+            row: The row to be validated.
+
+        Returns:
+            The fields of the row, or None if the row is invalid.
+        """
+        fields = row.split(',')
+        if len(fields) == 6 and len(fields[5]) == 1 and '' not in fields and row.replace(',', '').isdecimal():
+            return fields
+        return None
 
     def validate(self, data: list[str]) -> list[str]:
         """
-        Validates data using the provided regular expression.
+        Validates subscription rows.
+
+        Args:
+            data: A list of strings representing the data to be validated.
+
+        Returns:
+            A list of the valid rows.
+        """
+        return list(self.validate_iter(data))
+
+    def validate_iter(self, data: Iterable[str]) -> Iterator[str]:
+        """
+        Lazily validates a stream of subscription rows.
+
+        Args:
+            data: An iterable of strings representing the data to be validated.
+
+        Returns:
+            An iterator over the valid rows.
+        """
+        split = self._split
+        return (d for d in data if split(d) is not None)
+
+    def validate_fields_iter(self, data: Iterable[str]) -> Iterator[list[str]]:
+        """
+        Lazily validates a stream of subscription rows and yields their fields.
+
+        Args:
+            data: An iterable of strings representing the data to be validated.
+
+        Returns:
+            An iterator over lists of strings, one per valid row.
+        """
+        return (fields for fields in map(self._split, data) if fields is not None)
+
+@dataclass
+class SchemaValidator(Validator):
+    """
+    Validator that checks decoded JSON records field by field and parses them into typed tuples.
+
+    Values are matched positionally against the schema, so a value containing a comma is simply
+    rejected by its field pattern instead of shifting the remaining fields.
+
+    Attributes:
+        schema: The field specifications, in record order.
+
+    Methods:
+        validate: Validates records and returns them as typed tuples.
+        validate_iter: Lazily validates records, yielding typed tuples.
+    """
+    schema: tuple[FieldSpec, ...]
+    _checks: list[tuple[Callable, Callable]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._checks = [(re.compile(spec.regex).fullmatch, spec.parse) for spec in self.schema]
+
+    def _parse(self, item: Any) -> tuple | None:
+        """
+        Validates and parses a single record.
+
+        Args:
+            item: A decoded JSON record.
+
+        Returns:
+            The typed tuple, or None if the record is invalid.
+        """
+        if not isinstance(item, dict) or len(item) != len(self._checks):
+            return None
+        values = []
+        for value, (fullmatch, parse) in zip(item.values(), self._checks):
+            if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+                return None
+            text = value if isinstance(value, str) else str(value)
+            if fullmatch(text) is None:
+                return None
+            try:
+                values.append(parse(text))
+            except ValueError:
+                return None
+        return tuple(values)
+
+    def validate(self, data: list[dict[str, Any]]) -> list[tuple]:
+        """
+        Validates records and returns them as typed tuples.
+
+        Args:
+            data: A list of decoded JSON records.
+
+        Returns:
+            A list of typed tuples for the valid records.
+        """
+        return list(self.validate_iter(data))
+
+    def validate_iter(self, data: Iterable[dict[str, Any]]) -> Iterator[tuple]:
+        """
+        Lazily validates records, yielding typed tuples.
 
         Args:
-            data: A list of strings representing the data to be validated.
+            data: An iterable of decoded JSON records.
 
         Returns:
-            A list of strings that match the regular expression.
+            An iterator over typed tuples for the valid records.
         """
-        return [d for d in data if re.match(self.regex, d) is not None]
+        parse = self._parse
+        return (record for record in map(parse, data) if record is not None)
+
+def create_validator_for(regex: str) -> Validator:
+    """
+    Creates the fastest validator accepting exactly the rows matched by the given regex.
+
+    The `RegexPatterns.FROM_SUBSCRIPTION` shape is handled by `SubscriptionValidator`; any other
+    pattern gets a `RegexValidator` compiled once here.
+
+    Args:
+        regex: The regular expression pattern used for validation.
+
+    Returns:
+        An instance of Validator.
+    """
+    if regex == RegexPatterns.FROM_SUBSCRIPTION.value:
+        return SubscriptionValidator()
+    return RegexValidator(regex)
 
 # -----------------------------------------------------------
 # CONVERTER
@@ -271,6 +1184,9 @@ class Converter(ABC):
 
     Methods:
         convert: Abstract method to convert data.
+        convert_iter: Lazily splits a stream of data into rows of fields.
+        convert_fields: Converts rows that are already split into fields.
+        convert_fields_iter: Lazily converts rows that are already split into fields.
     """
     @abstractmethod
     def convert(self, data: list[str]) -> Any:
@@ -285,12 +1201,57 @@ class Converter(ABC):
         """
         pass    # pragma: no cover
 
+    def convert_iter(self, data: Iterable[str]) -> Iterator[list[str]]:
+        """
+        Lazily splits a stream of data into rows of fields.
+
+        Both `TextData` and `JsonData` are built from the same rows, so streaming yields the
+        rows themselves; `enumerate` over the result recovers the `JsonData` keys.
+
+        Args:
+            data: An iterable of strings representing the data to be converted.
+
+        Returns:
+            An iterator over lists of strings, one per input item.
+        """
+        return (item.split(',') for item in data)
+
+    def convert_fields(self, rows: Iterable[list[str]]) -> Any:
+        """
+        Converts rows that are already split into fields.
+
+        The default implementation joins the rows back and falls back to `convert`; subclasses
+        override it to wrap the rows directly.
+
+        Args:
+            rows: An iterable of lists of strings.
+
+        Returns:
+            The converted data in the specified format.
+        """
+        return self.convert([','.join(row) for row in rows])
+
+    def convert_fields_iter(self, rows: Iterable[list[str]]) -> Iterator[Any]:
+        """
+        Lazily converts rows that are already split into fields, the streaming form of `convert_fields`.
+
+        The default implementation passes the rows through, as `convert_iter` yields rows of fields.
+
+        Args:
+            rows: An iterable of lists of strings.
+
+        Returns:
+            An iterator over the converted rows.
+        """
+        return iter(rows)
+
 class ToTextDataConverter(Converter):
     """
     Converter class to convert data to TextData format.
 
     Methods:
         convert: Converts data to TextData format.
+        convert_fields: Wraps rows that are already split into TextData format.
     """
     def convert(self, data: list[str]) -> TextData:
         """
@@ -305,12 +1266,25 @@ class ToTextDataConverter(Converter):
         transformed_data = [item.split(',') for item in data]
         return TextData(transformed_data)
 
+    def convert_fields(self, rows: Iterable[list[str]]) -> TextData:
+        """
+        Wraps rows that are already split into TextData format.
+
+        Args:
+            rows: An iterable of lists of strings.
+
+        Returns:
+            An instance of TextData containing the rows.
+        """
+        return TextData(list(rows))
+
 class ToJsonDataConverter(Converter):
     """
     Converter class to convert data to JsonData format.
 
     Methods:
         convert: Converts data to JsonData format.
+        convert_fields: Wraps rows that are already split into JsonData format.
     """
     def convert(self, data: list[str]) -> JsonData:
         """
@@ -325,6 +1299,141 @@ class ToJsonDataConverter(Converter):
         transformed_data = [item.split(',') for item in data]
         return JsonData(dict([(i, v) for i, v in enumerate(transformed_data)]))
 
+    def convert_fields(self, rows: Iterable[list[str]]) -> JsonData:
+        """
+        Wraps rows that are already split into JsonData format.
+
+        Args:
+            rows: An iterable of lists of strings.
+
+        Returns:
+            An instance of JsonData containing the rows keyed by their position.
+        """
+        return JsonData(dict(enumerate(rows)))
+
+class ToRecordDataConverter(Converter):
+    """
+    Converter class to collect typed records into RecordData format.
+
+    Methods:
+        convert: Wraps typed records into RecordData format.
+        convert_iter: Passes typed records through unchanged.
+    """
+    def convert(self, data: list[tuple]) -> RecordData:
+        """
+        Wraps typed records into RecordData format.
+
+        Args:
+            data: A list of typed tuples.
+
+        Returns:
+            An instance of RecordData containing the records.
+        """
+        return RecordData(list(data))
+
+    def convert_iter(self, data: Iterable[tuple]) -> Iterator[tuple]:
+        """
+        Passes typed records through unchanged.
+
+        Args:
+            data: An iterable of typed tuples.
+
+        Returns:
+            An iterator over the same tuples.
+        """
+        return iter(data)
+
+def _memoize(parse: Callable[[str], Any]) -> Callable[[str], Any]:
+    """
+    Wraps a field parser in a bounded cache, so repeated values are parsed once.
+
+    `str`, `int` and `sys.intern` are cheaper to call than to look up and are returned unchanged.
+    The other parsers build immutable values (Decimals, dates, enum members), which are safe to share.
+    """
+    if parse in (str, int, sys.intern):
+        return parse
+    return lru_cache(maxsize=1 << 16)(parse)
+
+@dataclass
+class ToTypedRecordDataConverter(Converter):
+    """
+    Converter class to parse rows of strings into typed records, in RecordData format.
+
+    Every field is parsed once by the `parse` callable of its schema field; parsers of repeated
+    values such as prices, birthdates and injected enum parsers are memoized. Rows with a value the
+    parser rejects, e.g. the date '2023-02-30', are dropped as done by `SchemaValidator`.
+
+    Attributes:
+        schema: The field specifications, in record order.
+
+    Methods:
+        convert: Splits and parses rows into RecordData format.
+        convert_iter: Lazily splits and parses rows into typed tuples.
+        convert_fields: Parses rows that are already split into RecordData format.
+        convert_fields_iter: Lazily parses rows that are already split into typed tuples.
+    """
+    schema: tuple[FieldSpec, ...]
+    _parsers: tuple[Callable[[str], Any], ...] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._parsers = tuple(_memoize(spec.parse) for spec in self.schema)
+
+    def convert(self, data: list[str]) -> RecordData:
+        """
+        Splits and parses rows into RecordData format.
+
+        Args:
+            data: A list of strings representing the data to be converted.
+
+        Returns:
+            An instance of RecordData containing the typed records.
+        """
+        return RecordData(list(self.convert_iter(data)))
+
+    def convert_iter(self, data: Iterable[str]) -> Iterator[tuple]:
+        """
+        Lazily splits and parses rows into typed tuples.
+
+        Args:
+            data: An iterable of strings representing the data to be converted.
+
+        Returns:
+            An iterator over typed tuples, one per valid row.
+        """
+        return self.convert_fields_iter(item.split(',') for item in data)
+
+    def convert_fields(self, rows: Iterable[list[str]]) -> RecordData:
+        """
+        Parses rows that are already split into RecordData format.
+
+        Args:
+            rows: An iterable of lists of strings.
+
+        Returns:
+            An instance of RecordData containing the typed records.
+        """
+        return RecordData(list(self.convert_fields_iter(rows)))
+
+    def convert_fields_iter(self, rows: Iterable[list[str]]) -> Iterator[tuple]:
+        """
+        Lazily parses rows that are already split into typed tuples.
+
+        Args:
+            rows: An iterable of lists of strings.
+
+        Returns:
+            An iterator over typed tuples, one per valid row.
+        """
+        parsers = self._parsers
+        width = len(parsers)
+        for row in rows:
+            if len(row) != width:
+                continue
+            try:
+                yield tuple([parse(value) for parse, value in zip(parsers, row)])
+            except ValueError:
+                continue
+
 # -----------------------------------------------------------
 # FACTORY
 # -----------------------------------------------------------
@@ -389,12 +1498,12 @@ class FromJsonFileToJsonDataWithExpectedRegexDataFactory(DataFactory):
 
     def create_validator(self) -> Validator:
         """
-        Creates a regex validator.
+        Creates a validator for the specified regex.
 
         Returns:
-            An instance of RegexValidator with the specified regex.
+            An instance of Validator accepting the rows matched by the regex, see `create_validator_for`.
         """
-        return RegexValidator(self.regex)
+        return create_validator_for(self.regex)
 
     def create_converter(self) -> Converter:
         """
@@ -426,12 +1535,49 @@ class FromTextFileToTextDataWithExpectedRegexDataFactory(DataFactory):
 
     def create_validator(self) -> Validator:
         """
-        Creates a regex validator.
+        Creates a validator for the specified regex.
+
+        Returns:
+            An instance of Validator accepting the rows matched by the regex, see `create_validator_for`.
+        """
+        return create_validator_for(self.regex)
+
+    def create_converter(self) -> Converter:
+        """
+        Creates a text data converter.
+
+        Returns:
+            An instance of ToTextDataConverter.
+        """
+        return ToTextDataConverter()
+
+@dataclass
+class FromMappedTextFileToTextDataWithExpectedRegexDataFactory(DataFactory):
+    """
+    Factory class to handle memory-mapped text data files and validate them using bytes regex.
+
+    Attributes:
+        regex: The regular expression pattern used for validation.
+    """
+    regex: str
+
+    def create_data_loader(self) -> DataLoader:
+        """
+        Creates a memory-mapped text data loader.
+
+        Returns:
+            An instance of MappedTextDataLoader.
+        """
+        return MappedTextDataLoader()
+
+    def create_validator(self) -> Validator:
+        """
+        Creates a bytes regex validator.
 
         Returns:
-            An instance of RegexValidator with the specified regex.
+            An instance of BytesRegexValidator with the specified regex.
         """
-        return RegexValidator(self.regex)
+        return BytesRegexValidator(self.regex)
 
     def create_converter(self) -> Converter:
         """
@@ -442,6 +1588,127 @@ class FromTextFileToTextDataWithExpectedRegexDataFactory(DataFactory):
         """
         return ToTextDataConverter()
 
+@dataclass
+class FromJsonFileToRecordDataFactory(DataFactory):
+    """
+    Factory class to parse JSON data files directly into typed records.
+
+    Attributes:
+        factory_type: The FactoryType selecting the record schema.
+        parsers: Field parsers replacing those of the schema, see `record_schema`.
+    """
+    factory_type: FactoryType
+    parsers: dict[str, Callable[[str], Any]] | None = None
+
+    def create_data_loader(self) -> DataLoader:
+        """
+        Creates a JSON record loader.
+
+        Returns:
+            An instance of JsonRecordLoader.
+        """
+        return JsonRecordLoader()
+
+    def create_validator(self) -> Validator:
+        """
+        Creates a schema validator.
+
+        Returns:
+            An instance of SchemaValidator with the schema of the factory type.
+        """
+        return SchemaValidator(record_schema(self.factory_type, self.parsers))
+
+    def create_converter(self) -> Converter:
+        """
+        Creates a record data converter.
+
+        Returns:
+            An instance of ToRecordDataConverter.
+        """
+        return ToRecordDataConverter()
+
+@dataclass
+class FromTextFileToRecordDataFactory(DataFactory):
+    """
+    Factory class to parse text data files into typed records.
+
+    Rows are validated with the regex of the factory type, as done for `TextData`, and then parsed
+    field by field according to the record schema.
+
+    Attributes:
+        factory_type: The FactoryType selecting the regex and the record schema.
+        parsers: Field parsers replacing those of the schema, see `record_schema`.
+    """
+    factory_type: FactoryType
+    parsers: dict[str, Callable[[str], Any]] | None = None
+
+    def create_data_loader(self) -> DataLoader:
+        """
+        Creates a text data loader.
+
+        Returns:
+            An instance of TextDataLoader.
+        """
+        return TextDataLoader()
+
+    def create_validator(self) -> Validator:
+        """
+        Creates a validator for the regex of the factory type.
+
+        Returns:
+            An instance of Validator, see `create_validator_for`.
+        """
+        return create_validator_for(RegexPatterns[self.factory_type.value].value)
+
+    def create_converter(self) -> Converter:
+        """
+        Creates a typed record data converter.
+
+        Returns:
+            An instance of ToTypedRecordDataConverter with the schema of the factory type.
+        """
+        return ToTypedRecordDataConverter(record_schema(self.factory_type, self.parsers))
+
+def _stable_repr(value: Any) -> str:
+    """
+    Renders a factory and its attributes for the cache namespace.
+
+    Classes and functions, such as injected field parsers, are named by their qualified name, since
+    their repr contains a memory address that changes with every run.
+    """
+    if is_dataclass(value) and not isinstance(value, type):
+        attributes = ', '.join(f'{f.name}={_stable_repr(getattr(value, f.name))}' for f in fields(value))
+        return f'{type(value).__qualname__}({attributes})'
+    if isinstance(value, dict):
+        return '{' + ', '.join(f'{_stable_repr(k)}: {_stable_repr(v)}' for k, v in value.items()) + '}'
+    if isinstance(value, (list, tuple)):
+        return '[' + ', '.join(map(_stable_repr, value)) + ']'
+    if callable(value) and hasattr(value, '__qualname__'):
+        return f'{value.__module__}.{value.__qualname__}'
+    return repr(value)
+
+def _close_loaded(loaded_data: Any) -> None:
+    """
+    Releases the memory map of loaded MappedLines once the validator has decoded the rows it keeps.
+
+    Only called after a successful validation: on errors the rows may still be referenced by the
+    traceback, and the map is left to the garbage collector.
+    """
+    if isinstance(loaded_data, MappedLines):
+        loaded_data.close()
+
+def _validate_text_chunk(path: str, start: int, end: int, validator: Validator) -> list[list[str]]:
+    """
+    Reads and validates one byte range of a text file.
+
+    Defined at module level so that `ProcessPoolExecutor` workers can unpickle it.
+
+    Returns:
+        The valid rows of the range, split into fields.
+    """
+    return list(validator.validate_fields_iter(read_text_chunk(path, start, end)))
+
+
 class DataProcessor:
     """
     Class to process data using a specified factory.
@@ -450,26 +1717,59 @@ class DataProcessor:
         data_loader: An instance of DataLoader.
         validator: An instance of Validator.
         converter: An instance of Converter.
+        cache: An optional ProcessedDataCache holding the results of `process`.
+        observers: Callables receiving the ProcessStats of every `process` run.
+        last_stats: The ProcessStats of the latest observed `process` run, or None.
 
     Methods:
+        add_observer: Registers a callable receiving the stats of every `process` run.
         process: Processes data from the given path.
+        process_iter: Processes data from the given path as a lazy stream of rows.
+        process_parallel: Processes a text file in chunks across worker processes.
         create_processor: Creates a data processor based on the data type and factory type.
+        create_record_processor: Creates a data processor producing typed records.
     """
-    def __init__(self, data_factory: DataFactory):
+    def __init__(self, data_factory: DataFactory, cache: ProcessedDataCache | None = None,
+                 observers: Iterable[Callable[[ProcessStats], None]] = (), track_memory: bool = False):
         """
         Initializes the DataProcessor with a specified factory.
 
         Args:
             data_factory: An instance of DataFactory to create data loader, validator, and converter.
+            cache: An optional ProcessedDataCache; results are cached under a description of the
+                factory naming its class, its regex or factory type and the qualified names of
+                injected parsers, so that the key is the same in every process.
+            observers: Callables receiving the ProcessStats of every `process` run that is not
+                served from the cache; without observers, no stats are collected.
+            track_memory: Whether the stats include the peak memory of each stage, measured with
+                `tracemalloc` at a significant cost.
         """
         self.data_loader = data_factory.create_data_loader()
         self.validator = data_factory.create_validator()
         self.converter = data_factory.create_converter()
+        self.cache = cache
+        self._cache_namespace = _stable_repr(data_factory)
+        self.observers = list(observers)
+        self.track_memory = track_memory
+        self.last_stats: ProcessStats | None = None
+
+    def add_observer(self, observer: Callable[[ProcessStats], None]) -> None:
+        """
+        Registers a callable receiving the ProcessStats of every further `process` run.
+
+        Args:
+            observer: The callable, e.g. `list.append` or a `PrometheusTextfileWriter`.
+        """
+        self.observers.append(observer)
 
     def process(self, path: str = None) -> Any:
         """
         Processes data from the given path.
 
+        When the validator splits rows into fields itself, its rows are handed straight to the
+        converter's `convert_fields` instead of being split a second time. With a cache, the result
+        for an unchanged file is read from the cache instead.
+
         Args:
             path: The path to the data file.
 
@@ -479,32 +1779,189 @@ class DataProcessor:
         Raises:
             Any exceptions raised by the data loader, validator, or converter.
         """
+        if self.cache is None or path is None:
+            return self._process(path)
+        try:
+            key = self.cache.key_for(path, self._cache_namespace)
+        except OSError:
+            return self._process(path)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        processed = self._process(path)
+        self.cache.put(key, processed)
+        return processed
+
+    def _process(self, path: str) -> Any:
+        """
+        Loads, validates and converts the data of the given path, see `process`.
+        """
+        if self.observers:
+            return self._process_observed(path)
         loaded_data = self.data_loader.load(path)
+        if self.validator.splits_fields:
+            converted_data = self.converter.convert_fields(self.validator.validate_fields_iter(loaded_data))
+            _close_loaded(loaded_data)
+            return converted_data
         validated_data = self.validator.validate(loaded_data)
+        _close_loaded(loaded_data)
         return self.converter.convert(validated_data)
 
+    def _process_observed(self, path: str) -> Any:
+        """
+        Runs `_process` stage by stage, measuring each, and passes the stats to the observers.
+
+        The validated rows are collected in a list so that validation and conversion are timed
+        separately.
+        """
+        stats = ProcessStats(path)
+        try:
+            stats.bytes_read = os.path.getsize(path)
+        except (OSError, TypeError):
+            pass
+
+        with measure_stage(stats, 'load', 0, self.track_memory) as stage:
+            loaded_data = self.data_loader.load(path)
+            stage.rows_out = len(loaded_data)
+        with measure_stage(stats, 'validate', stage.rows_out, self.track_memory) as stage:
+            if self.validator.splits_fields:
+                validated_data = list(self.validator.validate_fields_iter(loaded_data))
+            else:
+                validated_data = self.validator.validate(loaded_data)
+            stage.rows_out = len(validated_data)
+        _close_loaded(loaded_data)
+        with measure_stage(stats, 'convert', stage.rows_out, self.track_memory) as stage:
+            if self.validator.splits_fields:
+                converted_data = self.converter.convert_fields(validated_data)
+            else:
+                converted_data = self.converter.convert(validated_data)
+            stage.rows_out = len(converted_data.get_content())
+
+        self.last_stats = stats
+        for observer in self.observers:
+            observer(stats)
+        return converted_data
+
+    def process_iter(self, path: str) -> Iterator[list[str]]:
+        """
+        Processes data from the given path as a lazy stream of rows.
+
+        Loader, validator and converter are chained as generator stages, so rows flow
+        through one at a time and memory use does not grow with the size of the file.
+
+        Args:
+            path: The path to the data file.
+
+        Returns:
+            An iterator over the processed rows, each a list of strings, or a typed tuple for
+            processors created by `create_record_processor`.
+
+        Raises:
+            Any exceptions raised by the data loader, validator, or converter.
+        """
+        loaded_data = self.data_loader.load_iter(path)
+        if self.validator.splits_fields:
+            rows = self.converter.convert_fields_iter(self.validator.validate_fields_iter(loaded_data))
+        else:
+            rows = self.converter.convert_iter(self.validator.validate_iter(loaded_data))
+        if isinstance(loaded_data, MappedLines):
+            return _closing_iter(loaded_data, rows)
+        return rows
+
+    def process_parallel(self, path: str, workers: int | None = None, chunk_size: int = 1 << 24) -> Any:
+        """
+        Processes a text file by validating newline-aligned byte ranges in worker processes.
+
+        The file is split with `text_chunk_ranges`, each range is validated in a
+        `ProcessPoolExecutor` worker and the valid rows are merged in file order before being
+        handed to the converter, so the result equals that of `process`. Loaders other than
+        `TextDataLoader` and files that fit in a single chunk are processed in this process.
+
+        Args:
+            path: The path to the data file.
+            workers: The number of worker processes; defaults to the number of CPUs.
+            chunk_size: The target size of a chunk in bytes.
+
+        Returns:
+            The processed data in the specified format.
+
+        Raises:
+            AttributeError: If the file does not have a '.csv' or '.txt' extension.
+            FileNotFoundError: If the file is not found.
+            ValueError: If `chunk_size` is not positive.
+        """
+        if not isinstance(self.data_loader, TextDataLoader):
+            return self.process(path)
+        TextDataLoader._check_extension(path)
+        try:
+            ranges = text_chunk_ranges(path, chunk_size)
+        except OSError as e:
+            raise FileNotFoundError(f'File not found: {e}')
+
+        workers = min(workers or os.cpu_count() or 1, len(ranges))
+        if workers <= 1:
+            chunks = [_validate_text_chunk(path, start, end, self.validator) for start, end in ranges]
+        else:
+            starts, ends = zip(*ranges)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                chunks = list(executor.map(_validate_text_chunk, [path] * len(ranges), starts, ends,
+                                           [self.validator] * len(ranges)))
+        return self.converter.convert_fields(row for chunk in chunks for row in chunk)
+
     @classmethod
-    def create_processor(cls, data_type: Enum, factory_type: Enum) -> Self:
+    def create_processor(cls, data_type: Enum, factory_type: Enum, cache: ProcessedDataCache | None = None) -> Self:
         """
         Creates a data processor based on the data type and factory type.
 
         Args:
             data_type: An instance of DataFormat specifying the data format.
             factory_type: An instance of FactoryType specifying the factory type.
+            cache: An optional ProcessedDataCache for the results of `process`.
 
         Returns:
             An instance of DataProcessor configured with the appropriate factory.
         """
         match data_type, factory_type:
             case DataFormat.JSON, FactoryType.FROM_SERVICE:
-                return cls(FromJsonFileToJsonDataWithExpectedRegexDataFactory(RegexPatterns.FROM_SERVICE.value))
+                factory = FromJsonFileToJsonDataWithExpectedRegexDataFactory(RegexPatterns.FROM_SERVICE.value)
             case DataFormat.JSON, FactoryType.FROM_USER:
-                return cls(FromJsonFileToJsonDataWithExpectedRegexDataFactory(RegexPatterns.FROM_USER.value))
+                factory = FromJsonFileToJsonDataWithExpectedRegexDataFactory(RegexPatterns.FROM_USER.value)
             case DataFormat.JSON, FactoryType.FROM_SUBSCRIPTION:
-                return cls(FromJsonFileToJsonDataWithExpectedRegexDataFactory(RegexPatterns.FROM_SUBSCRIPTION.value))
+                factory = FromJsonFileToJsonDataWithExpectedRegexDataFactory(RegexPatterns.FROM_SUBSCRIPTION.value)
             case DataFormat.TEXT, FactoryType.FROM_SERVICE:
-                return cls(FromTextFileToTextDataWithExpectedRegexDataFactory(RegexPatterns.FROM_SERVICE.value))
+                factory = FromTextFileToTextDataWithExpectedRegexDataFactory(RegexPatterns.FROM_SERVICE.value)
             case DataFormat.TEXT, FactoryType.FROM_USER:
-                return cls(FromTextFileToTextDataWithExpectedRegexDataFactory(RegexPatterns.FROM_USER.value))
+                factory = FromTextFileToTextDataWithExpectedRegexDataFactory(RegexPatterns.FROM_USER.value)
             case DataFormat.TEXT, FactoryType.FROM_SUBSCRIPTION:
-                return cls(FromTextFileToTextDataWithExpectedRegexDataFactory(RegexPatterns.FROM_SUBSCRIPTION.value))
+                factory = FromTextFileToTextDataWithExpectedRegexDataFactory(RegexPatterns.FROM_SUBSCRIPTION.value)
+            case DataFormat.MAPPED_TEXT, FactoryType.FROM_SERVICE:
+                factory = FromMappedTextFileToTextDataWithExpectedRegexDataFactory(RegexPatterns.FROM_SERVICE.value)
+            case DataFormat.MAPPED_TEXT, FactoryType.FROM_USER:
+                factory = FromMappedTextFileToTextDataWithExpectedRegexDataFactory(RegexPatterns.FROM_USER.value)
+            case DataFormat.MAPPED_TEXT, FactoryType.FROM_SUBSCRIPTION:
+                factory = FromMappedTextFileToTextDataWithExpectedRegexDataFactory(RegexPatterns.FROM_SUBSCRIPTION.value)
+            case _:
+                return None
+        return cls(factory, cache)
+
+    @classmethod
+    def create_record_processor(cls, data_type: Enum, factory_type: Enum, cache: ProcessedDataCache | None = None,
+                                parsers: dict[str, Callable[[str], Any]] | None = None) -> Self | None:
+        """
+        Creates a data processor producing typed records (RecordData) instead of strings.
+
+        Args:
+            data_type: An instance of DataFormat specifying the data format.
+            factory_type: An instance of FactoryType specifying the factory type.
+            cache: An optional ProcessedDataCache for the results of `process`.
+            parsers: Field parsers replacing those of the record schema, see `record_schema`.
+
+        Returns:
+            An instance of DataProcessor configured with the appropriate factory, or None for
+            unsupported combinations.
+        """
+        match data_type, factory_type:
+            case DataFormat.JSON, FactoryType():
+                return cls(FromJsonFileToRecordDataFactory(factory_type, parsers), cache)
+            case DataFormat.TEXT, FactoryType():
+                return cls(FromTextFileToRecordDataFactory(factory_type, parsers), cache)
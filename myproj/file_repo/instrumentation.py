@@ -0,0 +1,198 @@
+"""
+Per-stage instrumentation of `DataProcessor.process`.
+
+A processor with observers measures every run of its load, validate and convert stages and
+passes a `ProcessStats` to each observer. Observers are plain callables, e.g. `list.append` or a
+`PrometheusTextfileWriter`. Processors without observers skip the instrumentation entirely.
+
+ Example:
+        ```python
+        from myproj.file_repo.file_reader_factory import DataProcessor, DataFormat, FactoryType
+        from myproj.file_repo.instrumentation import PrometheusTextfileWriter
+
+        processor = DataProcessor.create_processor(DataFormat.TEXT, FactoryType.FROM_USER)
+        processor.add_observer(PrometheusTextfileWriter('/var/lib/node_exporter/myproj_ingest.prom'))
+        processor.process('data/data_user.csv')
+        print(processor.last_stats.stage('validate').rows_rejected)
+        ```
+"""
+
+import os
+import time
+import tracemalloc
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Iterator
+
+
+@dataclass
+class StageStats:
+    """
+    Measurements of one pipeline stage.
+
+    Attributes:
+        name (str): The stage, 'load', 'validate' or 'convert'.
+        wall_time (float): The elapsed wall-clock time in seconds.
+        cpu_time (float): The CPU time of the process in seconds.
+        rows_in (int): The number of rows handed to the stage.
+        rows_out (int): The number of rows produced by the stage.
+        peak_memory (int | None): The peak of traced memory above its level at the start of the
+            stage, in bytes; None unless memory tracking is enabled.
+    """
+    name: str
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    rows_in: int = 0
+    rows_out: int = 0
+    peak_memory: int | None = None
+
+    @property
+    def rows_rejected(self) -> int:
+        """
+        Returns the number of rows the stage dropped.
+        """
+        return max(self.rows_in - self.rows_out, 0)
+
+
+@dataclass
+class ProcessStats:
+    """
+    Measurements of one `DataProcessor.process` run.
+
+    Attributes:
+        path (str): The processed file.
+        bytes_read (int): The size of the file in bytes.
+        stages (list[StageStats]): The stages in pipeline order.
+
+    Methods:
+        stage: Returns the stats of a stage by name.
+    """
+    path: str
+    bytes_read: int = 0
+    stages: list[StageStats] = field(default_factory=list)
+
+    @property
+    def wall_time(self) -> float:
+        """
+        Returns the total wall-clock time of the stages in seconds.
+        """
+        return sum(stage.wall_time for stage in self.stages)
+
+    @property
+    def rows_out(self) -> int:
+        """
+        Returns the number of rows produced by the last stage.
+        """
+        return self.stages[-1].rows_out if self.stages else 0
+
+    def stage(self, name: str) -> StageStats:
+        """
+        Returns the stats of a stage by name.
+
+        Args:
+            name (str): The stage, 'load', 'validate' or 'convert'.
+
+        Returns:
+            StageStats: The stats of the stage.
+
+        Raises:
+            KeyError: If the run has no stage with that name.
+        """
+        for stage in self.stages:
+            if stage.name == name:
+                return stage
+        raise KeyError("Stage Not Found")
+
+
+@contextmanager
+def measure_stage(stats: ProcessStats, name: str, rows_in: int, track_memory: bool = False) -> Iterator[StageStats]:
+    """
+    Measures the wall and CPU time, and optionally the peak memory, of the `with` block as a stage.
+
+    The block sets `rows_out` on the yielded `StageStats`. Memory is measured with `tracemalloc`,
+    which is started for the block if it is not tracing already.
+
+    Args:
+        stats (ProcessStats): The run the stage is appended to.
+        name (str): The name of the stage.
+        rows_in (int): The number of rows handed to the stage.
+        track_memory (bool): Whether to measure the peak memory.
+
+    Returns:
+        Iterator[StageStats]: The stats of the stage, completed when the block exits.
+    """
+    stage = StageStats(name, rows_in=rows_in)
+    stop_tracing = False
+    if track_memory:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            stop_tracing = True
+        tracemalloc.reset_peak()
+        start_memory = tracemalloc.get_traced_memory()[0]
+    wall, cpu = time.perf_counter(), time.process_time()
+    try:
+        yield stage
+    finally:
+        stage.wall_time = time.perf_counter() - wall
+        stage.cpu_time = time.process_time() - cpu
+        if track_memory:
+            stage.peak_memory = tracemalloc.get_traced_memory()[1] - start_memory
+            if stop_tracing:
+                tracemalloc.stop()
+        stats.stages.append(stage)
+
+
+def _label(value: str) -> str:
+    """
+    Escapes a Prometheus label value.
+    """
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class PrometheusTextfileWriter:
+    """
+    Observer writing the latest stats of every processed file in the Prometheus text format.
+
+    The file is meant for the textfile collector of the node exporter: it is rewritten atomically
+    after every run and holds one sample per file and stage for each metric.
+
+    Attributes:
+        path (str): The path of the metrics file.
+        prefix (str): The prefix of the metric names.
+        latest (dict[str, ProcessStats]): The latest stats per processed file.
+    """
+    _STAGE_METRICS = (
+        ('stage_wall_seconds', 'Wall-clock time of the stage in the latest run.', 'wall_time'),
+        ('stage_cpu_seconds', 'CPU time of the stage in the latest run.', 'cpu_time'),
+        ('stage_rows_in', 'Rows handed to the stage in the latest run.', 'rows_in'),
+        ('stage_rows_out', 'Rows produced by the stage in the latest run.', 'rows_out'),
+        ('stage_rows_rejected', 'Rows dropped by the stage in the latest run.', 'rows_rejected'),
+        ('stage_peak_memory_bytes', 'Peak traced memory of the stage in the latest run.', 'peak_memory'),
+    )
+
+    def __init__(self, path: str, prefix: str = 'myproj_ingest'):
+        self.path = path
+        self.prefix = prefix
+        self.latest: dict[str, ProcessStats] = {}
+
+    def __call__(self, stats: ProcessStats) -> None:
+        self.latest[stats.path] = stats
+        lines = [f'# HELP {self.prefix}_bytes_read Size of the file in the latest run.',
+                 f'# TYPE {self.prefix}_bytes_read gauge']
+        lines += [f'{self.prefix}_bytes_read{{file="{_label(path)}"}} {run.bytes_read}'
+                  for path, run in self.latest.items()]
+        for metric, help_text, attribute in self._STAGE_METRICS:
+            samples = [(path, stage, getattr(stage, attribute))
+                       for path, run in self.latest.items() for stage in run.stages]
+            samples = [(path, stage, value) for path, stage, value in samples if value is not None]
+            if not samples:
+                continue
+            lines += [f'# HELP {self.prefix}_{metric} {help_text}', f'# TYPE {self.prefix}_{metric} gauge']
+            lines += [f'{self.prefix}_{metric}{{file="{_label(path)}",stage="{stage.name}"}} {value}'
+                      for path, stage, value in samples]
+
+        tmp_path = f'{self.path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+        os.replace(tmp_path, self.path)
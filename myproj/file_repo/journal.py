@@ -0,0 +1,258 @@
+"""
+Append-only write-ahead journal for repository mutations.
+
+Each mutation is one JSON line: `["put", fields]` with the fields of the stored model in
+`RecordSchemas` order, or `["delete", id]`. Lines are buffered and written with a single write and
+`fsync` per group commit: when `batch_size` entries are pending, when the oldest pending entry is
+`max_delay` seconds old, or on an explicit `commit`. A timer thread commits the pending entries
+`max_delay` seconds after the first of them, so they are synced even if no further mutation comes.
+Entries that have not been committed yet are lost if the process crashes; a torn last line is
+ignored on replay.
+
+Replaying a journal over the repository state it started from restores the latest state. Put
+and delete entries are idempotent, so replaying over a newer snapshot is harmless as well.
+
+ Example:
+        ```python
+        from myproj.file_repo.file_reader_factory import FactoryType
+        from myproj.file_repo.journal import Journal
+
+        journal = Journal('data/subscriptions.journal', FactoryType.FROM_SUBSCRIPTION)
+        journal.replay(subscription_repo)
+        subscription_repo.attach_journal(journal)
+        ...
+        journal.close()
+        ```
+"""
+
+import json
+import os
+import threading
+import time
+
+from datetime import date
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Iterable, Self
+
+from myproj.file_repo.file_reader_factory import FactoryType, record_schema
+from myproj.model.service import Service
+from myproj.model.subscription import Subscription
+from myproj.model.user import Destination, User
+
+_MODELS = {FactoryType.FROM_SERVICE: Service, FactoryType.FROM_USER: User, FactoryType.FROM_SUBSCRIPTION: Subscription}
+_PARSERS = {FactoryType.FROM_USER: {'origin': Destination}}
+
+
+def _encode_value(value: Any) -> Any:
+    """
+    Converts a model field into a JSON value that the field's schema parser turns back into it.
+    """
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+class Journal:
+    """
+    Append-only journal of repository mutations with group commit.
+
+    Attributes:
+        path (str): The path of the journal file.
+        kind (FactoryType): The kind of model stored in the journaled repository.
+        batch_size (int): The number of pending entries that triggers a commit.
+        max_delay (float): The age in seconds of the oldest pending entry that triggers a commit,
+            at the latest by a timer thread.
+
+    Methods:
+        record_put: Appends the storing of a model.
+        record_put_many: Appends the storing of several models as one group.
+        record_delete: Appends the deletion of an ID.
+        commit: Writes and syncs the pending entries.
+        replay: Applies the committed entries to a repository.
+        truncate: Removes all entries.
+        size: Returns the size of the journal file in bytes.
+        close: Commits the pending entries and closes the file.
+    """
+
+    def __init__(self, path: str, kind: FactoryType, batch_size: int = 1024, max_delay: float = 0.05):
+        self.path = path
+        self.kind = kind
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        schema = record_schema(kind, _PARSERS.get(kind))
+        self._fields = tuple(spec.name for spec in schema)
+        self._parsers = tuple(spec.parse for spec in schema)
+        self._pending: list[str] = []
+        self._oldest = 0.0
+        self._timer: threading.Timer | None = None
+        self._lock = threading.Lock()
+        self._file = open(path, 'ab')
+        self._drop_torn_line()
+
+    def _drop_torn_line(self) -> None:
+        """
+        Truncates a torn last line left by a crash, so that new entries start on a fresh line.
+        """
+        end = self.size()
+        with open(self.path, 'rb') as f:
+            while end > 0:
+                start = max(0, end - 65536)
+                f.seek(start)
+                newline = f.read(end - start).rfind(b'\n')
+                if newline >= 0:
+                    end = start + newline + 1
+                    break
+                end = start
+        if end != self.size():
+            self._file.truncate(end)
+
+    def _append(self, *entries: list) -> None:
+        lines = [json.dumps(entry, separators=(',', ':'), ensure_ascii=False) for entry in entries]
+        if not lines:
+            return
+        with self._lock:
+            if not self._pending:
+                self._oldest = time.monotonic()
+            self._pending.extend(lines)
+            if len(self._pending) >= self.batch_size or time.monotonic() - self._oldest >= self.max_delay:
+                self._commit()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.max_delay, self._commit_due)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _commit_due(self) -> None:
+        """
+        Commits the pending entries once the timer started by `_append` expires.
+        """
+        with self._lock:
+            self._timer = None
+            if not self._file.closed:
+                self._commit()
+
+    def record_put(self, model: Any) -> None:
+        """
+        Appends the storing of a model, replacing any model with the same ID on replay.
+
+        Args:
+            model (Any): The `Service`, `User` or `Subscription` instance that was stored.
+        """
+        self._append(['put', [_encode_value(getattr(model, name)) for name in self._fields]])
+
+    def record_put_many(self, models: Iterable[Any]) -> None:
+        """
+        Appends the storing of several models as one group, see `record_put`.
+
+        Args:
+            models (Iterable[Any]): The `Service`, `User` or `Subscription` instances that were stored.
+        """
+        fields = self._fields
+        self._append(*(['put', [_encode_value(getattr(model, name)) for name in fields]] for model in models))
+
+    def record_delete(self, id_: int) -> None:
+        """
+        Appends the deletion of an ID.
+
+        Args:
+            id_ (int): The ID that was deleted.
+        """
+        self._append(['delete', id_])
+
+    def _commit(self) -> None:
+        if self._pending:
+            self._file.write(('\n'.join(self._pending) + '\n').encode('utf-8'))
+            self._pending.clear()
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def commit(self) -> None:
+        """
+        Writes the pending entries with a single write and syncs them to disk.
+        """
+        with self._lock:
+            self._commit()
+
+    def _decode(self, fields: list) -> tuple:
+        return tuple(None if value is None else parse(value) for parse, value in zip(self._parsers, fields))
+
+    def replay(self, repo: Any) -> int:
+        """
+        Applies the committed entries to a repository, in order.
+
+        Puts go through `repo.upsert`, deletes of missing IDs are ignored. The repository must not
+        have this journal attached while replaying.
+
+        Args:
+            repo (Any): A repository with `upsert` and `delete` methods for the journal's kind.
+
+        Returns:
+            int: The number of applied entries.
+
+        Raises:
+            ValueError: If an entry other than a torn last line is malformed.
+        """
+        model_cls = _MODELS[self.kind]
+        self.commit()
+        with open(self.path, 'rb') as f:
+            lines = f.read().split(b'\n')
+        applied = 0
+        last = len(lines) - 1
+        for number, line in enumerate(lines):
+            if not line:
+                continue
+            try:
+                op, value = json.loads(line)
+                if op == 'put':
+                    repo.upsert(model_cls(*self._decode(value)))
+                elif op == 'delete':
+                    try:
+                        repo.delete(value)
+                    except KeyError:
+                        pass
+                else:
+                    raise ValueError(f'Unknown journal operation: {op}')
+            except (ValueError, TypeError) as e:
+                if number == last:
+                    break
+                raise ValueError(f'Malformed journal entry on line {number + 1}: {e}')
+            applied += 1
+        return applied
+
+    def truncate(self) -> None:
+        """
+        Removes all entries, including pending ones.
+        """
+        with self._lock:
+            self._pending.clear()
+            self._file.truncate(0)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def size(self) -> int:
+        """
+        Returns the size of the committed journal in bytes.
+        """
+        return os.fstat(self._file.fileno()).st_size
+
+    def close(self) -> None:
+        """
+        Commits the pending entries and closes the file.
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._file.closed:
+                self._commit()
+                self._file.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,240 @@
+"""
+Binary snapshots of repository data for fast warm starts.
+
+A snapshot stores one kind of record (services, users or subscriptions) as fixed-width binary
+records plus a string table, so it can be read back without any text parsing: records are unpacked
+with `struct.iter_unpack` and strings are decoded in a single call. Reading returns `RecordData`,
+which the repositories accept directly.
+
+Layout (little-endian):
+    header: magic, format version, record kind, record count, string count, string length in
+        characters and string table size in bytes.
+    string lengths: one unsigned 32-bit length in characters per string.
+    string table: all strings concatenated, UTF-8 encoded.
+    records: `count` fixed-width records of the kind's struct layout.
+
+Field encodings:
+    Decimal: a signed 64-bit coefficient and a signed 8-bit exponent, so the exact digits
+        (including trailing zeros) survive the round trip.
+    date: its proleptic Gregorian ordinal.
+    Destination: the index of the member in the enum.
+    str: an index into the string table; equal strings are stored once.
+    Optional values: a flag byte next to the value.
+
+ Example:
+        ```python
+        from myproj.service.subscription import SubscriptionRepo
+
+        subscription_repo.save_snapshot('data/subscriptions.snap')
+        subscription_repo = SubscriptionRepo.load_snapshot('data/subscriptions.snap')
+        ```
+"""
+
+import os
+import struct
+import sys
+
+from array import array
+from datetime import date
+from decimal import Decimal
+from typing import Iterable
+
+from myproj.file_repo.file_reader_factory import FactoryType, RecordData
+from myproj.model.service import Service
+from myproj.model.subscription import Subscription
+from myproj.model.user import Destination, User
+
+MAGIC = b'MPSN'
+VERSION = 1
+
+_HEADER = struct.Struct('<4sHBxQIQQ')
+_KINDS = {FactoryType.FROM_SERVICE: 1, FactoryType.FROM_USER: 2, FactoryType.FROM_SUBSCRIPTION: 3}
+_RECORDS = {
+    # id_, name, category, price coefficient, price exponent
+    FactoryType.FROM_SERVICE: struct.Struct('<qIIqb'),
+    # name, surname, origin, birthdate, has id_, id_
+    FactoryType.FROM_USER: struct.Struct('<IIBiBq'),
+    # user_id, service_id, quantity_per_month, has discount, discount coefficient, discount exponent,
+    # has id_, id_, active (0, 1 or 2 for None)
+    FactoryType.FROM_SUBSCRIPTION: struct.Struct('<qqqBqbBqB'),
+}
+_DESTINATIONS = list(Destination)
+_DESTINATION_INDEX = {destination: index for index, destination in enumerate(_DESTINATIONS)}
+
+
+def _encode_decimal(value: Decimal) -> tuple[int, int]:
+    """
+    Splits a decimal into its integer coefficient and exponent.
+
+    Raises:
+        ValueError: If the value is not finite or does not fit the snapshot fields.
+    """
+    value = Decimal(value)
+    if not value.is_finite():
+        raise ValueError("Decimal value not supported")
+    exponent = value.as_tuple().exponent
+    coefficient = int(value.scaleb(-exponent))
+    if not (-2 ** 63 <= coefficient < 2 ** 63 and -128 <= exponent < 128):
+        raise ValueError("Decimal value not supported")
+    return coefficient, exponent
+
+
+class _DecimalCache(dict):
+    """
+    Rebuilds decimals from their coefficient and exponent, sharing one instance per distinct value.
+
+    Prices and discounts repeat heavily across records, and `Decimal` instances are immutable.
+    """
+    def __missing__(self, key: tuple[int, int]) -> Decimal:
+        value = self[key] = Decimal(key[0]).scaleb(key[1])
+        return value
+
+
+class _StringTable:
+    """
+    Collects the distinct strings of a snapshot and assigns them indexes.
+    """
+    def __init__(self):
+        self.indexes: dict[str, int] = {}
+
+    def __call__(self, value: str) -> int:
+        index = self.indexes.get(value)
+        if index is None:
+            index = self.indexes[value] = len(self.indexes)
+        return index
+
+    def to_bytes(self) -> tuple[bytes, bytes, int]:
+        """
+        Returns the little-endian length array, the encoded table and its length in characters.
+        """
+        lengths = array('I', map(len, self.indexes))
+        if sys.byteorder != 'little':
+            lengths.byteswap()      # pragma: no cover
+        text = ''.join(self.indexes)
+        return lengths.tobytes(), text.encode('utf-8'), len(text)
+
+
+def _pack_records(kind: FactoryType, records: Iterable, strings: _StringTable) -> tuple[bytes, int]:
+    """
+    Packs model instances into fixed-width records, adding their strings to the table.
+
+    Returns:
+        The packed records and their count.
+    """
+    pack = _RECORDS[kind].pack
+    packed = []
+    match kind:
+        case FactoryType.FROM_SERVICE:
+            for service in records:
+                packed.append(pack(service.id_, strings(service.name), strings(service.category),
+                                   *_encode_decimal(service.price)))
+        case FactoryType.FROM_USER:
+            for user in records:
+                packed.append(pack(strings(user.name), strings(user.surname), _DESTINATION_INDEX[user.origin],
+                                   user.birthdate.toordinal(), user.id_ is not None, user.id_ or 0))
+        case FactoryType.FROM_SUBSCRIPTION:
+            for subscription in records:
+                discount = subscription.discount
+                active = 2 if subscription.active is None else int(bool(subscription.active))
+                packed.append(pack(subscription.user_id, subscription.service_id,
+                                   subscription.quantity_per_month, discount is not None,
+                                   *(_encode_decimal(discount) if discount is not None else (0, 0)),
+                                   subscription.id_ is not None, subscription.id_ or 0, active))
+    return b''.join(packed), len(packed)
+
+
+def _unpack_records(kind: FactoryType, buffer: bytes, strings: list[str]) -> list[tuple]:
+    """
+    Unpacks fixed-width records into the field tuples of the kind's model.
+    """
+    records = _RECORDS[kind].iter_unpack(buffer)
+    decimals = _DecimalCache()
+    match kind:
+        case FactoryType.FROM_SERVICE:
+            return [(id_, strings[name], strings[category], decimals[coefficient, exponent])
+                    for id_, name, category, coefficient, exponent in records]
+        case FactoryType.FROM_USER:
+            from_ordinal = date.fromordinal
+            return [(strings[name], strings[surname], _DESTINATIONS[origin], from_ordinal(birthdate),
+                     id_ if has_id else None)
+                    for name, surname, origin, birthdate, has_id, id_ in records]
+        case FactoryType.FROM_SUBSCRIPTION:
+            actives = (False, True, None)
+            return [(user_id, service_id, quantity, decimals[coefficient, exponent] if has_discount else None,
+                     id_ if has_id else None, actives[active])
+                    for user_id, service_id, quantity, has_discount, coefficient, exponent, has_id, id_, active
+                    in records]
+
+
+def write_snapshot(path: str, kind: FactoryType, records: Iterable[Service | User | Subscription]) -> None:
+    """
+    Writes model instances to a snapshot file.
+
+    The file is written next to its destination and moved into place once complete, so readers
+    never see a partially written snapshot.
+
+    Args:
+        path: The path of the snapshot file.
+        kind: The FactoryType of the records.
+        records: The `Service`, `User` or `Subscription` instances to store.
+
+    Raises:
+        ValueError: If a value cannot be represented in the snapshot format.
+    """
+    strings = _StringTable()
+    try:
+        packed, count = _pack_records(kind, records, strings)
+    except struct.error as e:
+        raise ValueError(f"Value not supported in snapshot: {e}")
+    lengths, table, table_chars = strings.to_bytes()
+
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, _KINDS[kind], count, len(strings.indexes), table_chars, len(table)))
+        f.write(lengths)
+        f.write(table)
+        f.write(packed)
+    os.replace(tmp_path, path)
+
+
+def read_snapshot(path: str, kind: FactoryType) -> RecordData:
+    """
+    Reads a snapshot file written by `write_snapshot`.
+
+    Args:
+        path: The path of the snapshot file.
+        kind: The FactoryType the snapshot is expected to hold.
+
+    Returns:
+        RecordData holding one field tuple per record, in the order they were written.
+
+    Raises:
+        FileNotFoundError: If the file is not found.
+        ValueError: If the file is not a snapshot of the expected kind and version.
+    """
+    with open(path, 'rb') as f:
+        buffer = f.read()
+    if len(buffer) < _HEADER.size:
+        raise ValueError("Unsupported snapshot format")
+    magic, version, kind_id, count, string_count, table_chars, table_size = _HEADER.unpack_from(buffer)
+    if magic != MAGIC or version != VERSION or kind_id != _KINDS[kind]:
+        raise ValueError("Unsupported snapshot format")
+
+    offset = _HEADER.size
+    lengths = array('I')
+    lengths.frombytes(buffer[offset:offset + 4 * string_count])
+    if sys.byteorder != 'little':
+        lengths.byteswap()      # pragma: no cover
+    offset += 4 * string_count
+    text = buffer[offset:offset + table_size].decode('utf-8')
+    offset += table_size
+    records = buffer[offset:]
+    if len(text) != table_chars or len(records) != count * _RECORDS[kind].size:
+        raise ValueError("Unsupported snapshot format")
+
+    strings = []
+    start = 0
+    for length in lengths:
+        strings.append(text[start:start + length])
+        start += length
+    return RecordData(_unpack_records(kind, records, strings))
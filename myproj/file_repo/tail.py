@@ -0,0 +1,120 @@
+"""
+Incremental reading of append-mostly text files.
+
+`TailReader` remembers, per file, the byte offset just past the last complete line it returned,
+so each call only reads what was appended since. A partially written last line is left for the
+next call. When a file was truncated, replaced or rewritten before the remembered offset, the
+reader starts over from the first data line and reports a reset.
+
+ Example:
+        ```python
+        from myproj.file_repo.tail import TailReader
+
+        reader = TailReader()
+        lines, reset = reader.read_new_lines('data/data_subscription.csv')   # all data lines
+        lines, reset = reader.read_new_lines('data/data_subscription.csv')   # only appended lines
+        ```
+"""
+
+import hashlib
+import os
+
+from dataclasses import dataclass
+
+from myproj.file_repo.file_reader_factory import TextDataLoader, split_text_lines
+
+
+@dataclass
+class FilePosition:
+    """
+    How far a file has been read.
+
+    Attributes:
+        offset (int): The byte offset just past the last complete line that was returned.
+        device (int): The device of the file, to detect a replaced file.
+        inode (int): The inode of the file, to detect a replaced file.
+        fingerprint (bytes): A hash of the bytes just before `offset`, to detect a rewritten file.
+    """
+    offset: int
+    device: int
+    inode: int
+    fingerprint: bytes
+
+
+class TailReader:
+    """
+    Reads the lines appended to text files since the previous call.
+
+    Attributes:
+        positions (dict[str, FilePosition]): The read position per absolute file path.
+
+    Methods:
+        read_new_lines: Returns the complete lines appended to a file since the previous call.
+        forget: Drops the position of a file so that it is read from the start again.
+    """
+    FINGERPRINT_BYTES = 4096
+
+    def __init__(self):
+        self.positions: dict[str, FilePosition] = {}
+
+    @classmethod
+    def _fingerprint(cls, f, offset: int) -> bytes:
+        """
+        Hashes up to `FINGERPRINT_BYTES` bytes before the offset.
+        """
+        start = max(0, offset - cls.FINGERPRINT_BYTES)
+        f.seek(start)
+        return hashlib.blake2b(f.read(offset - start), digest_size=16).digest()
+
+    def read_new_lines(self, path: str) -> tuple[list[str], bool]:
+        """
+        Returns the complete lines appended to a file since the previous call.
+
+        The header line is skipped and line endings are removed, as done by `TextDataLoader`.
+
+        Args:
+            path (str): The path to the '.csv' or '.txt' file.
+
+        Returns:
+            tuple[list[str], bool]: The new lines, and whether the file was read from the start
+                again because it shrank, was replaced or was rewritten.
+
+        Raises:
+            AttributeError: If the file does not have a '.csv' or '.txt' extension.
+            FileNotFoundError: If the file is not found.
+        """
+        TextDataLoader._check_extension(path)
+        key = os.path.abspath(path)
+        position = self.positions.get(key)
+        with open(path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            reset = position is not None and (
+                (stat.st_dev, stat.st_ino) != (position.device, position.inode)
+                or stat.st_size < position.offset
+                or self._fingerprint(f, position.offset) != position.fingerprint
+            )
+            if position is None or reset:
+                self.positions.pop(key, None)
+                f.seek(0)
+                header = f.readline(stat.st_size)
+                if not header.endswith(b'\n'):
+                    return [], reset
+                start = len(header)
+            else:
+                start = position.offset
+
+            f.seek(start)
+            pending = f.read(stat.st_size - start)
+            end = start + pending.rfind(b'\n') + 1
+            if end > start:
+                self.positions[key] = FilePosition(end, stat.st_dev, stat.st_ino, self._fingerprint(f, end))
+        return split_text_lines(pending[:end - start]), reset
+
+    def forget(self, path: str) -> None:
+        """
+        Drops the position of a file so that the next call reads it from the start.
+
+        Args:
+            path (str): The path to the file.
+        """
+        self.positions.pop(os.path.abspath(path), None)
@@ -1,12 +1,13 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from decimal import Decimal
 from typing import Any, Self
 
 
-@dataclass
+@dataclass(slots=True)
 class Service:
     """
     Represents a service with attributes including ID, name, category, and price.
+    Instances are slotted and have no `__dict__`.
 
     Attributes:
         id_ (int): The unique identifier for the service.
@@ -81,5 +82,4 @@ class Service:
             updated_service
             # Output: Service(id_=1, name='Deluxe Burger', category='Burgers', price=Decimal('14.99'))
         """
-        updated_data = self.__dict__ | data
-        return Service(**updated_data)
+        return replace(self, **data)
@@ -1,8 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from decimal import Decimal
 from typing import Any, Self
 
-@dataclass
+@dataclass(slots=True)
 class Subscription:
     """
     Represents a subscription for a service by a user.
@@ -63,6 +63,7 @@ class Subscription:
 
     Note:
         - The `update` method merges the provided data dictionary with the existing attributes of the `Subscription` instance.
+        - The class is slotted, so instances carry no per-instance `__dict__`.
         - The `id_` and `active` attributes can be modified using the `set_id`, `set_active`, and `set_inactive` methods.
 
     """
@@ -173,5 +174,4 @@ class Subscription:
             updated_subscription
             # Output: Subscription(user_id=123, service_id=456, quantity_per_month=3, discount=10.00, id_=None, active=True)
         """
-        updated_data = self.__dict__ | data
-        return Subscription(**updated_data)
+        return replace(self, **data)
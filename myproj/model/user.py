@@ -19,10 +19,10 @@ class Destination(Enum):
     IC = 'CANARY ISLANDS'
     CM = 'CEUTA OR MELILLA TERITORY'
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class User:
     """
-    Represents a user with basic information.
+    Represents a user with basic information. The class is frozen and slotted.
 
     Attributes:
         name (str): The first name of the user.
@@ -0,0 +1,190 @@
+"""
+Asyncio facade over `UserService`.
+
+`AsyncUserService` exposes the user service operations as coroutines for asyncio-based callers.
+Loading the data files, which blocks on file I/O and parsing, runs in an executor. Lookups and
+subscribes are cheap index operations and run directly on the event loop thread, so the wrapped
+repositories are only ever used from that thread and need no locking. Operations that scale with
+the size of the data, such as `active_subscriptions_report`, yield to the event loop every
+`chunk_size` rows, so a big report does not stall other requests.
+
+ Example:
+        ```python
+        from myproj.service.async_user import AsyncUserService
+
+        async def handler():
+            user_service = await AsyncUserService.from_files('data/data_user.csv', 'data/data_service.csv',
+                                                             'data/data_subscription.csv')
+            return await user_service.active_subscriptions_report()
+        ```
+"""
+
+import asyncio
+
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Callable, Self
+
+from myproj.file_repo.file_reader_factory import DataProcessor, DataFormat, FactoryType
+from myproj.model.service import Service
+from myproj.model.subscription import Subscription
+from myproj.model.user import User
+from myproj.service.service import ServiceRepo
+from myproj.service.subscription import SubscriptionRepo
+from myproj.service.user import UserRepo, UserService
+
+
+def _load(repo_cls: Callable, data_type: DataFormat, factory_type: FactoryType, path: str):
+    """
+    Processes a data file and builds a repository from it; runs in an executor.
+    """
+    return repo_cls(DataProcessor.create_processor(data_type, factory_type).process(path))
+
+
+@dataclass
+class AsyncUserService:
+    """
+    Coroutine-based facade over a `UserService`.
+
+    Args:
+        user_service (UserService): The wrapped service.
+        chunk_size (int): The number of rows processed between two yields to the event loop.
+
+    Methods:
+        from_files(user_path: str, service_path: str, subscription_path: str, ...) -> AsyncUserService:
+            Loads the repositories from data files in an executor.
+
+        subscriptions_for_user_id(user_id: int) -> list[Subscription]:
+            Retrieves all subscriptions for a given user ID.
+
+        users_subscribed_to_service(service_id: int) -> list[User]:
+            Retrieves all users subscribed to a given service ID.
+
+        subscribe_user_to_service(user_id: int, service_id: int, quantity_per_month: int, discount: Decimal = None) -> Subscription:
+            Subscribes a user to a service with specified quantity and optional discount.
+
+        active_subscriptions_report() -> dict:
+            Generates a report of active subscriptions, mapping users to their subscribed services.
+    """
+
+    user_service: UserService
+    chunk_size: int = 1000
+
+    @classmethod
+    async def from_files(cls, user_path: str, service_path: str, subscription_path: str,
+                         data_type: DataFormat = DataFormat.TEXT, executor: Executor | None = None,
+                         chunk_size: int = 1000) -> Self:
+        """
+        Loads the user, service and subscription files concurrently in an executor.
+
+        Args:
+            user_path (str): The path to the user data file.
+            service_path (str): The path to the service data file.
+            subscription_path (str): The path to the subscription data file.
+            data_type (DataFormat): The format of the three files.
+            executor (Executor | None): The executor the files are loaded in; the event loop's
+                default executor if None.
+            chunk_size (int): The number of rows processed between two yields to the event loop.
+
+        Returns:
+            AsyncUserService: The service over the loaded repositories.
+
+        Raises:
+            AttributeError: If a file has an incorrect extension.
+            FileNotFoundError: If a file is not found.
+        """
+        loop = asyncio.get_running_loop()
+        user_repo, service_repo, subscription_repo = await asyncio.gather(*(
+            loop.run_in_executor(executor, _load, repo_cls, data_type, factory_type, path)
+            for repo_cls, factory_type, path in ((UserRepo, FactoryType.FROM_USER, user_path),
+                                                 (ServiceRepo, FactoryType.FROM_SERVICE, service_path),
+                                                 (SubscriptionRepo, FactoryType.FROM_SUBSCRIPTION, subscription_path))
+        ))
+        return cls(UserService(user_repo, service_repo, subscription_repo), chunk_size)
+
+    async def subscriptions_for_user_id(self, user_id: int) -> list[Subscription]:
+        """
+        Retrieves all subscriptions for a given user ID.
+
+        Args:
+            user_id (int): The ID of the user to retrieve subscriptions for.
+
+        Returns:
+            list[Subscription]: A list of subscriptions for the specified user ID.
+        """
+        return self.user_service.subscriptions_for_user_id(user_id)
+
+    async def users_subscribed_to_service(self, service_id: int) -> list[User]:
+        """
+        Retrieves all users subscribed to a given service ID, yielding to the event loop between chunks.
+
+        Args:
+            service_id (int): The ID of the service to find users for.
+
+        Returns:
+            list[User]: A list of users subscribed to the specified service ID.
+
+        Raises:
+            KeyError: If a subscription references an unknown user.
+        """
+        subscriptions = self.user_service.subscription_repo.get_subscriptions_by_service_id(service_id)
+        find_by_id = self.user_service.user_repo.find_by_id
+        users = []
+        for start in range(0, len(subscriptions), self.chunk_size):
+            if start:
+                await asyncio.sleep(0)
+            users.extend(find_by_id(subscription.user_id) for subscription in subscriptions[start:start + self.chunk_size])
+        return users
+
+    async def subscribe_user_to_service(self, user_id: int, service_id: int, quantity_per_month: int,
+                                        discount: Decimal = None) -> Subscription:
+        """
+        Subscribes a user to a service with specified quantity and optional discount.
+
+        Args:
+            user_id (int): The ID of the user to subscribe.
+            service_id (int): The ID of the service to subscribe to.
+            quantity_per_month (int): The quantity of the service per month.
+            discount (Decimal, optional): An optional discount for the subscription.
+
+        Returns:
+            Subscription: The created subscription.
+
+        Raises:
+            KeyError: If the user or the service is not found.
+        """
+        return self.user_service.subscribe_user_to_service(user_id, service_id, quantity_per_month, discount)
+
+    async def active_subscriptions_report(self) -> dict:
+        """
+        Generates a report of active subscriptions, yielding to the event loop between chunks.
+
+        The report is the same as `UserService.active_subscriptions_report`. It is built from the
+        list of active subscriptions taken when the call starts; users and services are looked up
+        as each chunk is processed.
+
+        Returns:
+            dict: A dictionary where keys are User objects and values are lists of Service objects
+                  representing the active subscriptions for each user.
+
+        Raises:
+            KeyError: If an active subscription references an unknown user or service.
+        """
+        subscriptions = self.user_service.subscription_repo.get_all_active_subscriptions()
+        services = self.user_service.service_repo.get_services()
+        services_by_user_id: dict[int, list[Service]] = {}
+        for start in range(0, len(subscriptions), self.chunk_size):
+            if start:
+                await asyncio.sleep(0)
+            UserService._group_report_services(subscriptions[start:start + self.chunk_size], services,
+                                               services_by_user_id)
+
+        users = self.user_service.user_repo.get_all_users()
+        grouped = list(services_by_user_id.items())
+        report = {}
+        for start in range(0, len(grouped), self.chunk_size):
+            if start:
+                await asyncio.sleep(0)
+            UserService._add_report_users(grouped[start:start + self.chunk_size], users, report)
+        return report
@@ -0,0 +1,288 @@
+"""
+Thread-safe variants of the repositories, for serving reads and writes from a thread pool.
+
+Each concurrent repository guards its state with a `ReadWriteLock`: mutations, including the
+read-modify-write sequences of `add_subscription` and `update`, run under the write lock, and
+lookups that iterate the secondary indexes under the read lock. `find_by_id` is a single atomic
+dictionary read and takes no lock. Bulk readers such as `get_all_subscriptions` and the
+dictionaries used by `UserService.active_subscriptions_report` are served from copy-on-write
+snapshots: the first read after a mutation builds an immutable snapshot under the read lock, later
+reads share it without locking, and the next mutation drops it. A reader holding a snapshot is never affected by later
+writes, and models are replaced rather than modified on update, so the snapshot stays consistent.
+
+The mapping getters (`get_services`, `get_all_users`, `get_subscriptions`) return read-only
+`MappingProxyType` views of their snapshot; the list getters return a new list per call.
+
+ Example:
+        ```python
+        from concurrent.futures import ThreadPoolExecutor
+        from myproj.service.concurrent_repo import ConcurrentServiceRepo, ConcurrentSubscriptionRepo, ConcurrentUserRepo
+
+        user_service = UserService(ConcurrentUserRepo(users), ConcurrentServiceRepo(services),
+                                   ConcurrentSubscriptionRepo(subscriptions))
+        with ThreadPoolExecutor() as executor:
+            executor.map(lambda row: user_service.subscribe_user_to_service(*row), rows)
+        ```
+"""
+
+import threading
+
+from contextlib import contextmanager
+from datetime import date
+from types import MappingProxyType
+from typing import Any, Callable, Iterator, Mapping
+
+from myproj.file_repo.file_reader_factory import JsonData, RecordData, TextData
+from myproj.model.service import Service
+from myproj.model.subscription import Subscription
+from myproj.model.user import User
+from myproj.service.service import ServiceRepo
+from myproj.service.subscription import SubscriptionRepo
+from myproj.service.user import UserRepo
+
+
+class ReadWriteLock:
+    """
+    A writer-preferring reader-writer lock.
+
+    Any number of threads may hold the read lock together, the write lock is exclusive. Once a
+    writer is waiting, new readers wait as well, so writers are not starved by a stream of
+    readers. The write lock is reentrant, and its owner may also take the read lock, so that
+    locked methods can call each other; the read lock itself is not reentrant.
+
+    Methods:
+        read: Context manager holding the read lock.
+        write: Context manager holding the write lock.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer: int | None = None
+        self._depth = 0
+        self._waiting_writers = 0
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        """
+        Holds the read lock for the duration of the `with` block.
+        """
+        if self._writer == threading.get_ident():
+            yield
+            return
+        with self._condition:
+            while self._writer is not None or self._waiting_writers:
+                self._condition.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._readers -= 1
+                if not self._readers:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        """
+        Holds the write lock for the duration of the `with` block.
+        """
+        me = threading.get_ident()
+        with self._condition:
+            if self._writer == me:
+                self._depth += 1
+            else:
+                self._waiting_writers += 1
+                try:
+                    while self._writer is not None or self._readers:
+                        self._condition.wait()
+                finally:
+                    self._waiting_writers -= 1
+                self._writer = me
+                self._depth = 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._depth -= 1
+                if not self._depth:
+                    self._writer = None
+                    self._condition.notify_all()
+
+
+class _CopyOnWrite:
+    """
+    Lock and snapshot bookkeeping shared by the concurrent repositories.
+    """
+
+    def _init_concurrency(self) -> None:
+        self._lock = ReadWriteLock()
+        self._snapshots: dict[str, Any] = {}
+
+    def _snapshot(self, name: str, build: Callable[[], Any]) -> Any:
+        """
+        Returns the snapshot with the given name, building it under the read lock if a mutation
+        dropped it.
+        """
+        snapshot = self._snapshots.get(name)
+        if snapshot is None:
+            with self._lock.read():
+                snapshot = self._snapshots.get(name)
+                if snapshot is None:
+                    snapshot = self._snapshots[name] = build()
+        return snapshot
+
+    @contextmanager
+    def _mutation(self) -> Iterator[None]:
+        """
+        Holds the write lock and drops the snapshots once the mutation is done.
+        """
+        with self._lock.write():
+            try:
+                yield
+            finally:
+                self._snapshots.clear()
+
+
+class ConcurrentServiceRepo(_CopyOnWrite, ServiceRepo):
+    """
+    A `ServiceRepo` that can be shared between threads, see the module documentation.
+
+    Methods:
+        get_services: Returns a read-only snapshot of all services.
+        update: Updates a service atomically.
+        upsert: Stores a service under its own ID.
+        delete: Deletes a service.
+    """
+
+    def __init__(self, data: TextData | JsonData | RecordData | list[Service]):
+        super().__init__(data)
+        self._init_concurrency()
+
+    def save_snapshot(self, path: str) -> None:
+        with self._lock.read():
+            super().save_snapshot(path)
+
+    def get_services(self) -> Mapping[int, Service]:
+        """
+        Returns a read-only snapshot of all services, indexed by their ID.
+        """
+        return self._snapshot('services', lambda: MappingProxyType(dict(self.services)))
+
+    def update(self, id_: int, data: dict[str, Any]) -> Service:
+        with self._mutation():
+            return super().update(id_, data)
+
+    def upsert(self, service: Service) -> Service:
+        with self._mutation():
+            return super().upsert(service)
+
+    def delete(self, id_: int) -> None:
+        with self._mutation():
+            super().delete(id_)
+
+
+class ConcurrentUserRepo(_CopyOnWrite, UserRepo):
+    """
+    A `UserRepo` that can be shared between threads, see the module documentation.
+
+    Methods:
+        get_all_users: Returns a read-only snapshot of all users.
+        get_users_older_than: Returns the users older than a minimum age.
+        get_users_between_ages: Returns the users whose age is within a range.
+        delete: Deletes a user.
+    """
+
+    def __init__(self, data: TextData | JsonData | RecordData | list[User]):
+        super().__init__(data)
+        self._init_concurrency()
+
+    def save_snapshot(self, path: str) -> None:
+        with self._lock.read():
+            super().save_snapshot(path)
+
+    def get_all_users(self) -> Mapping[int, User]:
+        """
+        Returns a read-only snapshot of all users, indexed by their ID.
+        """
+        return self._snapshot('users', lambda: MappingProxyType(dict(self.users)))
+
+    def get_users_older_than(self, age_min: int, today: date | None = None) -> list[User]:
+        with self._lock.read():
+            return super().get_users_older_than(age_min, today)
+
+    def get_users_between_ages(self, age_min: int, age_max: int, today: date | None = None) -> list[User]:
+        with self._lock.read():
+            return super().get_users_between_ages(age_min, age_max, today)
+
+    def delete(self, id_: int) -> None:
+        with self._mutation():
+            super().delete(id_)
+
+
+class ConcurrentSubscriptionRepo(_CopyOnWrite, SubscriptionRepo):
+    """
+    A `SubscriptionRepo` that can be shared between threads, see the module documentation.
+
+    IDs are allocated by the thread-safe `IdAllocator`, so `reserve_ids` does not take the lock.
+
+    Methods:
+        get_subscriptions: Returns a read-only snapshot of all subscriptions.
+        get_all_subscriptions: Returns all subscriptions from the current snapshot.
+        get_all_active_subscriptions: Returns the active subscriptions from the current snapshot.
+        get_subscriptions_by_user_id: Retrieves the subscriptions of a user.
+        get_subscriptions_by_service_id: Retrieves the subscriptions of a service.
+        add_subscription: Adds a subscription atomically.
+        upsert: Stores a subscription under its own ID.
+        upsert_many: Stores several subscriptions atomically.
+        update: Updates a subscription atomically.
+        delete: Deletes a subscription.
+    """
+
+    def __init__(self, data: TextData | JsonData | RecordData | list[Subscription]):
+        super().__init__(data)
+        self._init_concurrency()
+
+    def save_snapshot(self, path: str) -> None:
+        with self._lock.read():
+            super().save_snapshot(path)
+
+    def get_subscriptions(self) -> Mapping[int, Subscription]:
+        """
+        Returns a read-only snapshot of all subscriptions, indexed by their ID.
+        """
+        return self._snapshot('subscriptions', lambda: MappingProxyType(dict(self.subscriptions)))
+
+    def get_all_subscriptions(self) -> list[Subscription]:
+        return list(self._snapshot('all', lambda: tuple(self.subscriptions.values())))
+
+    def get_all_active_subscriptions(self) -> list[Subscription]:
+        return list(self._snapshot('active', lambda: tuple(self.subscriptions[id_] for id_ in self._active_ids)))
+
+    def get_subscriptions_by_user_id(self, user_id: int) -> list[Subscription]:
+        with self._lock.read():
+            return super().get_subscriptions_by_user_id(user_id)
+
+    def get_subscriptions_by_service_id(self, service_id: int) -> list[Subscription]:
+        with self._lock.read():
+            return super().get_subscriptions_by_service_id(service_id)
+
+    def add_subscription(self, data: dict[str, Any] | Subscription) -> Subscription:
+        with self._mutation():
+            return super().add_subscription(data)
+
+    def upsert_many(self, subscriptions: list[Subscription]) -> list[Subscription]:
+        with self._mutation():
+            return super().upsert_many(subscriptions)
+
+    def upsert(self, subscription: Subscription) -> Subscription:
+        with self._mutation():
+            return super().upsert(subscription)
+
+    def update(self, id_: int, data: dict[str, Any]) -> Subscription:
+        with self._mutation():
+            return super().update(id_, data)
+
+    def delete(self, id_: int) -> None:
+        with self._mutation():
+            super().delete(id_)
@@ -0,0 +1,89 @@
+import threading
+
+from dataclasses import dataclass, field
+from typing import Iterable, Self
+
+
+@dataclass
+class IdAllocator:
+    """
+    Thread-safe, monotonic allocator of integer IDs.
+
+    The allocator keeps a high-water mark: every allocated ID is greater than all IDs allocated or
+    observed before, so IDs are never reused, not even after deletes.
+
+    Attributes:
+        high_water (int): The greatest ID allocated or observed so far, 0 if none.
+
+    Methods:
+        from_ids: Creates an allocator continuing after the greatest of the given IDs.
+        next_id: Allocates one ID.
+        reserve: Allocates a block of consecutive IDs.
+        observe: Raises the high-water mark to an ID that was assigned elsewhere.
+
+    Example:
+        ```python
+        allocator = IdAllocator.from_ids([1, 2, 7])
+        allocator.next_id()     # 8
+        allocator.reserve(3)    # range(9, 12)
+        ```
+    """
+
+    high_water: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+
+    @classmethod
+    def from_ids(cls, ids: Iterable[int | None]) -> Self:
+        """
+        Creates an allocator continuing after the greatest of the given IDs; None values are ignored.
+
+        Args:
+            ids (Iterable[int | None]): The IDs already in use.
+
+        Returns:
+            IdAllocator: The seeded allocator.
+        """
+        return cls(max((id_ for id_ in ids if id_ is not None), default=0))
+
+    def next_id(self) -> int:
+        """
+        Allocates one ID.
+
+        Returns:
+            int: The allocated ID.
+        """
+        with self._lock:
+            self.high_water += 1
+            return self.high_water
+
+    def reserve(self, count: int) -> range:
+        """
+        Allocates a block of consecutive IDs.
+
+        Args:
+            count (int): The number of IDs to allocate.
+
+        Returns:
+            range: The allocated IDs.
+
+        Raises:
+            ValueError: If the count is negative.
+        """
+        if count < 0:
+            raise ValueError("Count must not be negative")
+        with self._lock:
+            start = self.high_water + 1
+            self.high_water += count
+            return range(start, start + count)
+
+    def observe(self, id_: int | None) -> None:
+        """
+        Raises the high-water mark to an ID that was assigned elsewhere, e.g. by an upsert.
+
+        Args:
+            id_ (int | None): The assigned ID; None is ignored.
+        """
+        if id_ is not None and id_ > self.high_water:
+            with self._lock:
+                if id_ > self.high_water:
+                    self.high_water = id_
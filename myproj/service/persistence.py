@@ -0,0 +1,136 @@
+"""
+Write-back persistence for repositories: a binary snapshot plus a write-ahead journal.
+
+Opening a persistent repository loads its latest snapshot, replays the journal written since
+and attaches the journal, so that every later mutation is appended to it with group commit.
+Once the journal outgrows `compact_bytes`, `commit` compacts it: the repository is written to a
+new snapshot and the journal is emptied.
+
+ Example:
+        ```python
+        from myproj.service.persistence import PersistentRepo
+        from myproj.service.subscription import SubscriptionRepo
+
+        with PersistentRepo.open(SubscriptionRepo, 'data/subscriptions.snap', 'data/subscriptions.journal') as persistent:
+            user_service = UserService(user_repo, service_repo, persistent.repo)
+            user_service.subscribe_user_to_service(1, 2, 3)
+            persistent.commit()
+        ```
+"""
+
+import os
+
+from typing import Any, Self
+
+from myproj.file_repo.file_reader_factory import FactoryType, TextData, JsonData, RecordData
+from myproj.file_repo.journal import Journal
+from myproj.service.service import ServiceRepo
+from myproj.service.subscription import SubscriptionRepo
+from myproj.service.user import UserRepo
+
+_KINDS = {ServiceRepo: FactoryType.FROM_SERVICE, SubscriptionRepo: FactoryType.FROM_SUBSCRIPTION,
+          UserRepo: FactoryType.FROM_USER}
+
+
+class PersistentRepo:
+    """
+    A repository bound to a snapshot file and a journal.
+
+    Compaction is not synchronized with mutations: call `commit` and `compact` from the thread
+    that mutates the repository.
+
+    Attributes:
+        repo (ServiceRepo | SubscriptionRepo | UserRepo): The journaled repository.
+        journal (Journal): The journal attached to the repository.
+        snapshot_path (str): The path of the snapshot file.
+        compact_bytes (int): The journal size in bytes from which `commit` compacts.
+
+    Methods:
+        open: Loads a repository from its snapshot and journal.
+        commit: Syncs the pending journal entries and compacts an oversized journal.
+        compact: Writes a new snapshot and empties the journal.
+        close: Commits and detaches the journal.
+    """
+
+    def __init__(self, repo: ServiceRepo | SubscriptionRepo | UserRepo, journal: Journal, snapshot_path: str,
+                 compact_bytes: int = 64 * 1024 ** 2):
+        self.repo = repo
+        self.journal = journal
+        self.snapshot_path = snapshot_path
+        self.compact_bytes = compact_bytes
+        repo.attach_journal(journal)
+
+    @classmethod
+    def open(cls, repo_cls: type[ServiceRepo] | type[SubscriptionRepo] | type[UserRepo], snapshot_path: str,
+             journal_path: str, initial_data: TextData | JsonData | RecordData | list[Any] | None = None,
+             compact_bytes: int = 64 * 1024 ** 2, batch_size: int = 1024, max_delay: float = 0.05) -> Self:
+        """
+        Loads a repository from its snapshot and journal.
+
+        Args:
+            repo_cls (type[ServiceRepo] | type[SubscriptionRepo] | type[UserRepo]): The repository class.
+            snapshot_path (str): The path of the snapshot file.
+            journal_path (str): The path of the journal file; it is created if missing.
+            initial_data (TextData | JsonData | RecordData | list | None): The data to start from when
+                there is no snapshot yet, e.g. the result of `DataProcessor.process`; an empty
+                repository by default. The first snapshot is written right away.
+            compact_bytes (int): The journal size in bytes from which `commit` compacts.
+            batch_size (int): The number of pending journal entries that triggers a group commit.
+            max_delay (float): The age in seconds of the oldest pending journal entry that
+                triggers a group commit.
+
+        Returns:
+            PersistentRepo: The repository with the journal replayed and attached.
+
+        Raises:
+            ValueError: If the repository class is not supported, or the snapshot or the journal
+                is malformed.
+        """
+        kind = next((kind for base, kind in _KINDS.items() if issubclass(repo_cls, base)), None)
+        if kind is None:
+            raise ValueError(f"Unsupported repository class: {repo_cls.__name__}")
+        has_snapshot = os.path.exists(snapshot_path)
+        if has_snapshot:
+            repo = repo_cls.load_snapshot(snapshot_path)
+        else:
+            repo = repo_cls(initial_data if initial_data is not None else [])
+        journal = Journal(journal_path, kind, batch_size, max_delay)
+        journal.replay(repo)
+        persistent = cls(repo, journal, snapshot_path, compact_bytes)
+        if not has_snapshot:
+            # The initial data is not in the journal, so it has to be persisted right away
+            persistent.compact()
+        return persistent
+
+    def commit(self) -> None:
+        """
+        Syncs the pending journal entries and compacts the journal once it reaches `compact_bytes`.
+        """
+        self.journal.commit()
+        if self.journal.size() >= self.compact_bytes:
+            self.compact()
+
+    def compact(self) -> None:
+        """
+        Writes the repository to a new snapshot and empties the journal.
+
+        The snapshot replaces the previous one atomically before the journal is emptied, so a
+        crash in between only leaves entries that are already part of the snapshot; replaying
+        them again is harmless.
+        """
+        self.journal.commit()
+        self.repo.save_snapshot(self.snapshot_path)
+        self.journal.truncate()
+
+    def close(self) -> None:
+        """
+        Commits the pending journal entries, closes the journal and detaches it from the repository.
+        """
+        self.journal.close()
+        self.repo.attach_journal(None)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,85 @@
+"""
+Incremental reload of subscription data files into an existing repository.
+
+`SubscriptionReloader` reads only the lines appended to a CSV/TXT file since its previous call
+(see `TailReader`), validates them with the same validator as `DataProcessor` and upserts the
+resulting subscriptions, so the cost of a refresh is proportional to the new rows instead of the
+size of the file. Rows carry their own ID, so a row repeating an existing ID replaces that
+subscription and keeps the repository indexes consistent.
+
+ Example:
+        ```python
+        from myproj.service.reload import SubscriptionReloader
+
+        reloader = SubscriptionReloader(subscription_repo)
+        reloader.reload('data/data_subscription.csv')      # loads the whole file once
+        result = reloader.reload('data/data_subscription.csv')
+        print(result.upserted, result.rejected)           # only the rows appended since
+        ```
+"""
+
+from dataclasses import dataclass
+
+from myproj.file_repo.file_reader_factory import DataProcessor, DataFormat, FactoryType, TextData
+from myproj.file_repo.tail import TailReader
+from myproj.service.subscription import SubscriptionRepo, iter_subscriptions
+from myproj.service.subscription_store import SubscriptionStore
+
+
+@dataclass
+class ReloadResult:
+    """
+    The outcome of a reload.
+
+    Attributes:
+        upserted (int): The number of subscriptions added or replaced.
+        rejected (int): The number of new lines that failed validation.
+        reset (bool): Whether the file was read from the start again because it shrank, was
+            replaced or was rewritten.
+    """
+    upserted: int = 0
+    rejected: int = 0
+    reset: bool = False
+
+
+class SubscriptionReloader:
+    """
+    Applies the rows appended to subscription files to a repository.
+
+    Subscriptions are only ever added or replaced: when a file is rewritten, its rows are applied
+    again from the start, but subscriptions whose rows were removed from the file stay in the
+    repository.
+
+    Args:
+        repo (SubscriptionRepo | SubscriptionStore): The repository to update.
+        reader (TailReader | None): The reader remembering the file positions; a new one by default.
+
+    Methods:
+        reload: Applies the rows appended to a file since the previous call.
+    """
+
+    def __init__(self, repo: SubscriptionRepo | SubscriptionStore, reader: TailReader | None = None):
+        self.repo = repo
+        self.reader = reader or TailReader()
+        self.validator = DataProcessor.create_processor(DataFormat.TEXT, FactoryType.FROM_SUBSCRIPTION).validator
+
+    def reload(self, path: str) -> ReloadResult:
+        """
+        Applies the rows appended to a file since the previous call.
+
+        Args:
+            path (str): The path to the subscription CSV/TXT file.
+
+        Returns:
+            ReloadResult: The number of upserted and rejected rows.
+
+        Raises:
+            AttributeError: If the file does not have a '.csv' or '.txt' extension.
+            FileNotFoundError: If the file is not found.
+        """
+        lines, reset = self.reader.read_new_lines(path)
+        rows = list(self.validator.validate_fields_iter(lines))
+        upsert = self.repo.upsert
+        for subscription in iter_subscriptions(TextData(rows)):
+            upsert(subscription)
+        return ReloadResult(len(rows), len(lines) - len(rows), reset)
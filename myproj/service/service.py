@@ -1,7 +1,10 @@
 from decimal import Decimal
-from typing import Any
+from sys import intern
+from typing import Any, Self
 
-from myproj.file_repo.file_reader_factory import JsonData, TextData
+from myproj.file_repo.file_reader_factory import FactoryType, JsonData, RecordData, TextData
+from myproj.file_repo.journal import Journal
+from myproj.file_repo.snapshot import read_snapshot, write_snapshot
 from myproj.model.service import Service
 
 
@@ -15,27 +18,43 @@ class ServiceRepo:
     Attributes:
         services (dict): A dictionary of services indexed by their ID.
 
+    Categories read from `TextData` and `JsonData` are interned, so services of the same category
+    share one string.
+
+    Once a `Journal` is attached with `attach_journal`, every mutation made through `upsert`,
+    `update` and `delete` is appended to it.
+
     Args:
-        data (TextData | JsonData | list[Service]):
-            The initial data to populate the repository. Can be in the form of `TextData`, `JsonData`, or a list of `Service` instances.
+        data (TextData | JsonData | RecordData | list[Service]):
+            The initial data to populate the repository. Can be in the form of `TextData`, `JsonData`, `RecordData`, or a list of `Service` instances.
     """
 
-    def __init__(self, data: TextData | JsonData | list[Service]):
+    def __init__(self, data: TextData | JsonData | RecordData | list[Service]):
         """
         Initializes the ServiceRepo with data and converts it into `Service` instances.
 
         Args:
-            data (TextData | JsonData | list[Service]):
+            data (TextData | JsonData | RecordData | list[Service]):
                 The data to initialize the repository with.
         """
         self.services = self._data_convert_to_service(data)
+        self.journal: Journal | None = None
+
+    def attach_journal(self, journal: Journal | None) -> None:
+        """
+        Records all further mutations in the given journal; None stops journaling.
 
-    def _data_convert_to_service(self, data: TextData | JsonData | list[Service]) -> dict:
+        Args:
+            journal (Journal | None): A journal of kind `FactoryType.FROM_SERVICE`.
+        """
+        self.journal = journal
+
+    def _data_convert_to_service(self, data: TextData | JsonData | RecordData | list[Service]) -> dict:
         """
         Converts the provided data into a dictionary of `Service` instances.
 
         Args:
-            data (TextData | JsonData | list[Service]):
+            data (TextData | JsonData | RecordData | list[Service]):
                 The data to convert.
 
         Returns:
@@ -46,11 +65,14 @@ class ServiceRepo:
         """
         if isinstance(data, JsonData):
             data = data.get_content()
-            transformed_data = [Service(int(value[0]), value[1], value[2], Decimal(value[3])) for key, value in data.items()]
+            transformed_data = [Service(int(value[0]), value[1], intern(value[2]), Decimal(value[3])) for key, value in data.items()]
 
         elif isinstance(data, TextData):
             data = data.get_content()
-            transformed_data = [Service(int(item[0]), item[1], item[2], Decimal(item[3])) for item in data]
+            transformed_data = [Service(int(item[0]), item[1], intern(item[2]), Decimal(item[3])) for item in data]
+
+        elif isinstance(data, RecordData):
+            transformed_data = [Service(*record) for record in data.get_content()]
 
         elif isinstance(data, list) and all(isinstance(item, Service) for item in data):
             transformed_data = data
@@ -60,6 +82,35 @@ class ServiceRepo:
 
         return {service.id_: service for service in transformed_data}
 
+    def save_snapshot(self, path: str) -> None:
+        """
+        Writes all services to a binary snapshot file, see `myproj.file_repo.snapshot`.
+
+        Args:
+            path (str): The path of the snapshot file.
+
+        Raises:
+            ValueError: If a value cannot be represented in the snapshot format.
+        """
+        write_snapshot(path, FactoryType.FROM_SERVICE, self.services.values())
+
+    @classmethod
+    def load_snapshot(cls, path: str) -> Self:
+        """
+        Creates a ServiceRepo from a snapshot written by `save_snapshot`.
+
+        Args:
+            path (str): The path of the snapshot file.
+
+        Returns:
+            ServiceRepo: A repository holding the services of the snapshot.
+
+        Raises:
+            FileNotFoundError: If the file is not found.
+            ValueError: If the file is not a service snapshot.
+        """
+        return cls(read_snapshot(path, FactoryType.FROM_SERVICE))
+
     def get_services(self) -> dict:
         """
         Retrieves all services in the repository.
@@ -93,6 +144,9 @@ class ServiceRepo:
         """
         Updates a service with the given ID using the provided data.
 
+        If `data` changes the ID, the service moves to the new ID, replacing any service stored
+        under it.
+
         Args:
             id_ (int): The ID of the service to update.
             data (dict[str, Any]): A dictionary containing the updated data.
@@ -105,9 +159,29 @@ class ServiceRepo:
         """
         service_to_update = self.find_by_id(id_)
         updated_service = service_to_update.update(data)
+        if updated_service.id_ != id_:
+            self.delete(id_)
+            return self.upsert(updated_service)
         self.services[id_] = updated_service
+        if self.journal is not None:
+            self.journal.record_put(updated_service)
         return updated_service
 
+    def upsert(self, service: Service) -> Service:
+        """
+        Stores a service under its own ID, replacing any service with the same ID.
+
+        Args:
+            service (Service): The service to store.
+
+        Returns:
+            Service: The stored `Service` instance.
+        """
+        self.services[service.id_] = service
+        if self.journal is not None:
+            self.journal.record_put(service)
+        return service
+
     def delete(self, id_: int) -> None:
         """
         Deletes a service with the specified ID.
@@ -122,3 +196,5 @@ class ServiceRepo:
             raise KeyError(f"Service Not Found")
 
         self.services.pop(id_)
+        if self.journal is not None:
+            self.journal.record_delete(id_)
@@ -1,8 +1,54 @@
 from decimal import Decimal
-from typing import Any
+from typing import Any, Iterator, Self
 
-from myproj.file_repo.file_reader_factory import TextData, JsonData
+from myproj.file_repo.file_reader_factory import FactoryType, TextData, JsonData, RecordData
+from myproj.file_repo.journal import Journal
+from myproj.file_repo.snapshot import read_snapshot, write_snapshot
 from myproj.model.subscription import Subscription
+from myproj.service.id_allocator import IdAllocator
+
+
+def iter_subscriptions(data: TextData | JsonData | RecordData | list[Subscription]) -> Iterator[Subscription]:
+    """
+    Converts the provided data into a stream of `Subscription` instances.
+
+    Args:
+        data (TextData | JsonData | RecordData | list[Subscription]):
+            The data to convert.
+
+    Returns:
+        Iterator[Subscription]: An iterator over the converted subscriptions.
+
+    Raises:
+        ValueError: If the provided data is of an unsupported type.
+    """
+    if isinstance(data, JsonData):
+        rows = data.get_content().values()
+
+    elif isinstance(data, TextData):
+        rows = data.get_content()
+
+    elif isinstance(data, RecordData):
+        return (Subscription(*record) for record in data.get_content())
+
+    elif isinstance(data, list) and all(isinstance(item, Subscription) for item in data):
+        return iter(data)
+
+    else:
+        raise ValueError("Unsupported data type")
+
+    return (
+        Subscription(
+            int(item[0]),
+            int(item[1]),
+            int(item[2]),
+            Decimal(item[3]),
+            int(item[-2]),
+            bool(int(item[-1]))
+        )
+        for item in rows
+    )
+
 
 class SubscriptionRepo:
     """
@@ -13,28 +59,85 @@ class SubscriptionRepo:
 
     Attributes:
         subscriptions (dict): A dictionary of subscriptions indexed by their ID.
+        ids (IdAllocator): Hands out the IDs of new subscriptions, after the greatest ID stored so far.
+
+    Secondary indexes (user ID, service ID and active flag to subscription IDs) are maintained by
+    `add_subscription`, `upsert`, `update` and `delete`, so lookups by those keys cost O(k) in the size of
+    the result. Changes made directly on stored `Subscription` instances or on the `subscriptions`
+    dictionary bypass the indexes and must go through the repository methods instead.
+
+    Once a `Journal` is attached with `attach_journal`, every mutation made through `upsert`
+    (and therefore `add_subscription`), `update` and `delete` is appended to it.
 
     Args:
-        data (TextData | JsonData | list[Subscription]):
-            The initial data to populate the repository. Can be in the form of `TextData`, `JsonData`, or a list of `Subscription` instances.
+        data (TextData | JsonData | RecordData | list[Subscription]):
+            The initial data to populate the repository. Can be in the form of `TextData`, `JsonData`, `RecordData`, or a list of `Subscription` instances.
     """
 
-    def __init__(self, data: TextData | JsonData | list[Subscription]):
+    def __init__(self, data: TextData | JsonData | RecordData | list[Subscription]):
         """
         Initializes the SubscriptionRepo with data and converts it into `Subscription` instances.
 
         Args:
-            data (TextData | JsonData | list[Subscription]):
+            data (TextData | JsonData | RecordData | list[Subscription]):
                 The data to initialize the repository with.
         """
         self.subscriptions = self._data_convert_to_subscription(data)
+        self.journal: Journal | None = None
+        self.ids = IdAllocator.from_ids(self.subscriptions)
+        self._by_user_id: dict[int, dict[int, None]] = {}
+        self._by_service_id: dict[int, dict[int, None]] = {}
+        self._active_ids: dict[int, None] = {}
+        for id_, subscription in self.subscriptions.items():
+            self._index(id_, subscription)
+
+    def attach_journal(self, journal: Journal | None) -> None:
+        """
+        Records all further mutations in the given journal; None stops journaling.
 
-    def _data_convert_to_subscription(self, data: TextData | JsonData | list[Subscription]) -> dict:
+        Args:
+            journal (Journal | None): A journal of kind `FactoryType.FROM_SUBSCRIPTION`.
+        """
+        self.journal = journal
+
+    def _index(self, id_: int, subscription: Subscription) -> None:
+        """
+        Adds a subscription to the secondary indexes.
+
+        Index values are insertion-ordered dictionaries used as ordered sets, so query results
+        keep the order in which subscriptions were indexed.
+
+        Args:
+            id_ (int): The key under which the subscription is stored.
+            subscription (Subscription): The subscription to index.
+        """
+        self._by_user_id.setdefault(subscription.user_id, {})[id_] = None
+        self._by_service_id.setdefault(subscription.service_id, {})[id_] = None
+        if subscription.is_active():
+            self._active_ids[id_] = None
+
+    def _unindex(self, id_: int, subscription: Subscription) -> None:
+        """
+        Removes a subscription from the secondary indexes.
+
+        Args:
+            id_ (int): The key under which the subscription is stored.
+            subscription (Subscription): The subscription to remove.
+        """
+        for index, key in ((self._by_user_id, subscription.user_id), (self._by_service_id, subscription.service_id)):
+            ids = index.get(key)
+            if ids is not None:
+                ids.pop(id_, None)
+                if not ids:
+                    del index[key]
+        self._active_ids.pop(id_, None)
+
+    def _data_convert_to_subscription(self, data: TextData | JsonData | RecordData | list[Subscription]) -> dict:
         """
         Converts the provided data into a dictionary of `Subscription` instances.
 
         Args:
-            data (TextData | JsonData | list[Subscription]):
+            data (TextData | JsonData | RecordData | list[Subscription]):
                 The data to convert.
 
         Returns:
@@ -43,41 +146,36 @@ class SubscriptionRepo:
         Raises:
             ValueError: If the provided data is of an unsupported type.
         """
-        if isinstance(data, JsonData):
-            data = data.get_content()
-            transformed_data = [
-                Subscription(
-                    int(value[0]),
-                    int(value[1]),
-                    int(value[2]),
-                    Decimal(value[3]),
-                    int(value[-2]),
-                    bool(int(value[-1]))
-                )
-                for key, value in data.items()
-            ]
-
-        elif isinstance(data, TextData):
-            data = data.get_content()
-            transformed_data = [
-                Subscription(
-                    int(item[0]),
-                    int(item[1]),
-                    int(item[2]),
-                    Decimal(item[3]),
-                    int(item[-2]),
-                    bool(int(item[-1]))
-                )
-                for item in data
-            ]
-
-        elif isinstance(data, list) and all(isinstance(item, Subscription) for item in data):
-            transformed_data = data
+        return {subscription.id_: subscription for subscription in iter_subscriptions(data)}
 
-        else:
-            raise ValueError("Unsupported data type")
+    def save_snapshot(self, path: str) -> None:
+        """
+        Writes all subscriptions to a binary snapshot file, see `myproj.file_repo.snapshot`.
 
-        return {subscription.id_: subscription for subscription in transformed_data}
+        Args:
+            path (str): The path of the snapshot file.
+
+        Raises:
+            ValueError: If a value cannot be represented in the snapshot format.
+        """
+        write_snapshot(path, FactoryType.FROM_SUBSCRIPTION, self.subscriptions.values())
+
+    @classmethod
+    def load_snapshot(cls, path: str) -> Self:
+        """
+        Creates a SubscriptionRepo from a snapshot written by `save_snapshot`.
+
+        Args:
+            path (str): The path of the snapshot file.
+
+        Returns:
+            SubscriptionRepo: A repository holding the subscriptions of the snapshot.
+
+        Raises:
+            FileNotFoundError: If the file is not found.
+            ValueError: If the file is not a subscription snapshot.
+        """
+        return cls(read_snapshot(path, FactoryType.FROM_SUBSCRIPTION))
 
     def get_subscriptions(self) -> dict:
         """
@@ -119,7 +217,7 @@ class SubscriptionRepo:
         Returns:
             Subscription: The newly added `Subscription` instance.
         """
-        subscription_id = len(self.subscriptions) + 1
+        subscription_id = self.ids.next_id()
 
         if isinstance(data, Subscription):
             subscription_data = data
@@ -128,8 +226,79 @@ class SubscriptionRepo:
             data['id_'] = subscription_id
             subscription_data = Subscription(**data)
 
-        self.subscriptions[subscription_data.id_] = subscription_data
-        return subscription_data
+        return self.upsert(subscription_data)
+
+    def reserve_ids(self, count: int) -> range:
+        """
+        Reserves a block of consecutive IDs for new subscriptions.
+
+        The IDs come from the same allocator as those of `add_subscription`, so they are never
+        handed out twice.
+
+        Args:
+            count (int): The number of IDs to reserve.
+
+        Returns:
+            range: The reserved IDs.
+        """
+        return self.ids.reserve(count)
+
+    def upsert_many(self, subscriptions: list[Subscription]) -> list[Subscription]:
+        """
+        Stores several subscriptions under their own IDs, see `upsert`.
+
+        The subscriptions are added to the dictionary and to each index dictionary in one update
+        per key, and journaled as one group. When the same ID occurs more than once, the last
+        subscription with it is stored.
+
+        Args:
+            subscriptions (list[Subscription]): The subscriptions to store.
+
+        Returns:
+            list[Subscription]: The stored `Subscription` instances.
+        """
+        batch = {subscription.id_: subscription for subscription in subscriptions}
+        self.ids.observe(max((id_ for id_ in batch if id_ is not None), default=None))
+        for id_ in batch.keys() & self.subscriptions.keys():
+            self._unindex(id_, self.subscriptions[id_])
+        self.subscriptions.update(batch)
+
+        by_user_id: dict[int, list[int]] = {}
+        by_service_id: dict[int, list[int]] = {}
+        for id_, subscription in batch.items():
+            by_user_id.setdefault(subscription.user_id, []).append(id_)
+            by_service_id.setdefault(subscription.service_id, []).append(id_)
+        for index, groups in ((self._by_user_id, by_user_id), (self._by_service_id, by_service_id)):
+            for key, ids in groups.items():
+                index.setdefault(key, {}).update(dict.fromkeys(ids))
+        self._active_ids.update(dict.fromkeys(id_ for id_, subscription in batch.items() if subscription.is_active()))
+
+        if self.journal is not None:
+            self.journal.record_put_many(batch.values())
+        return subscriptions
+
+    def upsert(self, subscription: Subscription) -> Subscription:
+        """
+        Stores a subscription under its own ID, replacing any subscription with the same ID.
+
+        Unlike `add_subscription`, the ID of the subscription is kept. The secondary indexes are
+        updated accordingly.
+
+        Args:
+            subscription (Subscription): The subscription to store.
+
+        Returns:
+            Subscription: The stored `Subscription` instance.
+        """
+        self.ids.observe(subscription.id_)
+        replaced = self.subscriptions.get(subscription.id_)
+        if replaced is not None:
+            self._unindex(subscription.id_, replaced)
+        self.subscriptions[subscription.id_] = subscription
+        self._index(subscription.id_, subscription)
+        if self.journal is not None:
+            self.journal.record_put(subscription)
+        return subscription
 
     def get_subscriptions_by_user_id(self, user_id: int) -> list[Subscription]:
         """
@@ -141,7 +310,7 @@ class SubscriptionRepo:
         Returns:
             list[Subscription]: A list of `Subscription` instances associated with the given user ID.
         """
-        return [value for key, value in self.subscriptions.items() if value.get_user_id() == user_id]
+        return [self.subscriptions[id_] for id_ in self._by_user_id.get(user_id, ())]
 
     def get_subscriptions_by_service_id(self, service_id: int) -> list[Subscription]:
         """
@@ -153,7 +322,7 @@ class SubscriptionRepo:
         Returns:
             list[Subscription]: A list of `Subscription` instances associated with the given service ID.
         """
-        return [value for key, value in self.subscriptions.items() if value.get_service_id() == service_id]
+        return [self.subscriptions[id_] for id_ in self._by_service_id.get(service_id, ())]
 
     def get_all_subscriptions(self) -> list[Subscription]:
         """
@@ -171,12 +340,15 @@ class SubscriptionRepo:
         Returns:
             list[Subscription]: A list of all active `Subscription` instances.
         """
-        return [value for value in self.subscriptions.values() if value.is_active()]
+        return [self.subscriptions[id_] for id_ in self._active_ids]
 
     def update(self, id_: int, data: dict[str, Any]) -> Subscription:
         """
         Updates an existing subscription with the provided data.
 
+        If `data` changes the ID, the subscription moves to the new ID, replacing any subscription
+        stored under it.
+
         Args:
             id_ (int): The ID of the subscription to update.
             data (dict[str, Any]): A dictionary containing the updated data.
@@ -189,7 +361,16 @@ class SubscriptionRepo:
         """
         subscription_to_update = self.find_by_id(id_)
         updated_subscription = subscription_to_update.update(data)
+        if updated_subscription.id_ != id_:
+            self.delete(id_)
+            return self.upsert(updated_subscription)
+        if ((subscription_to_update.user_id, subscription_to_update.service_id, subscription_to_update.is_active())
+                != (updated_subscription.user_id, updated_subscription.service_id, updated_subscription.is_active())):
+            self._unindex(id_, subscription_to_update)
+            self._index(id_, updated_subscription)
         self.subscriptions[id_] = updated_subscription
+        if self.journal is not None:
+            self.journal.record_put(updated_subscription)
         return updated_subscription
 
     def delete(self, id_: int) -> None:
@@ -205,4 +386,6 @@ class SubscriptionRepo:
         if id_ not in self.subscriptions:
             raise KeyError("Subscription Not Found")
 
-        self.subscriptions.pop(id_)
+        self._unindex(id_, self.subscriptions.pop(id_))
+        if self.journal is not None:
+            self.journal.record_delete(id_)
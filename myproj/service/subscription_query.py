@@ -0,0 +1,190 @@
+"""
+Vectorized bulk queries over subscription data.
+
+Requires the optional `numpy` package. Columns are copied out of a `SubscriptionStore` (or built
+from a `SubscriptionRepo`) once, after which group-by aggregates and boolean filters run as NumPy
+array operations instead of Python loops.
+
+ Example:
+        ```python
+        from myproj.service.subscription_query import SubscriptionQuery
+
+        query = SubscriptionQuery.from_repo(subscription_repo)
+
+        # Active subscriptions per service
+        query.count_by('service_id', query.active_mask())
+
+        # Total monthly quantity per user
+        query.sum_by('user_id', 'quantity_per_month')
+
+        # Total discount per user, as Decimal
+        query.sum_by('user_id', 'discount')
+
+        # IDs of subscriptions with a discount above 10
+        query.ids(query.discount_greater_than(Decimal('10')))
+        ```
+"""
+
+from decimal import Decimal
+from typing import Self
+
+try:
+    import numpy as np
+except ImportError:     # pragma: no cover
+    np = None
+
+from myproj.service.subscription import SubscriptionRepo
+from myproj.service.subscription_store import SubscriptionStore
+
+
+class SubscriptionQuery:
+    """
+    Read-only, NumPy-backed view of subscription data for vectorized reporting.
+
+    The query works on a snapshot: later changes to the source repository are not reflected.
+
+    Attributes:
+        columns (dict[str, numpy.ndarray]): The `user_id`, `service_id`, `quantity_per_month`,
+            `discount`, `id_` and `active` columns. `discount` holds fixed-point integers with
+            `SubscriptionStore.DISCOUNT_PLACES` decimals and `SubscriptionStore.NO_DISCOUNT` for
+            subscriptions without a discount.
+
+    Args:
+        store (SubscriptionStore): The store whose columns are copied into the query.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+    """
+
+    def __init__(self, store: SubscriptionStore):
+        if np is None:
+            raise ImportError("NumPy is required for SubscriptionQuery")
+        self.columns = {name: np.frombuffer(column, dtype=column.typecode).copy()
+                        for name, column in store.columns().items()}
+
+    @classmethod
+    def from_repo(cls, repo: SubscriptionRepo | SubscriptionStore) -> Self:
+        """
+        Creates a query from a subscription repository or store.
+
+        The query keeps discounts in the fixed-point column of `SubscriptionStore`, so discounts of
+        a `SubscriptionRepo` may have at most `SubscriptionStore.DISCOUNT_PLACES` decimal places.
+
+        Args:
+            repo (SubscriptionRepo | SubscriptionStore): The source of the subscription data.
+
+        Returns:
+            SubscriptionQuery: A query over a snapshot of the data.
+
+        Raises:
+            ValueError: If a discount has too many decimal places or a value is out of range.
+        """
+        if isinstance(repo, SubscriptionRepo):
+            repo = SubscriptionStore(repo.get_all_subscriptions())
+        return cls(repo)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of subscriptions in the query.
+        """
+        return len(self.columns['id_'])
+
+    # ------------------
+    # MASKS
+    # ------------------
+
+    def active_mask(self) -> 'np.ndarray':
+        """
+        Returns a boolean mask selecting active subscriptions.
+        """
+        return self.columns['active'] == 1
+
+    def equal_mask(self, column: str, value: int) -> 'np.ndarray':
+        """
+        Returns a boolean mask selecting subscriptions whose column equals the given value.
+
+        Args:
+            column (str): The name of the column, e.g. 'service_id' or 'user_id'.
+            value (int): The value to compare against.
+        """
+        return self.columns[column] == value
+
+    def discount_greater_than(self, value: Decimal) -> 'np.ndarray':
+        """
+        Returns a boolean mask selecting subscriptions with a discount strictly greater than the value.
+
+        Subscriptions without a discount are never selected.
+
+        Args:
+            value (Decimal): The discount threshold.
+        """
+        discount = self.columns['discount']
+        threshold = Decimal(value).scaleb(SubscriptionStore.DISCOUNT_PLACES)
+        return (discount > int(threshold.to_integral_value(rounding='ROUND_FLOOR'))) & (discount != SubscriptionStore.NO_DISCOUNT)
+
+    # ------------------
+    # AGGREGATES
+    # ------------------
+
+    def ids(self, mask: 'np.ndarray | None' = None) -> list[int]:
+        """
+        Returns the IDs of the selected subscriptions.
+
+        Args:
+            mask (numpy.ndarray | None): A boolean mask; all subscriptions when omitted.
+        """
+        ids = self.columns['id_']
+        return (ids if mask is None else ids[mask]).tolist()
+
+    def count_by(self, key: str, mask: 'np.ndarray | None' = None) -> dict[int, int]:
+        """
+        Counts the selected subscriptions per value of a key column.
+
+        Args:
+            key (str): The column to group by, e.g. 'service_id'.
+            mask (numpy.ndarray | None): A boolean mask; all subscriptions when omitted.
+
+        Returns:
+            dict[int, int]: A dictionary mapping key values to subscription counts.
+        """
+        keys = self.columns[key]
+        if mask is not None:
+            keys = keys[mask]
+        values, counts = np.unique(keys, return_counts=True)
+        return dict(zip(values.tolist(), counts.tolist()))
+
+    def sum_by(self, key: str, value: str, mask: 'np.ndarray | None' = None) -> dict[int, int | Decimal]:
+        """
+        Sums a value column of the selected subscriptions per value of a key column.
+
+        Sums are exact: they are computed with 64-bit integers, or with Python integers when the
+        selected values could overflow 64 bits. Discounts are summed over the selected subscriptions
+        that have one and returned as `Decimal`; keys whose subscriptions have no discount are
+        left out.
+
+        Args:
+            key (str): The column to group by, e.g. 'user_id'.
+            value (str): The column to sum, e.g. 'quantity_per_month' or 'discount'.
+            mask (numpy.ndarray | None): A boolean mask; all subscriptions when omitted.
+
+        Returns:
+            dict[int, int | Decimal]: A dictionary mapping key values to sums.
+        """
+        keys = self.columns[key]
+        values = self.columns[value].astype(np.int64)
+        if value == 'discount':
+            has_discount = values != SubscriptionStore.NO_DISCOUNT
+            mask = has_discount if mask is None else mask & has_discount
+        if mask is not None:
+            keys, values = keys[mask], values[mask]
+        if not len(keys):
+            return {}
+        order = np.argsort(keys, kind='stable')
+        keys, values = keys[order], values[order]
+        if max(-int(values.min()), int(values.max())) * len(values) >= 2 ** 63:
+            values = values.astype(object)
+        starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+        groups, sums = keys[starts].tolist(), np.add.reduceat(values, starts).tolist()
+        if value == 'discount':
+            sums = [Decimal(total).scaleb(-SubscriptionStore.DISCOUNT_PLACES) for total in sums]
+        return dict(zip(groups, sums))
@@ -0,0 +1,512 @@
+from array import array
+from decimal import Decimal
+from typing import Any, Iterator, Self
+
+from myproj.file_repo.file_reader_factory import FactoryType, TextData, JsonData, RecordData
+from myproj.file_repo.snapshot import read_snapshot, write_snapshot
+from myproj.model.subscription import Subscription
+from myproj.service.id_allocator import IdAllocator
+from myproj.service.subscription import iter_subscriptions
+
+
+class SubscriptionStore:
+    """
+    Columnar, array-backed alternative to `SubscriptionRepo`.
+
+    Subscriptions are kept as parallel `array` columns instead of one `Subscription` dataclass per
+    row, which cuts memory use by roughly an order of magnitude on large tables. The store exposes
+    the same API as `SubscriptionRepo`; `Subscription` objects are materialized only when rows are
+    accessed, so mutating a returned instance does not change the store; use `update` instead.
+
+    Columns:
+        user_id, service_id, quantity_per_month, id_ (array('q')): Integer fields; values must fit in
+            a signed 64-bit integer.
+        discount (array('q')): The discount as a fixed-point integer with `DISCOUNT_PLACES` decimals, or
+            `NO_DISCOUNT` when the subscription has none.
+        active (array('b')): 1 for active, 0 for inactive and `DELETED` for removed rows.
+
+    New subscriptions get their IDs from the `ids` allocator, after the greatest ID stored so far.
+    Deleted rows are tombstoned and the columns are compacted once more than half the rows are
+    dead. Row lookup by ID goes through a dense `array('i')` keyed by ID, with a dictionary fallback
+    for IDs far beyond the number of rows. Lookups by user and service ID go through posting lists:
+    dictionaries mapping each key to an `array('i')` of its live rows.
+
+    Args:
+        data (TextData | JsonData | RecordData | list[Subscription]):
+            The initial data to populate the store. Can be in the form of `TextData`, `JsonData`, `RecordData`, or a list of `Subscription` instances.
+    """
+
+    DISCOUNT_PLACES = 2
+    NO_DISCOUNT = -2 ** 63
+    DELETED = -1
+
+    def __init__(self, data: TextData | JsonData | RecordData | list[Subscription]):
+        """
+        Initializes the SubscriptionStore with data and converts it into columns.
+
+        Args:
+            data (TextData | JsonData | RecordData | list[Subscription]):
+                The data to initialize the store with.
+        """
+        self._user_id = array('q')
+        self._service_id = array('q')
+        self._quantity_per_month = array('q')
+        self._discount = array('q')
+        self._id = array('q')
+        self._active = array('b')
+        self._row_by_id = array('i')
+        self._sparse_rows: dict[int, int] = {}
+        self._rows_by_user_id: dict[int, array] = {}
+        self._rows_by_service_id: dict[int, array] = {}
+        self._deleted = 0
+        self.ids = IdAllocator()
+        for subscription in iter_subscriptions(data):
+            self._put(subscription)
+
+    # ------------------
+    # ROW STORAGE
+    # ------------------
+
+    def _row_of(self, id_: int) -> int:
+        """
+        Returns the row holding the subscription with the given ID, or -1 if there is none.
+        """
+        if 0 <= id_ < len(self._row_by_id):
+            return self._row_by_id[id_]
+        return self._sparse_rows.get(id_, -1)
+
+    def _set_row_of(self, id_: int, row: int) -> None:
+        """
+        Records the row of the subscription with the given ID; a row of -1 removes the entry.
+
+        The dense lookup array grows to cover new IDs as long as it stays proportional to the number
+        of rows; other IDs are kept in a dictionary.
+        """
+        size = len(self._row_by_id)
+        if id_ >= size and 0 <= id_ <= 2 * len(self._id) + 1024:
+            self._row_by_id.extend(array('i', [-1]) * (id_ + 1 - size))
+            size = id_ + 1
+        if 0 <= id_ < size:
+            self._row_by_id[id_] = row
+        elif row < 0:
+            self._sparse_rows.pop(id_, None)
+        else:
+            self._sparse_rows[id_] = row
+
+    def _index_row(self, row: int, user_id: int, service_id: int) -> None:
+        """
+        Adds a row to the posting lists of its user and service.
+        """
+        self._rows_by_user_id.setdefault(user_id, array('i')).append(row)
+        self._rows_by_service_id.setdefault(service_id, array('i')).append(row)
+
+    def _unindex_row(self, row: int) -> None:
+        """
+        Removes a row from the posting lists of its user and service.
+        """
+        for index, key in ((self._rows_by_user_id, self._user_id[row]),
+                           (self._rows_by_service_id, self._service_id[row])):
+            rows = index[key]
+            rows.remove(row)
+            if not rows:
+                del index[key]
+
+    @classmethod
+    def _encode_discount(cls, discount: Decimal | None) -> int:
+        """
+        Converts a discount into its fixed-point column value.
+
+        Raises:
+            ValueError: If the discount has more decimal places than the column can hold.
+        """
+        if discount is None:
+            return cls.NO_DISCOUNT
+        scaled = Decimal(discount).scaleb(cls.DISCOUNT_PLACES)
+        if scaled != scaled.to_integral_value():
+            raise ValueError("Discount precision not supported")
+        return int(scaled)
+
+    @classmethod
+    def _check_range(cls, subscription: Subscription) -> None:
+        """
+        Checks that a subscription has an ID and that its integer fields fit in the 64-bit columns.
+
+        Raises:
+            ValueError: If the ID is missing or a field is out of range.
+        """
+        if subscription.id_ is None:
+            raise ValueError("Subscription ID required")
+        for value in (subscription.user_id, subscription.service_id, subscription.quantity_per_month,
+                      subscription.id_):
+            if not -2 ** 63 <= value < 2 ** 63:
+                raise ValueError("Subscription value out of range")
+
+    def _write(self, row: int, subscription: Subscription, discount: int) -> None:
+        """
+        Overwrites the columns of an existing row with a checked subscription and its encoded discount.
+        """
+        if (self._user_id[row], self._service_id[row]) != (subscription.user_id, subscription.service_id):
+            self._unindex_row(row)
+            self._index_row(row, subscription.user_id, subscription.service_id)
+        self._user_id[row] = subscription.user_id
+        self._service_id[row] = subscription.service_id
+        self._quantity_per_month[row] = subscription.quantity_per_month
+        self._discount[row] = discount
+        self._id[row] = subscription.id_
+        self._active[row] = 1 if subscription.is_active() else 0
+
+    def _put(self, subscription: Subscription) -> None:
+        """
+        Stores a subscription, replacing any existing row with the same ID.
+        """
+        discount = self._encode_discount(subscription.discount)
+        self._check_range(subscription)
+        self.ids.observe(subscription.id_)
+        row = self._row_of(subscription.id_)
+        if row >= 0:
+            self._write(row, subscription, discount)
+            return
+        self._user_id.append(subscription.user_id)
+        self._service_id.append(subscription.service_id)
+        self._quantity_per_month.append(subscription.quantity_per_month)
+        self._discount.append(discount)
+        self._id.append(subscription.id_)
+        self._active.append(1 if subscription.is_active() else 0)
+        self._set_row_of(subscription.id_, len(self._id) - 1)
+        self._index_row(len(self._id) - 1, subscription.user_id, subscription.service_id)
+
+    def _materialize(self, row: int) -> Subscription:
+        """
+        Builds a `Subscription` instance from the columns of a row.
+        """
+        discount = self._discount[row]
+        return Subscription(
+            self._user_id[row],
+            self._service_id[row],
+            self._quantity_per_month[row],
+            None if discount == self.NO_DISCOUNT else Decimal(discount).scaleb(-self.DISCOUNT_PLACES),
+            self._id[row],
+            self._active[row] == 1
+        )
+
+    def _rows_where(self, column: array, value: int) -> Iterator[int]:
+        """
+        Yields the live rows whose column equals the given value, using `array.index` to scan in C.
+
+        This is a full scan; lookups by user or service go through the posting lists instead.
+        """
+        row = -1
+        while True:
+            try:
+                row = column.index(value, row + 1)
+            except ValueError:
+                return
+            if self._active[row] != self.DELETED:
+                yield row
+
+    def _live_rows(self) -> Iterator[int]:
+        """
+        Yields all rows that have not been deleted.
+        """
+        return (row for row, active in enumerate(self._active) if active != self.DELETED)
+
+    def _compact(self) -> None:
+        """
+        Rewrites the columns without deleted rows, keeping the order of the remaining ones.
+        """
+        rows = list(self._live_rows())
+        for name in ('_user_id', '_service_id', '_quantity_per_month', '_discount', '_id', '_active'):
+            column = getattr(self, name)
+            setattr(self, name, array(column.typecode, (column[row] for row in rows)))
+        self._row_by_id = array('i')
+        self._sparse_rows = {}
+        self._rows_by_user_id = {}
+        self._rows_by_service_id = {}
+        self._deleted = 0
+        for row, (id_, user_id, service_id) in enumerate(zip(self._id, self._user_id, self._service_id)):
+            self._set_row_of(id_, row)
+            self._index_row(row, user_id, service_id)
+
+    # ------------------
+    # REPO API
+    # ------------------
+
+    def __len__(self) -> int:
+        """
+        Returns the number of subscriptions in the store.
+        """
+        return len(self._id) - self._deleted
+
+    def columns(self) -> dict[str, array]:
+        """
+        Returns the raw columns of the live rows, in row order.
+
+        Deleted rows are compacted away first, so every returned column holds exactly `len(self)`
+        values. The arrays are the store's own; treat them as read-only.
+
+        Returns:
+            dict[str, array]: The `user_id`, `service_id`, `quantity_per_month`, `discount`, `id_` and
+                `active` columns.
+        """
+        if self._deleted:
+            self._compact()
+        return {
+            'user_id': self._user_id,
+            'service_id': self._service_id,
+            'quantity_per_month': self._quantity_per_month,
+            'discount': self._discount,
+            'id_': self._id,
+            'active': self._active
+        }
+
+    def save_snapshot(self, path: str) -> None:
+        """
+        Writes all subscriptions to a binary snapshot file, see `myproj.file_repo.snapshot`.
+
+        Args:
+            path (str): The path of the snapshot file.
+
+        Raises:
+            ValueError: If a value cannot be represented in the snapshot format.
+        """
+        write_snapshot(path, FactoryType.FROM_SUBSCRIPTION, map(self._materialize, self._live_rows()))
+
+    @classmethod
+    def load_snapshot(cls, path: str) -> Self:
+        """
+        Creates a SubscriptionStore from a snapshot written by `save_snapshot`.
+
+        Args:
+            path (str): The path of the snapshot file.
+
+        Returns:
+            SubscriptionStore: A repository holding the subscriptions of the snapshot.
+
+        Raises:
+            FileNotFoundError: If the file is not found.
+            ValueError: If the file is not a subscription snapshot.
+        """
+        return cls(read_snapshot(path, FactoryType.FROM_SUBSCRIPTION))
+
+    def get_subscriptions(self) -> dict:
+        """
+        Retrieves all subscriptions in the store.
+
+        Returns:
+            dict: A dictionary of all `Subscription` instances indexed by their ID.
+        """
+        return {self._id[row]: self._materialize(row) for row in self._live_rows()}
+
+    def find_by_id(self, id_: int) -> Subscription:
+        """
+        Finds a subscription by its ID.
+
+        Args:
+            id_ (int): The ID of the subscription to find.
+
+        Returns:
+            Subscription: A `Subscription` instance built from the stored row.
+
+        Raises:
+            KeyError: If no subscription with the specified ID is found.
+        """
+        row = self._row_of(id_)
+        if row < 0:
+            raise KeyError("Subscription Not Found")
+        return self._materialize(row)
+
+    def add_subscription(self, data: dict[str, Any] | Subscription) -> Subscription:
+        """
+        Adds a new subscription to the store.
+
+        Args:
+            data (dict[str, Any] | Subscription): The data to create the new subscription.
+                Can be a dictionary of subscription attributes or a `Subscription` instance.
+
+        Returns:
+            Subscription: The newly added `Subscription` instance.
+        """
+        subscription_id = self.ids.next_id()
+
+        if isinstance(data, Subscription):
+            subscription_data = data
+            subscription_data.set_id(subscription_id)
+        else:
+            data['id_'] = subscription_id
+            subscription_data = Subscription(**data)
+
+        return self.upsert(subscription_data)
+
+    def reserve_ids(self, count: int) -> range:
+        """
+        Reserves a block of consecutive IDs for new subscriptions.
+
+        The IDs come from the same allocator as those of `add_subscription`, so they are never
+        handed out twice.
+
+        Args:
+            count (int): The number of IDs to reserve.
+
+        Returns:
+            range: The reserved IDs.
+        """
+        return self.ids.reserve(count)
+
+    def upsert_many(self, subscriptions: list[Subscription]) -> list[Subscription]:
+        """
+        Stores several subscriptions under their own IDs, see `upsert`.
+
+        The whole batch is checked before any row is written, so an invalid subscription leaves the
+        store unchanged. Subscriptions with a new ID are appended with one `extend` per column. When
+        the same ID occurs more than once, the last subscription with it is stored.
+
+        Args:
+            subscriptions (list[Subscription]): The subscriptions to store.
+
+        Returns:
+            list[Subscription]: The stored `Subscription` instances.
+
+        Raises:
+            ValueError: If an ID is missing, a discount has too many decimal places or a value is out
+                of range.
+        """
+        batch = {subscription.id_: subscription for subscription in subscriptions}
+        encoded = {}
+        for id_, subscription in batch.items():
+            self._check_range(subscription)
+            encoded[id_] = self._encode_discount(subscription.discount)
+        self.ids.observe(max(batch, default=None))
+
+        new = []
+        discounts = []
+        for id_, subscription in batch.items():
+            row = self._row_of(id_)
+            if row >= 0:
+                self._write(row, subscription, encoded[id_])
+            else:
+                new.append(subscription)
+                discounts.append(encoded[id_])
+
+        start = len(self._id)
+        self._user_id.extend(subscription.user_id for subscription in new)
+        self._service_id.extend(subscription.service_id for subscription in new)
+        self._quantity_per_month.extend(subscription.quantity_per_month for subscription in new)
+        self._discount.extend(discounts)
+        self._id.extend(subscription.id_ for subscription in new)
+        self._active.extend(1 if subscription.is_active() else 0 for subscription in new)
+        for row, subscription in enumerate(new, start):
+            self._set_row_of(subscription.id_, row)
+            self._index_row(row, subscription.user_id, subscription.service_id)
+        return subscriptions
+
+    def upsert(self, subscription: Subscription) -> Subscription:
+        """
+        Stores a subscription under its own ID, replacing any subscription with the same ID.
+
+        Unlike `add_subscription`, the ID of the subscription is kept.
+
+        Args:
+            subscription (Subscription): The subscription to store.
+
+        Returns:
+            Subscription: The stored `Subscription` instance.
+
+        Raises:
+            ValueError: If the ID is missing, the discount has too many decimal places or a value is
+                out of range.
+        """
+        self._put(subscription)
+        return subscription
+
+    def get_subscriptions_by_user_id(self, user_id: int) -> list[Subscription]:
+        """
+        Retrieves all subscriptions for a specific user.
+
+        Args:
+            user_id (int): The user ID to filter subscriptions.
+
+        Returns:
+            list[Subscription]: A list of `Subscription` instances associated with the given user ID.
+        """
+        return [self._materialize(row) for row in self._rows_by_user_id.get(user_id, ())]
+
+    def get_subscriptions_by_service_id(self, service_id: int) -> list[Subscription]:
+        """
+        Retrieves all subscriptions for a specific service.
+
+        Args:
+            service_id (int): The service ID to filter subscriptions.
+
+        Returns:
+            list[Subscription]: A list of `Subscription` instances associated with the given service ID.
+        """
+        return [self._materialize(row) for row in self._rows_by_service_id.get(service_id, ())]
+
+    def get_all_subscriptions(self) -> list[Subscription]:
+        """
+        Retrieves all subscriptions in the store.
+
+        Returns:
+            list[Subscription]: A list of all `Subscription` instances.
+        """
+        return [self._materialize(row) for row in self._live_rows()]
+
+    def get_all_active_subscriptions(self) -> list[Subscription]:
+        """
+        Retrieves all active subscriptions in the store.
+
+        Returns:
+            list[Subscription]: A list of all active `Subscription` instances.
+        """
+        return [self._materialize(row) for row in self._rows_where(self._active, 1)]
+
+    def update(self, id_: int, data: dict[str, Any]) -> Subscription:
+        """
+        Updates an existing subscription with the provided data.
+
+        If `data` changes the ID, the subscription moves to the new ID, replacing any subscription
+        stored under it.
+
+        Args:
+            id_ (int): The ID of the subscription to update.
+            data (dict[str, Any]): A dictionary containing the updated data.
+
+        Returns:
+            Subscription: The updated `Subscription` instance.
+
+        Raises:
+            KeyError: If no subscription with the specified ID is found.
+            ValueError: If a discount has too many decimal places or a value is out of range.
+        """
+        row = self._row_of(id_)
+        if row < 0:
+            raise KeyError("Subscription Not Found")
+        updated_subscription = self._materialize(row).update(data)
+        discount = self._encode_discount(updated_subscription.discount)
+        self._check_range(updated_subscription)
+        if updated_subscription.id_ != id_:
+            self.delete(id_)
+            return self.upsert(updated_subscription)
+        self._write(row, updated_subscription, discount)
+        return updated_subscription
+
+    def delete(self, id_: int) -> None:
+        """
+        Deletes a subscription by its ID.
+
+        Args:
+            id_ (int): The ID of the subscription to delete.
+
+        Raises:
+            KeyError: If no subscription with the specified ID is found.
+        """
+        row = self._row_of(id_)
+        if row < 0:
+            raise KeyError("Subscription Not Found")
+
+        self._unindex_row(row)
+        self._active[row] = self.DELETED
+        self._set_row_of(id_, -1)
+        self._deleted += 1
+        if self._deleted * 2 > len(self._id):
+            self._compact()
@@ -1,24 +1,48 @@
+from bisect import bisect_right
+from calendar import isleap
+from sys import intern
 from datetime import date, datetime
 from decimal import Decimal
 from dataclasses import dataclass
+from typing import Any, Iterable, Self, Sequence
 
-from myproj.file_repo.file_reader_factory import TextData, JsonData
+from myproj.file_repo.file_reader_factory import FactoryType, TextData, JsonData, RecordData
+from myproj.file_repo.journal import Journal
+from myproj.file_repo.snapshot import read_snapshot, write_snapshot
+from myproj.model.service import Service
 from myproj.model.subscription import Subscription
 from myproj.model.user import User, Destination
 from myproj.service.service import ServiceRepo
 from myproj.service.subscription import SubscriptionRepo
 
 
+def _birthdate_cutoff(age: int, today: date) -> date:
+    """
+    Returns the latest birthdate of a person who is at least `age` years old on `today`.
+
+    Ages are counted as in `User.is_older_than`. When `today` is February 29 and `age` years
+    earlier is not a leap year, the cutoff is February 28 of that year.
+    """
+    year = today.year - age
+    if today.month == 2 and today.day == 29 and not isleap(year):
+        return date(year, 2, 28)
+    return today.replace(year=year)
+
+
 class UserRepo:
     """
     Repository for managing user data.
 
     Args:
-        data (TextData | JsonData | list[User]): The data source for user information, which can be
-            a TextData or JsonData instance or a list of User instances.
+        data (TextData | JsonData | RecordData | list[User]): The data source for user information, which can be
+            a TextData, JsonData or RecordData instance or a list of User instances.
 
     Attributes:
-        users (dict): A dictionary mapping user IDs to User objects.
+        users (dict): A dictionary mapping user IDs to User objects. Names and surnames read from
+            `TextData` and `JsonData` are interned, so repeated values share one string.
+
+    Once a `Journal` is attached with `attach_journal`, every mutation made through `upsert` and
+    `delete` is appended to it.
 
     Methods:
         get_all_users() -> dict:
@@ -27,22 +51,64 @@ class UserRepo:
         find_by_id(id_: int) -> User:
             Retrieves a user by their ID.
 
-        get_users_older_than(age_min: int) -> list[User]:
+        get_users_older_than(age_min: int, today: date | None = None) -> list[User]:
             Returns a list of users older than a specified minimum age.
 
+        get_users_between_ages(age_min: int, age_max: int, today: date | None = None) -> list[User]:
+            Returns a list of users whose age is within a range.
+
+        upsert(user: User) -> User:
+            Stores a user under their own ID.
+
         delete(id_: int) -> None:
             Deletes a user by their ID.
+
+        attach_journal(journal: Journal | None) -> None:
+            Records all further mutations in the given journal.
+
+        save_snapshot(path: str) -> None:
+            Writes all users to a binary snapshot file.
+
+        load_snapshot(path: str) -> UserRepo:
+            Creates a repository from a snapshot file.
     """
 
-    def __init__(self, data: TextData | JsonData | list[User]):
+    def __init__(self, data: TextData | JsonData | RecordData | list[User]):
         self.users = self._data_convert_to_user(data)
+        self._age_index: tuple[list[date], list[User]] | None = None
+        self.journal: Journal | None = None
+
+    def attach_journal(self, journal: Journal | None) -> None:
+        """
+        Records all further mutations in the given journal; None stops journaling.
+
+        Args:
+            journal (Journal | None): A journal of kind `FactoryType.FROM_USER`.
+        """
+        self.journal = journal
 
-    def _data_convert_to_user(self, data: TextData | JsonData | list[User]) -> dict:
+    def _birthdate_index(self) -> tuple[list[date], list[User]]:
+        """
+        Returns the users sorted by birthdate, with their birthdates as a parallel list to bisect.
+
+        The index is built lazily by the first age query after a mutation; `upsert` and `delete`
+        drop it, so changes to `users` must go through them.
+
+        Returns:
+            tuple[list[date], list[User]]: The sorted birthdates and the users in the same order.
+        """
+        index = self._age_index
+        if index is None:
+            users = sorted(self.users.values(), key=lambda user: user.birthdate)
+            index = self._age_index = ([user.birthdate for user in users], users)
+        return index
+
+    def _data_convert_to_user(self, data: TextData | JsonData | RecordData | list[User]) -> dict:
         """
         Converts raw data into a dictionary of User objects.
 
         Args:
-            data (TextData | JsonData | list[User]): The data source to convert.
+            data (TextData | JsonData | RecordData | list[User]): The data source to convert.
 
         Returns:
             dict: A dictionary mapping user IDs to User objects.
@@ -52,14 +118,17 @@ class UserRepo:
         """
         if isinstance(data, JsonData):
             data = data.get_content()
-            transformed_data = [User(value[0], value[1], Destination(value[2]),
+            transformed_data = [User(intern(value[0]), intern(value[1]), Destination(value[2]),
                                      datetime.strptime(value[3], "%Y-%m-%d").date(),
                                      int(value[-1])) for key, value in data.items()]
         elif isinstance(data, TextData):
             data = data.get_content()
-            transformed_data = [User(item[0], item[1], Destination(item[2]),
+            transformed_data = [User(intern(item[0]), intern(item[1]), Destination(item[2]),
                                      datetime.strptime(item[3], "%Y-%m-%d").date(),
                                      int(item[-1])) for item in data]
+        elif isinstance(data, RecordData):
+            transformed_data = [User(name, surname, Destination(origin), birthdate, id_)
+                                for name, surname, origin, birthdate, id_ in data.get_content()]
         elif isinstance(data, list) and all(isinstance(item, User) for item in data):
             transformed_data = data
         else:
@@ -67,6 +136,35 @@ class UserRepo:
 
         return {user.id_: user for user in transformed_data}
 
+    def save_snapshot(self, path: str) -> None:
+        """
+        Writes all users to a binary snapshot file, see `myproj.file_repo.snapshot`.
+
+        Args:
+            path (str): The path of the snapshot file.
+
+        Raises:
+            ValueError: If a value cannot be represented in the snapshot format.
+        """
+        write_snapshot(path, FactoryType.FROM_USER, self.users.values())
+
+    @classmethod
+    def load_snapshot(cls, path: str) -> Self:
+        """
+        Creates a UserRepo from a snapshot written by `save_snapshot`.
+
+        Args:
+            path (str): The path of the snapshot file.
+
+        Returns:
+            UserRepo: A repository holding the users of the snapshot.
+
+        Raises:
+            FileNotFoundError: If the file is not found.
+            ValueError: If the file is not a user snapshot.
+        """
+        return cls(read_snapshot(path, FactoryType.FROM_USER))
+
     def get_all_users(self) -> dict:
         """
         Returns all users in the repository.
@@ -96,17 +194,70 @@ class UserRepo:
 
         return found_user
 
-    def get_users_older_than(self, age_min: int) -> list[User]:
+    def get_users_older_than(self, age_min: int, today: date | None = None) -> list[User]:
         """
-        Returns a list of users older than a specified minimum age.
+        Returns a list of users older than a specified minimum age, as `User.is_older_than` does.
+
+        The birthdate cutoff is computed once and located in the birthdate index by binary search.
 
         Args:
             age_min (int): The minimum age to filter users.
+            today (date | None): The date on which ages are computed; the current date by default.
+
+        Returns:
+            list[User]: A list of users older than the specified minimum age, from the oldest to
+                the youngest.
+
+        Raises:
+            ValueError: If the provided age_min is not within the valid range (0 to 150).
+        """
+        if age_min < 0 or age_min > 150:
+            raise ValueError("Age value not correct")
+
+        cutoff = _birthdate_cutoff(age_min, today or date.today())
+        birthdates, users = self._birthdate_index()
+        return users[:bisect_right(birthdates, cutoff)]
+
+    def get_users_between_ages(self, age_min: int, age_max: int, today: date | None = None) -> list[User]:
+        """
+        Returns a list of users whose age is at least `age_min` and at most `age_max` years.
+
+        Args:
+            age_min (int): The minimum age, inclusive.
+            age_max (int): The maximum age, inclusive.
+            today (date | None): The date on which ages are computed; the current date by default.
 
         Returns:
-            list[User]: A list of users older than the specified minimum age.
+            list[User]: A list of users within the age range, from the oldest to the youngest.
+
+        Raises:
+            ValueError: If an age is not within the valid range (0 to 150).
+        """
+        if min(age_min, age_max) < 0 or max(age_min, age_max) > 150:
+            raise ValueError("Age value not correct")
+        if age_max < age_min:
+            return []
+
+        today = today or date.today()
+        birthdates, users = self._birthdate_index()
+        start = bisect_right(birthdates, _birthdate_cutoff(age_max + 1, today))
+        return users[start:bisect_right(birthdates, _birthdate_cutoff(age_min, today))]
+
+    def upsert(self, user: User) -> User:
         """
-        return [user for user in self.users.values() if user.is_older_than(age_min)]
+        Stores a user under their own ID, replacing any user with the same ID.
+
+        Args:
+            user (User): The user to store.
+
+        Returns:
+            User: The stored `User` instance.
+        """
+        self.users[user.id_] = user
+        self._age_index = None
+        if self.journal is not None:
+            self.journal.record_put(user)
+        return user
 
     def delete(self, id_: int) -> None:
         """
@@ -120,7 +271,69 @@ class UserRepo:
         """
         if id_ not in self.users:
             raise KeyError("User Not Found")
-        self.users.pop(id_)
+        del self.users[id_]
+        self._age_index = None
+        if self.journal is not None:
+            self.journal.record_delete(id_)
+
+
+@dataclass
+class SubscriptionTotals:
+    """
+    Aggregate figures for the active subscriptions of a single user.
+
+    Attributes:
+        count (int): The number of active subscriptions.
+        monthly_revenue (Decimal): The sum of `price * quantity_per_month` minus the discount
+            over the active subscriptions.
+    """
+    count: int = 0
+    monthly_revenue: Decimal = Decimal(0)
+
+
+@dataclass
+class SubscribeResult:
+    """
+    The outcome of one row of `UserService.subscribe_many`.
+
+    Attributes:
+        row (int): The position of the row in the input.
+        subscription (Subscription | None): The created subscription, or None if the row failed.
+        error (str | None): Why the row failed, e.g. "User Not Found", or None on success.
+    """
+    row: int
+    subscription: Subscription | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """
+        Returns whether the row was subscribed.
+        """
+        return self.error is None
+
+
+def _is_id(value: Any) -> bool:
+    """
+    Returns whether a value is an int ID, not a bool or another number that hashes like one.
+    """
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _is_quantity(value: Any) -> bool:
+    """
+    Returns whether a value is a valid monthly quantity: a positive int, not a bool.
+    """
+    return _is_id(value) and value > 0
+
+
+def _is_discount(optional: Sequence) -> bool:
+    """
+    Returns whether the optional discount of a `subscribe_many` row, given as a slice, is valid.
+    """
+    if not optional or optional[0] is None:
+        return True
+    return isinstance(optional[0], (Decimal, int)) and not isinstance(optional[0], bool)
 
 
 @dataclass
@@ -143,8 +356,14 @@ class UserService:
         subscribe_user_to_service(user_id: int, service_id: int, quantity_per_month: int, discount: Decimal = None) -> Subscription:
             Subscribes a user to a service with specified quantity and optional discount.
 
+        subscribe_many(rows: Iterable[Sequence]) -> list[SubscribeResult]:
+            Subscribes many users to services at once, reporting a result per row.
+
         active_subscriptions_report() -> dict:
             Generates a report of active subscriptions, mapping users to their subscribed services.
+
+        active_subscriptions_totals() -> dict[int, SubscriptionTotals]:
+            Aggregates the count and monthly revenue of active subscriptions per user ID.
     """
 
     user_repo: UserRepo
@@ -198,19 +417,137 @@ class UserService:
         self.subscription_repo.add_subscription(subscription)
         return subscription
 
+    def subscribe_many(self, rows: Iterable[Sequence]) -> list[SubscribeResult]:
+        """
+        Subscribes many users to services at once, reporting a result per row instead of raising.
+
+        All rows are checked against the user and service dictionaries first; the valid ones get a
+        block of IDs from the subscription repository and are inserted with one `upsert_many`.
+
+        Args:
+            rows (Iterable[Sequence]): Rows of `(user_id, service_id, quantity_per_month)` or
+                `(user_id, service_id, quantity_per_month, discount)`, with int IDs, a positive int
+                quantity and a Decimal, int or None discount.
+
+        Returns:
+            list[SubscribeResult]: One result per row, in input order. Failed rows carry the error
+                "User Not Found", "Service Not Found" or "Invalid Row"; malformed rows such as None
+                or rows with bool, float or unhashable IDs are "Invalid Row" as well.
+        """
+        users = self.user_repo.get_all_users()
+        services = self.service_repo.get_services()
+        results = []
+        valid = []
+        for index, row in enumerate(rows):
+            try:
+                if (not 3 <= len(row) <= 4 or not _is_id(row[0]) or not _is_id(row[1])
+                        or not _is_quantity(row[2]) or not _is_discount(row[3:])):
+                    error = "Invalid Row"
+                elif row[0] not in users:
+                    error = "User Not Found"
+                elif row[1] not in services:
+                    error = "Service Not Found"
+                else:
+                    error = None
+            except (TypeError, LookupError):
+                error = "Invalid Row"
+            result = SubscribeResult(index, error=error)
+            results.append(result)
+            if error is None:
+                valid.append((result, row))
+
+        subscriptions = []
+        for id_, (result, row) in zip(self.subscription_repo.reserve_ids(len(valid)), valid):
+            user_id, service_id, quantity_per_month, *discount = row
+            result.subscription = Subscription(users[user_id].get_id(), services[service_id].get_id(),
+                                               quantity_per_month, discount[0] if discount else None, id_)
+            subscriptions.append(result.subscription)
+        self.subscription_repo.upsert_many(subscriptions)
+        return results
+
     def active_subscriptions_report(self) -> dict:
         """
         Generates a report of active subscriptions, mapping users to their subscribed services.
 
+        The report is built in a single pass over the active subscriptions, joined against the
+        user and service dictionaries. Rows are grouped by user ID and each `User` is looked up
+        once per group.
+
         Returns:
             dict: A dictionary where keys are User objects and values are lists of Service objects
                   representing the active subscriptions for each user.
+
+        Raises:
+            KeyError: If an active subscription references an unknown user or service.
         """
-        subscriptions = self.subscription_repo.get_all_subscriptions()
-        active_subscriptions = [sub for sub in subscriptions if sub.is_active()]
+        services_by_user_id: dict[int, list[Service]] = {}
+        self._group_report_services(self.subscription_repo.get_all_active_subscriptions(),
+                                    self.service_repo.get_services(), services_by_user_id)
         report = {}
-        for sub in active_subscriptions:
-            user = self.user_repo.find_by_id(sub.user_id)
-            service = self.service_repo.find_by_id(sub.service_id)
-            report.setdefault(user, []).append(service)
+        self._add_report_users(services_by_user_id.items(), self.user_repo.get_all_users(), report)
         return report
+
+    @staticmethod
+    def _group_report_services(subscriptions: Iterable[Subscription], services: dict[int, Service],
+                               services_by_user_id: dict[int, list[Service]]) -> None:
+        """
+        Appends the service of each subscription to its user's list, for `active_subscriptions_report`.
+
+        Args:
+            subscriptions (Iterable[Subscription]): A chunk of active subscriptions.
+            services (dict[int, Service]): The services by ID.
+            services_by_user_id (dict[int, list[Service]]): The grouped services, updated in place.
+
+        Raises:
+            KeyError: If a subscription references an unknown service.
+        """
+        for sub in subscriptions:
+            service = services.get(sub.service_id)
+            if service is None:
+                raise KeyError("Service Not Found")
+            services_by_user_id.setdefault(sub.user_id, []).append(service)
+
+    @staticmethod
+    def _add_report_users(grouped: Iterable[tuple[int, list[Service]]], users: dict[int, User], report: dict) -> None:
+        """
+        Adds a chunk of grouped services to the report, keyed by their `User`.
+
+        Args:
+            grouped (Iterable[tuple[int, list[Service]]]): A chunk of (user ID, services) pairs.
+            users (dict[int, User]): The users by ID.
+            report (dict): The report, updated in place.
+
+        Raises:
+            KeyError: If a user ID is unknown.
+        """
+        for user_id, user_services in grouped:
+            user = users.get(user_id)
+            if user is None:
+                raise KeyError("User Not Found")
+            report[user] = user_services
+
+    def active_subscriptions_totals(self) -> dict[int, SubscriptionTotals]:
+        """
+        Aggregates the count and monthly revenue of active subscriptions per user ID.
+
+        The monthly revenue of a subscription is `Service.price * quantity_per_month` minus its
+        discount, if any.
+
+        Returns:
+            dict[int, SubscriptionTotals]: A dictionary mapping user IDs to their totals.
+
+        Raises:
+            KeyError: If an active subscription references an unknown service.
+        """
+        services = self.service_repo.get_services()
+        totals: dict[int, SubscriptionTotals] = {}
+        for sub in self.subscription_repo.get_all_active_subscriptions():
+            service = services.get(sub.service_id)
+            if service is None:
+                raise KeyError("Service Not Found")
+            user_totals = totals.get(sub.user_id)
+            if user_totals is None:
+                user_totals = totals[sub.user_id] = SubscriptionTotals()
+            user_totals.count += 1
+            user_totals.monthly_revenue += service.price * sub.quantity_per_month - (sub.discount or 0)
+        return totals
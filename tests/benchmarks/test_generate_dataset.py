@@ -0,0 +1,65 @@
+import os
+from collections import Counter
+
+import pytest
+
+from benchmarks.generate_dataset import generate
+from myproj.file_repo.file_reader_factory import DataProcessor, DataFormat, FactoryType
+from myproj.service.service import ServiceRepo
+from myproj.service.subscription import SubscriptionRepo
+from myproj.service.user import UserRepo
+
+REPOS = {'users': (UserRepo, FactoryType.FROM_USER), 'services': (ServiceRepo, FactoryType.FROM_SERVICE),
+         'subscriptions': (SubscriptionRepo, FactoryType.FROM_SUBSCRIPTION)}
+
+
+def load(directory, name, data_type=DataFormat.TEXT):
+    repo_cls, factory_type = REPOS[name]
+    extension = 'json' if data_type is DataFormat.JSON else 'csv'
+    return repo_cls(DataProcessor.create_processor(data_type, factory_type).process(
+        os.path.join(directory, f'{name}.{extension}')))
+
+
+@pytest.mark.parametrize('data_type', list(DataFormat))
+def test_invalid_rows_are_rejected_and_references_are_valid(tmp_path, data_type):
+    generate(str(tmp_path), 300, 20, 1000, invalid_fraction=0.2, seed=3)
+    users, services, subscriptions = (load(str(tmp_path), name, data_type) for name in REPOS)
+
+    assert sorted(users.get_all_users()) == list(range(1, 301))
+    assert sorted(services.get_services()) == list(range(1, 21))
+    assert sorted(s.id_ for s in subscriptions.get_all_subscriptions()) == list(range(1, 1001))
+    assert all(1 <= s.user_id <= 300 and 1 <= s.service_id <= 20 for s in subscriptions.get_all_subscriptions())
+
+    with open(tmp_path / 'subscriptions.csv', encoding='utf-8') as f:
+        rows = sum(1 for _ in f) - 1
+    assert 0.15 < 1 - 1000 / rows < 0.25
+
+
+def test_popularity_and_active_ratio_follow_the_arguments(tmp_path):
+    generate(str(tmp_path / 'skewed'), 100, 50, 5000, formats=('csv',), zipf=1.5, active_ratio=0.25)
+    generate(str(tmp_path / 'uniform'), 100, 50, 5000, formats=('csv',), zipf=0)
+    skewed, uniform = (load(str(tmp_path / directory), 'subscriptions').get_all_subscriptions()
+                       for directory in ('skewed', 'uniform'))
+
+    popularity = Counter(subscription.service_id for subscription in skewed)
+    assert popularity.most_common(1)[0][0] == 1
+    assert popularity[1] > 10 * popularity[10]
+    assert max(Counter(subscription.service_id for subscription in uniform).values()) < 200
+    assert 0.2 < sum(subscription.active for subscription in skewed) / 5000 < 0.3
+    assert not os.path.exists(tmp_path / 'skewed' / 'users.json')
+
+
+def test_seed_makes_the_output_reproducible(tmp_path):
+    paths = [generate(str(tmp_path / name), 50, 10, 100, seed=seed, invalid_fraction=0.1)
+             for name, seed in (('a', 1), ('b', 1), ('c', 2))]
+    contents = [[open(path, 'rb').read() for path in group] for group in paths]
+    assert contents[0] == contents[1] != contents[2]
+
+
+def test_invalid_arguments(tmp_path):
+    with pytest.raises(ValueError):
+        generate(str(tmp_path), 10, 10, 10, formats=('xml',))
+    with pytest.raises(ValueError):
+        generate(str(tmp_path), 10, 10, 10, invalid_fraction=1)
+    with pytest.raises(ValueError):
+        generate(str(tmp_path), 0, 10, 10)
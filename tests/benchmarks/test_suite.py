@@ -0,0 +1,19 @@
+import copy
+import json
+
+from benchmarks.suite import compare, run_suite
+
+
+def test_suite_covers_every_case_and_finds_regressions():
+    results = run_suite([200], repeat=2, queries=10, track_memory=False)
+    names = [result['name'] for result in results['results']]
+    assert len(names) == 9 + 3 + 3 + 3
+    assert {'process/JSON/FROM_USER', 'validate/FROM_SUBSCRIPTION', 'process/MAPPED_TEXT/FROM_SUBSCRIPTION', 'repo/UserRepo',
+            'query/active_subscriptions_report'} <= set(names)
+    assert all(result['throughput'] > 0 and result['p50'] <= result['p99'] for result in results['results'])
+    json.dumps(results)
+
+    assert compare(results, results, 0.2) == []
+    faster = copy.deepcopy(results)
+    faster['results'][0]['p50'] /= 2
+    assert [name for name, *_ in compare(results, faster, 0.2)] == [names[0]]
@@ -13,4 +13,9 @@ def test_json_converter_works_correct():
     to_json_converter = ToJsonDataConverter()
     result_to_json_converter = to_json_converter.convert(['Alicja,13,Poznan', 'Kazimierz,22,Warszawa'])
     assert JsonData({0:['Alicja','13','Poznan'],1:['Kazimierz','22','Warszawa']}) == result_to_json_converter
-    assert isinstance(result_to_json_converter, JsonData)
\ No newline at end of file
+    assert isinstance(result_to_json_converter, JsonData)
+
+def test_converter_iter_splits_rows():
+    to_text_converter = ToTextDataConverter()
+    result = to_text_converter.convert_iter(iter(['Alicja,13,Poznan', 'Kazimierz,22,Warszawa']))
+    assert [['Alicja','13','Poznan'],['Kazimierz','22','Warszawa']] == list(result)
@@ -53,4 +53,31 @@ class TestDataLoaderContentNotCorrect:
         assert 2 == len(result)
         assert result[0].startswith('1')
         assert result[-1].endswith('99')
-        assert '\n' not in ''.join(result)
\ No newline at end of file
+        assert '\n' not in ''.join(result)
+
+class TestDataLoaderIter:
+    def test_when_csv_file_is_streamed(self, good_csv_file_path):
+        txt = TextDataLoader()
+        result = txt.load_iter(good_csv_file_path)
+        assert not isinstance(result, list)
+        assert txt.load(good_csv_file_path) == list(result)
+
+    def test_when_json_file_is_streamed(self, good_json_file_path):
+        json = JsonDataLoader()
+        result = json.load_iter(good_json_file_path)
+        assert not isinstance(result, list)
+        assert json.load(good_json_file_path) == list(result)
+
+    def test_when_streamed_csv_file_has_no_content(self, empty_csv_file_path):
+        txt = TextDataLoader()
+        assert [] == list(txt.load_iter(empty_csv_file_path))
+
+    def test_when_streamed_text_path_has_incorrect_extension(self, bad_extension_path):
+        with pytest.raises(AttributeError) as e:
+            TextDataLoader().load_iter(bad_extension_path)
+        assert 'File has incorrect extension' == str(e.value)
+
+    def test_when_streamed_text_file_not_found(self):
+        with pytest.raises(FileNotFoundError) as e:
+            TextDataLoader().load_iter('data_test/not_found.csv')
+        assert str(e.value).startswith('File not found')
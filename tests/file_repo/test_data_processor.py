@@ -91,4 +91,54 @@ def test_create_processor_text_from_subscription(mock_text_factory):
 
 def test_create_processor_invalid_combination():
 
-    assert (DataProcessor.create_processor("invalid_data_type", "invalid_factory_type")) == None
\ No newline at end of file
+    assert (DataProcessor.create_processor("invalid_data_type", "invalid_factory_type")) == None
+
+@pytest.mark.parametrize('data_format, path', [
+    (DataFormat.TEXT, 'data/data_service.csv'),
+    (DataFormat.JSON, 'data/data_service.json'),
+])
+def test_process_iter_matches_process(data_format, path):
+    processor = DataProcessor.create_processor(data_format, FactoryType.FROM_SERVICE)
+    rows = processor.process_iter(path)
+    assert not isinstance(rows, list)
+    content = processor.process(path).get_content()
+    expected = list(content.values()) if isinstance(content, dict) else content
+    assert expected == list(rows)
+
+
+@pytest.mark.parametrize('factory_type, path', [
+    (FactoryType.FROM_SERVICE, 'data/data_service.csv'),
+    (FactoryType.FROM_USER, 'data/data_user.csv'),
+    (FactoryType.FROM_SUBSCRIPTION, 'data/data_subscription.csv'),
+])
+def test_process_parallel_matches_process(factory_type, path):
+    processor = DataProcessor.create_processor(DataFormat.TEXT, factory_type)
+    expected = processor.process(path).get_content()
+    assert expected == processor.process_parallel(path, workers=2, chunk_size=64).get_content()
+    assert expected == processor.process_parallel(path, workers=1, chunk_size=64).get_content()
+
+
+def test_process_parallel_handles_crlf_and_missing_final_newline(tmp_path):
+    path = tmp_path / 'services.csv'
+    path.write_bytes(b'ID,Name,Category,Price\r\n1,Netflix,Video,10.50\r\nbad row\r\n2,Spotify,Music,9.99')
+    processor = DataProcessor.create_processor(DataFormat.TEXT, FactoryType.FROM_SERVICE)
+    expected = processor.process(str(path)).get_content()
+    assert len(expected) == 2
+    assert expected == processor.process_parallel(str(path), workers=2, chunk_size=8).get_content()
+
+
+def test_process_parallel_falls_back_for_json():
+    processor = DataProcessor.create_processor(DataFormat.JSON, FactoryType.FROM_SERVICE)
+    path = 'data/data_service.json'
+    assert processor.process(path).get_content() == processor.process_parallel(path, workers=2).get_content()
+
+
+def test_process_parallel_errors(bad_extension_path):
+    processor = DataProcessor.create_processor(DataFormat.TEXT, FactoryType.FROM_SERVICE)
+    with pytest.raises(AttributeError):
+        processor.process_parallel(bad_extension_path)
+    with pytest.raises(FileNotFoundError):
+        processor.process_parallel('data/missing.csv')
+    for chunk_size in (0, -1):
+        with pytest.raises(ValueError):
+            processor.process_parallel('data/data_service.csv', workers=2, chunk_size=chunk_size)
@@ -1,4 +1,6 @@
-from myproj.file_repo.file_reader_factory import RegexValidator
+from myproj.file_repo.file_reader_factory import FactoryType, RegexValidator, SubscriptionValidator, RegexPatterns, create_validator_for
+import re
+
 import pytest
 
 
@@ -12,3 +14,42 @@ def test_regex_validator_no_data_results():
     regex_validator = RegexValidator(r'^(\d+),([A-Za-z\s]+),([A-Za-z\s]+),(\d+\.\d+)$')
     result_data_validator = regex_validator.validate(['blablabla'])
     assert [] == result_data_validator
+
+
+def test_regex_validator_iter_is_lazy():
+    regex_validator = RegexValidator(r'^(\d+),([A-Za-z\s]+),([A-Za-z\s]+),(\d+\.\d+)$')
+    result_data_validator = regex_validator.validate_iter(iter(['blablabla', '1,Delicious Bites,Food,29.99']))
+    assert not isinstance(result_data_validator, list)
+    assert ['1,Delicious Bites,Food,29.99'] == list(result_data_validator)
+
+
+SUBSCRIPTION_ROWS = ['1,2,3,10,5,1', '1,2,3,10,5,12', '1,2,3,10,5', '1,2,3,10,5,1,', ' 1,2,3,10,5,1',
+                     '1,2,3,1.5,5,1', '1,,3,10,5,0', '١,2,3,10,5,0', '', 'User,Service,Q,D,ID,Active']
+
+
+def test_subscription_validator_matches_regex():
+    regex_validator = RegexValidator(RegexPatterns.FROM_SUBSCRIPTION.value)
+    subscription_validator = SubscriptionValidator()
+    assert regex_validator.validate(SUBSCRIPTION_ROWS) == subscription_validator.validate(SUBSCRIPTION_ROWS)
+    assert [row.split(',') for row in regex_validator.validate(SUBSCRIPTION_ROWS)] == \
+        list(subscription_validator.validate_fields_iter(SUBSCRIPTION_ROWS))
+
+
+def test_create_validator_for():
+    assert isinstance(create_validator_for(RegexPatterns.FROM_SUBSCRIPTION.value), SubscriptionValidator)
+    validator = create_validator_for(RegexPatterns.FROM_SERVICE.value)
+    assert isinstance(validator, RegexValidator)
+    assert validator.pattern.pattern == RegexPatterns.FROM_SERVICE.value
+
+
+@pytest.mark.parametrize('factory_type, row', [
+    (FactoryType.FROM_SERVICE, '{i},Delicious Bites,Food,29.99'),
+    (FactoryType.FROM_USER, 'Paweł,Bączkowski,BALEARICS ISLANDS,1989-02-17,{i}'),
+    (FactoryType.FROM_SUBSCRIPTION, '{i},3,2,15,{i},1'),
+])
+def test_created_validators_match_uncompiled_regex(factory_type, row):
+    data = [row.format(i=i) if i % 10 else f'{i},broken' for i in range(200)]
+    regex = RegexPatterns[factory_type.value].value
+    expected = [d.split(',') for d in data if re.match(regex, d) is not None]
+    assert list(create_validator_for(regex).validate_fields_iter(data)) == expected
+    assert len(expected) == 180
@@ -0,0 +1,76 @@
+import os
+
+import pytest
+
+from myproj.file_repo.cache import ProcessedDataCache
+from myproj.file_repo.file_reader_factory import DataProcessor, DataFormat, FactoryType
+from myproj.file_repo.instrumentation import PrometheusTextfileWriter, ProcessStats
+
+
+@pytest.fixture
+def service_csv(tmp_path):
+    path = tmp_path / 'services.csv'
+    path.write_text('ID,Name,Category,Price\n1,Tea,Tea,1.50\n2,Bad Row\n3,Wine,Wine,9.99\n', encoding='utf-8')
+    return str(path)
+
+
+@pytest.mark.parametrize('data_type, factory_type, path', [
+    (DataFormat.TEXT, FactoryType.FROM_SERVICE, 'data/data_service.csv'),
+    (DataFormat.JSON, FactoryType.FROM_USER, 'data/data_user.json'),
+    (DataFormat.TEXT, FactoryType.FROM_SUBSCRIPTION, 'data/data_subscription.csv'),
+    (DataFormat.MAPPED_TEXT, FactoryType.FROM_USER, 'data/data_user.csv'),
+])
+def test_observed_process_returns_the_same_data(data_type, factory_type, path):
+    observed = []
+    processor = DataProcessor.create_processor(data_type, factory_type)
+    processor.add_observer(observed.append)
+    assert processor.process(path) == DataProcessor.create_processor(data_type, factory_type).process(path)
+    assert observed == [processor.last_stats]
+    assert [stage.name for stage in observed[0].stages] == ['load', 'validate', 'convert']
+    assert observed[0].bytes_read == os.path.getsize(path)
+
+
+def test_stats_count_rows_per_stage(service_csv):
+    processor = DataProcessor.create_processor(DataFormat.TEXT, FactoryType.FROM_SERVICE)
+    processor.add_observer(lambda stats: None)
+    processor.track_memory = True
+    processor.process(service_csv)
+
+    stats = processor.last_stats
+    assert (stats.stage('load').rows_in, stats.stage('load').rows_out) == (0, 3)
+    validate = stats.stage('validate')
+    assert (validate.rows_in, validate.rows_out, validate.rows_rejected) == (3, 2, 1)
+    assert stats.rows_out == 2
+    assert all(stage.wall_time >= 0 and stage.peak_memory >= 0 for stage in stats.stages)
+    with pytest.raises(KeyError):
+        stats.stage('parse')
+
+
+def test_processor_without_observers_collects_nothing(service_csv, tmp_path):
+    processor = DataProcessor.create_processor(DataFormat.TEXT, FactoryType.FROM_SERVICE,
+                                               ProcessedDataCache(str(tmp_path / 'cache')))
+    processor.process(service_csv)
+    assert processor.last_stats is None
+
+    observed = []
+    processor.add_observer(observed.append)
+    processor.process(service_csv)
+    assert observed == []
+
+
+def test_prometheus_writer_keeps_the_latest_run_per_file(service_csv, tmp_path):
+    metrics = tmp_path / 'ingest.prom'
+    writer = PrometheusTextfileWriter(str(metrics))
+    processor = DataProcessor.create_processor(DataFormat.TEXT, FactoryType.FROM_SERVICE)
+    processor.add_observer(writer)
+    processor.process(service_csv)
+    processor.process(service_csv)
+    writer(ProcessStats('other "file".csv', 10))
+
+    text = metrics.read_text(encoding='utf-8')
+    assert f'myproj_ingest_stage_rows_rejected{{file="{service_csv}",stage="validate"}} 1' in text
+    assert 'myproj_ingest_bytes_read{file="other \\"file\\".csv"} 10' in text
+    assert text.count('# TYPE myproj_ingest_stage_wall_seconds gauge') == 1
+    assert text.count('myproj_ingest_stage_wall_seconds{') == 3
+    assert 'peak_memory' not in text
+    assert not any(name.endswith('.tmp') for name in os.listdir(tmp_path))
@@ -0,0 +1,94 @@
+from myproj.file_repo.file_reader_factory import FactoryType
+from myproj.file_repo.journal import Journal
+from myproj.model.service import Service
+from myproj.model.subscription import Subscription
+from myproj.model.user import User, Destination
+from myproj.service.service import ServiceRepo
+from myproj.service.subscription import SubscriptionRepo
+from datetime import date
+from decimal import Decimal
+import time
+
+import pytest
+
+
+def test_journal_replay_restores_mutations(tmp_path):
+    path = str(tmp_path / 'subscriptions.journal')
+    repo = SubscriptionRepo([Subscription(1, 1, 1, None, 1, True)])
+    with Journal(path, FactoryType.FROM_SUBSCRIPTION) as journal:
+        repo.attach_journal(journal)
+        repo.add_subscription(Subscription(2, 3, 4, Decimal('1.50'), active=False))
+        repo.update(1, {'quantity_per_month': 7})
+        repo.upsert(Subscription(5, 5, 5, None, 9, None))
+        repo.delete(9)
+
+    replayed = SubscriptionRepo([Subscription(1, 1, 1, None, 1, True)])
+    assert Journal(path, FactoryType.FROM_SUBSCRIPTION).replay(replayed) == 4
+    assert replayed.get_subscriptions() == repo.get_subscriptions()
+    assert replayed.get_subscriptions_by_user_id(2) == [Subscription(2, 3, 4, Decimal('1.50'), 2, False)]
+
+
+def test_journal_group_commit(tmp_path):
+    path = str(tmp_path / 'services.journal')
+    journal = Journal(path, FactoryType.FROM_SERVICE, batch_size=3, max_delay=3600)
+    for id_ in range(1, 6):
+        journal.record_put(Service(id_, 'Superfood', 'Food', Decimal('10.00')))
+    assert journal.size() > 0
+    with open(path, 'rb') as f:
+        assert f.read().count(b'\n') == 3
+    journal.commit()
+    with open(path, 'rb') as f:
+        assert f.read().count(b'\n') == 5
+    journal.close()
+
+
+
+def test_journal_commits_idle_batch_after_max_delay(tmp_path):
+    path = str(tmp_path / 'services.journal')
+    with Journal(path, FactoryType.FROM_SERVICE, batch_size=100, max_delay=0.02) as journal:
+        journal.record_put(Service(1, 'Superfood', 'Food', Decimal('10.00')))
+        assert journal.size() == 0
+        deadline = time.monotonic() + 5
+        while journal.size() == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        with open(path, 'rb') as f:
+            assert f.read().count(b'\n') == 1
+
+def test_journal_round_trips_user_fields(tmp_path):
+    path = str(tmp_path / 'users.journal')
+    user = User('Łukasz', 'Núñez', Destination.IC, date(2000, 2, 29), 3)
+    with Journal(path, FactoryType.FROM_USER) as journal:
+        journal.record_put(user)
+
+    class Users(dict):
+        def upsert(self, user):
+            self[user.id_] = user
+
+    users = Users()
+    Journal(path, FactoryType.FROM_USER).replay(users)
+    assert users == {3: user}
+
+
+def test_journal_ignores_torn_last_line(tmp_path):
+    path = tmp_path / 'services.journal'
+    with Journal(str(path), FactoryType.FROM_SERVICE) as journal:
+        journal.record_put(Service(1, 'Superfood', 'Food', Decimal('10.00')))
+    with open(path, 'ab') as f:
+        f.write(b'["put",[2,"Superw')
+
+    repo = ServiceRepo([])
+    with Journal(str(path), FactoryType.FROM_SERVICE) as journal:
+        assert journal.replay(repo) == 1
+        journal.record_delete(1)
+    assert list(repo.get_services()) == [1]
+
+    repo = ServiceRepo([])
+    Journal(str(path), FactoryType.FROM_SERVICE).replay(repo)
+    assert repo.get_services() == {}
+
+
+def test_journal_rejects_malformed_entries(tmp_path):
+    path = tmp_path / 'services.journal'
+    path.write_bytes(b'["drop",1]\n["delete",1]\n')
+    with pytest.raises(ValueError):
+        Journal(str(path), FactoryType.FROM_SERVICE).replay(ServiceRepo([]))
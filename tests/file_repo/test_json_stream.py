@@ -0,0 +1,77 @@
+from myproj.file_repo.file_reader_factory import iter_json_records, JsonDataLoader, JsonRecordLoader
+import io
+import json
+
+import pytest
+
+
+DOCUMENT = [
+    {"id": 1, "name": "Delicious Bites", "category": "Food", "price": 29.99},
+    {"id": 22, "name": "Vintage [Vineyard]", "category": "Wine, red", "price": 49.99},
+    12345678,
+    "a \"quoted\" ] string",
+    [1, 2, [3]],
+    {"nested": {"a": [1, {"b": None}]}, "flag": True},
+]
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 64, 1 << 16])
+@pytest.mark.parametrize('indent', [None, 2])
+def test_json_array_is_decoded_incrementally(chunk_size, indent):
+    text = json.dumps(DOCUMENT, indent=indent)
+    assert list(iter_json_records(io.StringIO(text), chunk_size=chunk_size)) == DOCUMENT
+
+
+@pytest.mark.parametrize('text', ['[]', '  [ ]\n', '\n[\n]'])
+def test_empty_json_array(text):
+    assert list(iter_json_records(io.StringIO(text), chunk_size=1)) == []
+
+
+def test_json_lines():
+    text = '\n'.join(json.dumps(item) for item in DOCUMENT) + '\n\n'
+    assert list(iter_json_records(io.StringIO(text), json_lines=True)) == DOCUMENT
+
+
+def test_non_array_document_is_iterated_like_json_load():
+    assert list(iter_json_records(io.StringIO('{}'))) == []
+
+
+@pytest.mark.parametrize('text', ['[1, 2', '[1 2]', '[1,]', '[{"a": 1}] x', '[{"a": }]'])
+def test_invalid_json_array(text):
+    with pytest.raises(ValueError):
+        list(iter_json_records(io.StringIO(text), chunk_size=2))
+
+
+def test_records_are_yielded_before_the_file_is_read():
+    class CountingReader(io.StringIO):
+        read_calls = 0
+
+        def read(self, size=-1):
+            self.read_calls += 1
+            return super().read(size)
+
+    f = CountingReader(json.dumps([{"id": i} for i in range(1000)]))
+    records = iter_json_records(f, chunk_size=32)
+    assert next(records) == {"id": 0}
+    assert f.read_calls < 5
+
+
+def test_loaders_accept_json_lines(tmp_path):
+    path = tmp_path / 'services.jsonl'
+    path.write_text('{"id": 1, "name": "Tea Harmony", "category": "Tea", "price": 9.99}\n'
+                    '{"id": 2, "name": "Spice Sensation", "category": "Spices", "price": 12.5}\n')
+    assert JsonDataLoader().load(str(path)) == ['1,Tea Harmony,Tea,9.99', '2,Spice Sensation,Spices,12.5']
+    assert [record['id'] for record in JsonRecordLoader().load_iter(str(path))] == [1, 2]
+
+
+def test_load_wraps_decoding_errors(tmp_path):
+    path = tmp_path / 'broken.json'
+    path.write_text('[{"id": 1},')
+    with pytest.raises(FileNotFoundError) as e:
+        JsonDataLoader().load(str(path))
+    assert str(e.value).startswith('File not found')
+
+
+def test_whitespace_spanning_several_chunks():
+    text = '[1,' + ' ' * 50 + '\n' * 50 + '2' + ' ' * 50 + ']'
+    assert list(iter_json_records(io.StringIO(text), chunk_size=4)) == [1, 2]
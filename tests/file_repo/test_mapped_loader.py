@@ -0,0 +1,86 @@
+from myproj.file_repo.file_reader_factory import MappedLines, MappedTextDataLoader, BytesRegexValidator, \
+    DataProcessor, DataFormat, FactoryType, RegexPatterns, TextDataLoader, to_bytes_regex
+import re
+
+import pytest
+
+
+@pytest.mark.parametrize('factory_type, path', [
+    (FactoryType.FROM_SERVICE, 'data/data_service.csv'),
+    (FactoryType.FROM_USER, 'data/data_user.csv'),
+    (FactoryType.FROM_SUBSCRIPTION, 'data/data_subscription.csv'),
+])
+def test_mapped_processor_matches_text_processor(factory_type, path):
+    mapped = DataProcessor.create_processor(DataFormat.MAPPED_TEXT, factory_type)
+    text = DataProcessor.create_processor(DataFormat.TEXT, factory_type)
+    assert mapped.process(path) == text.process(path)
+
+
+@pytest.mark.parametrize('content', [
+    b'',
+    b'header',
+    b'header\n',
+    b'header\na\nb',
+    b'header\r\na\r\n\r\nb\r\n',
+    b'header\n\n\nlast\n',
+])
+def test_mapped_lines_match_text_loader(tmp_path, content):
+    path = tmp_path / 'lines.csv'
+    path.write_bytes(content)
+    with MappedTextDataLoader().load(str(path)) as lines:
+        assert [str(line, 'utf-8') for line in lines] == TextDataLoader().load(str(path))
+        assert len(lines) == len(TextDataLoader().load(str(path)))
+
+
+def test_mapped_loader_errors(bad_extension_path):
+    with pytest.raises(AttributeError):
+        MappedTextDataLoader().load(bad_extension_path)
+    with pytest.raises(FileNotFoundError):
+        MappedTextDataLoader().load('data/missing.csv')
+
+
+@pytest.mark.parametrize('line', [
+    'Łukasz,Núñez,PENINSULA,1990-01-01,3',
+    'Ana,Ñuñez,CANARIAS,2001-12-31,10',
+    'Ana,Nu€ez,CANARIAS,2001-12-31,10',
+    'Ana,Nuñez,canarias,2001-12-31,10',
+    'Ana,,CANARIAS,2001-12-31,10',
+])
+def test_bytes_regex_agrees_with_str_regex(line):
+    bytes_match = re.match(to_bytes_regex(RegexPatterns.FROM_USER.value), line.encode('utf-8'))
+    assert (bytes_match is not None) == (re.match(RegexPatterns.FROM_USER.value, line) is not None)
+
+
+def test_bytes_regex_validator_decodes_only_matches():
+    validator = BytesRegexValidator(RegexPatterns.FROM_SERVICE.value)
+    lines = [b'1,Delicious Bites,Food,29.99', b'\xff\xfe', memoryview(b'2,Vintage,Wine,49.99')]
+    assert validator.validate(lines) == ['1,Delicious Bites,Food,29.99', '2,Vintage,Wine,49.99']
+
+
+@pytest.mark.parametrize('regex', ['[^ñ]', '[a-ñ]'])
+def test_to_bytes_regex_rejects_unsupported_classes(regex):
+    with pytest.raises(ValueError):
+        to_bytes_regex(regex)
+
+
+def test_processor_closes_the_map(monkeypatch):
+    opened = []
+    open_lines = MappedLines.open.__func__
+
+    def recording_open(cls, path):
+        opened.append(open_lines(cls, path))
+        return opened[-1]
+
+    monkeypatch.setattr(MappedLines, 'open', classmethod(recording_open))
+    for factory_type, path in ((FactoryType.FROM_USER, 'data/data_user.csv'),
+                               (FactoryType.FROM_SUBSCRIPTION, 'data/data_subscription.csv')):
+        processor = DataProcessor.create_processor(DataFormat.MAPPED_TEXT, factory_type)
+        processor.process(path)
+        assert list(processor.process_iter(path))
+        rows = processor.process_iter(path)
+        next(rows)
+        rows.close()
+        processor.add_observer(lambda stats: None)
+        processor.process(path)
+    assert len(opened) == 8
+    assert all(lines.buffer.closed for lines in opened)
@@ -0,0 +1,123 @@
+from myproj.file_repo.cache import ProcessedDataCache
+from myproj.file_repo.file_reader_factory import DataProcessor, DataFormat, FactoryType
+from myproj.model.user import Destination
+from unittest.mock import patch
+import os
+import pickle
+import shutil
+
+import pytest
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ProcessedDataCache(str(tmp_path / 'cache'))
+
+
+@pytest.fixture
+def service_csv(tmp_path):
+    path = tmp_path / 'data_service.csv'
+    shutil.copy('data/data_service.csv', path)
+    return str(path)
+
+
+@pytest.mark.parametrize('data_format, path', [
+    (DataFormat.TEXT, 'data/data_service.csv'),
+    (DataFormat.JSON, 'data/data_service.json'),
+])
+def test_cached_process_skips_loading(cache, data_format, path):
+    processor = DataProcessor.create_processor(data_format, FactoryType.FROM_SERVICE, cache=cache)
+    expected = processor.process(path)
+    with patch.object(processor.data_loader, 'load', side_effect=AssertionError('not cached')):
+        assert processor.process(path) == expected
+        assert processor.process(path) is not processor.process(path)
+
+
+def test_cache_is_keyed_on_factory(cache):
+    services = DataProcessor.create_processor(DataFormat.TEXT, FactoryType.FROM_SERVICE, cache=cache)
+    users = DataProcessor.create_processor(DataFormat.TEXT, FactoryType.FROM_USER, cache=cache)
+    assert services.process('data/data_service.csv').get_content()
+    assert users.process('data/data_service.csv').get_content() == []
+
+
+def test_cache_namespace_names_parsers_without_addresses(cache):
+    processors = [DataProcessor.create_record_processor(DataFormat.JSON, FactoryType.FROM_USER, cache=cache,
+                                                        parsers={'origin': Destination, 'name': lambda value: value})
+                  for _ in range(2)]
+    namespace = processors[0]._cache_namespace
+    assert namespace == processors[1]._cache_namespace
+    assert 'myproj.model.user.Destination' in namespace and '<lambda>' in namespace
+    assert ' at 0x' not in namespace
+
+
+@pytest.mark.parametrize('use_content_hash', [False, True])
+def test_modified_file_is_reprocessed(tmp_path, service_csv, use_content_hash):
+    cache = ProcessedDataCache(str(tmp_path / 'cache'), use_content_hash=use_content_hash)
+    processor = DataProcessor.create_processor(DataFormat.TEXT, FactoryType.FROM_SERVICE, cache=cache)
+    before = processor.process(service_csv)
+    stat = os.stat(service_csv)
+    with open(service_csv, 'a', encoding='utf-8') as f:
+        f.write('\n99,New Service,Food,1.00\n')
+    os.utime(service_csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    after = processor.process(service_csv)
+    assert after.get_content() == before.get_content() + [['99', 'New Service', 'Food', '1.00']]
+
+
+def test_content_hash_survives_touch(tmp_path, service_csv):
+    cache = ProcessedDataCache(str(tmp_path / 'cache'), use_content_hash=True)
+    processor = DataProcessor.create_processor(DataFormat.TEXT, FactoryType.FROM_SERVICE, cache=cache)
+    expected = processor.process(service_csv)
+    os.utime(service_csv, ns=(0, 0))
+    with patch.object(processor.data_loader, 'load', side_effect=AssertionError('not cached')):
+        assert processor.process(service_csv) == expected
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = ProcessedDataCache(str(tmp_path / 'cache'), max_bytes=250)
+    keys = [cache.key_for('data/data_service.csv', str(i)) for i in range(3)]
+    cache.put(keys[0], 'a' * 100)
+    cache.put(keys[1], 'b' * 100)
+    os.utime(cache._entry_path(keys[1]), ns=(0, 0))
+    cache.get(keys[0])
+    cache.put(keys[2], 'c' * 100)
+    assert cache.get(keys[0]) == 'a' * 100
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[2]) == 'c' * 100
+
+
+def test_corrupt_entry_is_a_miss(cache):
+    key = cache.key_for('data/data_service.csv', 'namespace')
+    with open(cache._entry_path(key), 'wb') as f:
+        f.write(b'not a pickle')
+    assert cache.get(key) is None
+    assert not os.path.exists(cache._entry_path(key))
+
+
+def test_entry_evicted_after_reading_is_still_a_hit(cache, monkeypatch):
+    key = cache.key_for('data/data_service.csv', 'namespace')
+    cache.put(key, 'value')
+    load = pickle.load
+
+    def load_then_evict(f):
+        value = load(f)
+        os.remove(cache._entry_path(key))
+        return value
+
+    monkeypatch.setattr(pickle, 'load', load_then_evict)
+    assert cache.get(key) == 'value'
+
+
+def test_failed_put_leaves_no_temporary_file(cache):
+    key = cache.key_for('data/data_service.csv', 'namespace')
+    with pytest.raises(Exception):
+        cache.put(key, lambda: None)
+    assert os.listdir(cache.directory) == []
+
+
+def test_cached_processor_errors(cache, bad_extension_path):
+    processor = DataProcessor.create_processor(DataFormat.TEXT, FactoryType.FROM_SERVICE, cache=cache)
+    with pytest.raises(AttributeError):
+        processor.process(bad_extension_path)
+    with pytest.raises(FileNotFoundError):
+        processor.process('data/missing.csv')
+    assert DataProcessor.create_processor('invalid', 'invalid', cache=cache) is None
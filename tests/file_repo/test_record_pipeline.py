@@ -0,0 +1,117 @@
+from myproj.file_repo.file_reader_factory import DataProcessor, DataFormat, FactoryType, RecordData, RecordSchemas, \
+    SchemaValidator, TextData, record_schema
+from myproj.model.user import Destination
+from myproj.service.service import ServiceRepo
+from myproj.service.subscription import SubscriptionRepo
+from myproj.service.user import UserRepo
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+
+@pytest.mark.parametrize('factory_type, repo, path', [
+    (FactoryType.FROM_SERVICE, ServiceRepo, 'data/data_service.json'),
+    (FactoryType.FROM_USER, UserRepo, 'data/data_user.json'),
+    (FactoryType.FROM_SUBSCRIPTION, SubscriptionRepo, 'data/data_subscription.json'),
+])
+def test_record_processor_matches_string_pipeline(factory_type, repo, path):
+    records = DataProcessor.create_record_processor(DataFormat.JSON, factory_type).process(path)
+    strings = DataProcessor.create_processor(DataFormat.JSON, factory_type).process(path)
+    assert isinstance(records, RecordData)
+    assert vars(repo(records)) == vars(repo(strings))
+
+
+@pytest.mark.parametrize('factory_type, repo, path', [
+    (FactoryType.FROM_SERVICE, ServiceRepo, 'data/data_service.csv'),
+    (FactoryType.FROM_USER, UserRepo, 'data/data_user.csv'),
+    (FactoryType.FROM_SUBSCRIPTION, SubscriptionRepo, 'data/data_subscription.csv'),
+])
+def test_text_record_processor_matches_string_pipeline(factory_type, repo, path):
+    processor = DataProcessor.create_record_processor(DataFormat.TEXT, factory_type)
+    records = processor.process(path)
+    strings = DataProcessor.create_processor(DataFormat.TEXT, factory_type).process(path)
+    assert isinstance(records, RecordData)
+    assert vars(repo(records)) == vars(repo(strings))
+    assert list(processor.process_iter(path)) == records.get_content()
+
+
+def test_typed_converter_shares_repeated_values_and_drops_unparsable_rows(tmp_path):
+    path = tmp_path / 'users.csv'
+    path.write_text('Name,Surname,Origin,Datebirth,ID\n'
+                    'Ana,Cantó,PENINSULA,1988-11-14,1\n'
+                    'Jan,Nowak,PENINSULA,1988-11-14,2\n'
+                    'Eva,Ruiz,PENINSULA,1988-02-30,3\n'
+                    'Leo,Gil,MADRID,1990-01-01,4\n', encoding='utf-8')
+    processor = DataProcessor.create_record_processor(DataFormat.TEXT, FactoryType.FROM_USER,
+                                                      parsers={'origin': Destination})
+    first, second = processor.process(str(path)).get_content()
+    assert first == ('Ana', 'Cantó', Destination.PN, date(1988, 11, 14), 1)
+    assert first[3] is second[3]
+
+
+def test_schema_validator_parses_typed_values():
+    record = {'name': 'Paweł', 'surname': 'Bączkowski', 'origin': 'BALEARICS ISLANDS', 'birthdate': '1989-02-17', 'id': 3}
+    validator = SchemaValidator(record_schema(FactoryType.FROM_USER, {'origin': Destination}))
+    assert validator.validate([record]) == [('Paweł', 'Bączkowski', Destination.IB, date(1989, 2, 17), 3)]
+    validator = SchemaValidator(RecordSchemas.FROM_USER.value)
+    assert validator.validate([record]) == [('Paweł', 'Bączkowski', 'BALEARICS ISLANDS', date(1989, 2, 17), 3)]
+
+
+def test_record_schema_rejects_unknown_fields():
+    with pytest.raises(KeyError) as e:
+        record_schema(FactoryType.FROM_USER, {'country': Destination})
+    assert str(e.value) == "'Field Not Found'"
+    assert record_schema(FactoryType.FROM_SERVICE) is RecordSchemas.FROM_SERVICE.value
+
+
+@pytest.mark.parametrize('record', [
+    {'id': 1, 'name': 'Bites, Inc', 'category': 'Food', 'price': 29.99},
+    {'id': 1, 'name': 'Bites', 'category': 'Food', 'price': 29},
+    {'id': True, 'name': 'Bites', 'category': 'Food', 'price': 29.99},
+    {'id': 1, 'name': 'Bites', 'category': 'Food'},
+    {'id': 1, 'name': ['Bites'], 'category': 'Food', 'price': 29.99},
+    'not a record',
+])
+def test_schema_validator_rejects_invalid_service_records(record):
+    validator = SchemaValidator(RecordSchemas.FROM_SERVICE.value)
+    assert validator.validate([record]) == []
+
+
+def test_schema_validator_rejects_unparsable_values():
+    validator = SchemaValidator(record_schema(FactoryType.FROM_USER, {'origin': Destination}))
+    assert validator.validate([
+        {'name': 'Ana', 'surname': 'Cantó', 'origin': 'MADRID', 'birthdate': '1988-11-14', 'id': 2},
+        {'name': 'Ana', 'surname': 'Cantó', 'origin': 'PENINSULA', 'birthdate': '1988-13-14', 'id': 2},
+    ]) == []
+
+
+@pytest.mark.parametrize('json_lines', [False, True])
+def test_json_prices_are_read_from_their_text(tmp_path, json_lines):
+    records = ['{"id": 1, "name": "Tea", "category": "Tea", "price": 0.10000000000000001}',
+               '{"id": 2, "name": "Wine", "category": "Wine", "price": 12345678901234567.89}']
+    path = tmp_path / ('services.jsonl' if json_lines else 'services.json')
+    path.write_text('\n'.join(records) if json_lines else '[' + ',\n'.join(records) + ']')
+    expected = [Decimal('0.10000000000000001'), Decimal('12345678901234567.89')]
+
+    records = DataProcessor.create_record_processor(DataFormat.JSON, FactoryType.FROM_SERVICE).process(str(path))
+    assert [price for *_, price in records.get_content()] == expected
+    services = ServiceRepo(DataProcessor.create_processor(DataFormat.JSON, FactoryType.FROM_SERVICE).process(str(path)))
+    assert [service.price for service in services.get_services().values()] == expected
+
+
+def test_create_record_processor_invalid_combination():
+    assert DataProcessor.create_record_processor('invalid_data_type', FactoryType.FROM_USER) is None
+
+
+def test_low_cardinality_strings_are_interned():
+    rows = ['1,Tea Time,Hot Drinks,1.50', '2,Tea Party,Hot Drinks,2.50']
+    converter = DataProcessor.create_record_processor(DataFormat.TEXT, FactoryType.FROM_SERVICE).converter
+    first, second = converter.convert(rows).get_content()
+    assert first[2] is second[2]
+
+    services = ServiceRepo(TextData([row.split(',') for row in rows])).get_services()
+    assert services[1].category is services[2].category
+    users = UserRepo(TextData([['Ana', 'Cantó', 'PENINSULA', '1988-11-14', '1'],
+                               ['Ana', 'Cantó', 'PENINSULA', '1990-01-02', '2']])).get_all_users()
+    assert users[1].name is users[2].name and users[1].surname is users[2].surname
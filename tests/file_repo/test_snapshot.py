@@ -0,0 +1,67 @@
+from myproj.file_repo.file_reader_factory import DataProcessor, DataFormat, FactoryType
+from myproj.file_repo.snapshot import read_snapshot, write_snapshot
+from myproj.model.service import Service
+from myproj.model.subscription import Subscription
+from myproj.model.user import User, Destination
+from myproj.service.service import ServiceRepo
+from myproj.service.subscription import SubscriptionRepo
+from myproj.service.subscription_store import SubscriptionStore
+from myproj.service.user import UserRepo
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+
+@pytest.mark.parametrize('repo_cls, factory_type, path', [
+    (ServiceRepo, FactoryType.FROM_SERVICE, 'data/data_service.csv'),
+    (UserRepo, FactoryType.FROM_USER, 'data/data_user.csv'),
+    (SubscriptionRepo, FactoryType.FROM_SUBSCRIPTION, 'data/data_subscription.csv'),
+    (SubscriptionStore, FactoryType.FROM_SUBSCRIPTION, 'data/data_subscription.csv'),
+])
+def test_snapshot_round_trip_of_loaded_data(tmp_path, repo_cls, factory_type, path):
+    repo = repo_cls(DataProcessor.create_processor(DataFormat.TEXT, factory_type).process(path))
+    snapshot = str(tmp_path / 'repo.snap')
+    repo.save_snapshot(snapshot)
+    loaded = repo_cls.load_snapshot(snapshot)
+    getter = {ServiceRepo: 'get_services', UserRepo: 'get_all_users'}.get(repo_cls, 'get_subscriptions')
+    assert getattr(loaded, getter)() == getattr(repo, getter)()
+
+
+def test_snapshot_keeps_exact_values(tmp_path):
+    services = [Service(1, 'Café Ñandú', 'Food', Decimal('10.50')), Service(2, 'Café Ñandú', 'Food', Decimal('-3E+2'))]
+    users = [User('Łukasz', 'Núñez', Destination.CM, date(1, 1, 1)), User('Ana', 'Ruiz', Destination.IB, date(2000, 2, 29), 7)]
+    subscriptions = [Subscription(1, 2, 3), Subscription(1, 2, 3, Decimal('0.001'), 4, False),
+                     Subscription(1, 2, 3, Decimal(0), 5, None)]
+    for kind, records in ((FactoryType.FROM_SERVICE, services), (FactoryType.FROM_USER, users),
+                          (FactoryType.FROM_SUBSCRIPTION, subscriptions)):
+        path = str(tmp_path / f'{kind.value}.snap')
+        write_snapshot(path, kind, records)
+        content = read_snapshot(path, kind).get_content()
+        assert content == [tuple(getattr(record, name) for name in record.__slots__) for record in records]
+        assert [str(value) for row in content for value in row if isinstance(value, Decimal)] == \
+            [str(value) for record in records for value in (getattr(record, name) for name in record.__slots__)
+             if isinstance(value, Decimal)]
+
+
+def test_empty_snapshot(tmp_path):
+    path = str(tmp_path / 'empty.snap')
+    SubscriptionRepo([]).save_snapshot(path)
+    assert SubscriptionRepo.load_snapshot(path).get_subscriptions() == {}
+
+
+def test_snapshot_rejects_other_files(tmp_path):
+    path = str(tmp_path / 'services.snap')
+    ServiceRepo([Service(1, 'Superfood', 'Food', Decimal('10.00'))]).save_snapshot(path)
+    with pytest.raises(ValueError):
+        UserRepo.load_snapshot(path)
+    with pytest.raises(ValueError):
+        ServiceRepo.load_snapshot('data/data_service.csv')
+    with pytest.raises(FileNotFoundError):
+        ServiceRepo.load_snapshot(str(tmp_path / 'missing.snap'))
+
+
+@pytest.mark.parametrize('price', [Decimal('NaN'), Decimal('1E+200'), Decimal(2 ** 70)])
+def test_snapshot_rejects_unrepresentable_decimals(tmp_path, price):
+    with pytest.raises(ValueError):
+        ServiceRepo([Service(1, 'Superfood', 'Food', price)]).save_snapshot(str(tmp_path / 'bad.snap'))
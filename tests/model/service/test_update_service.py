@@ -28,4 +28,15 @@ def test_when_no_updated():
     service = Service(id_=1, name='A', category='Food', price=Decimal(100))
     expected_service = Service(id_=1, name='A', category='Food', price=Decimal(100))
     updated_service = service.update(data)
-    assert expected_service == updated_service
\ No newline at end of file
+    assert expected_service == updated_service
+
+
+def test_service_is_slotted():
+    service = Service(id_=1, name='A', category='Food', price=Decimal(100))
+    assert not hasattr(service, '__dict__')
+
+
+def test_when_unknown_field_will_be_updated():
+    service = Service(id_=1, name='A', category='Food', price=Decimal(100))
+    with pytest.raises(TypeError):
+        service.update({'colour': 'red'})
@@ -65,3 +65,13 @@ def test_when_no_updated():
     expected_subscription = Subscription(user_id=1, service_id=1, quantity_per_month=1, id_=10, active=True)
     updated_subscription = subscription.update(data)
     assert expected_subscription == updated_subscription
+
+def test_subscription_is_slotted():
+    subscription = Subscription(user_id=1, service_id=1, quantity_per_month=1)
+    assert not hasattr(subscription, '__dict__')
+
+def test_update_returns_new_instance():
+    subscription = Subscription(user_id=1, service_id=1, quantity_per_month=1)
+    updated_subscription = subscription.update({'active': False})
+    assert subscription.active is True
+    assert updated_subscription is not subscription
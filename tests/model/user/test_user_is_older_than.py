@@ -21,4 +21,10 @@ def test_user_is_older_than():
 
 def test_user_is_not_older_than():
     u1 = User('Jan', 'Nowak', Destination.PN, date.today())
-    assert not u1.is_older_than(18)
\ No newline at end of file
+    assert not u1.is_older_than(18)
+
+def test_user_is_slotted_and_frozen():
+    u1 = User('Jan', 'Nowak', Destination.PN, date(2000, 11, 1))
+    assert not hasattr(u1, '__dict__')
+    with pytest.raises(AttributeError):
+        u1.name = 'Adam'
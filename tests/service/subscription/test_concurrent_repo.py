@@ -0,0 +1,80 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from myproj.model.service import Service
+from myproj.model.subscription import Subscription
+from myproj.model.user import User, Destination
+from myproj.service.concurrent_repo import (ConcurrentServiceRepo, ConcurrentSubscriptionRepo, ConcurrentUserRepo,
+                                            ReadWriteLock)
+from myproj.service.user import UserService
+
+
+@pytest.fixture
+def user_service():
+    users = [User('User', str(i), Destination.PN, date(1990, 1, 1), i) for i in range(1, 11)]
+    services = [Service(i, f'Service {i}', 'Food', Decimal('10.00')) for i in range(1, 6)]
+    return UserService(ConcurrentUserRepo(users), ConcurrentServiceRepo(services), ConcurrentSubscriptionRepo([]))
+
+
+def test_snapshots_are_shared_until_a_mutation(user_service):
+    repo = user_service.subscription_repo
+    first = repo.add_subscription(Subscription(1, 1, 1))
+    snapshot = repo.get_subscriptions()
+    assert repo.get_subscriptions() is snapshot
+    with pytest.raises(TypeError):
+        snapshot[99] = first
+
+    repo.add_subscription(Subscription(2, 2, 2))
+    assert list(snapshot) == [first.id_]
+    assert len(repo.get_subscriptions()) == 2
+    assert repo.get_all_active_subscriptions() == repo.get_all_subscriptions()
+
+
+def test_concurrent_writers_and_readers_keep_the_indexes_consistent(user_service):
+    repo = user_service.subscription_repo
+
+    def work(worker):
+        for i in range(300):
+            subscription = user_service.subscribe_user_to_service(worker % 10 + 1, i % 5 + 1, 1)
+            if i % 3 == 0:
+                repo.update(subscription.id_, {'active': False})
+            if i % 7 == 0:
+                repo.delete(subscription.id_)
+            report = user_service.active_subscriptions_report()
+            assert all(isinstance(service, Service) for services in report.values() for service in services)
+            assert all(sub.is_active() for sub in repo.get_all_active_subscriptions())
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(work, range(8)))
+
+    subscriptions = repo.get_subscriptions()
+    assert len(subscriptions) == 8 * (300 - len(range(0, 300, 7)))
+    assert sorted(repo.get_all_active_subscriptions(), key=lambda sub: sub.id_) == \
+        sorted((sub for sub in subscriptions.values() if sub.is_active()), key=lambda sub: sub.id_)
+    for user_id in range(1, 11):
+        assert {sub.id_ for sub in repo.get_subscriptions_by_user_id(user_id)} == \
+            {sub.id_ for sub in subscriptions.values() if sub.user_id == user_id}
+
+
+def test_write_lock_is_reentrant_and_excludes_readers():
+    lock = ReadWriteLock()
+    events = []
+
+    def read():
+        with lock.read():
+            events.append('read')
+
+    with lock.write():
+        with lock.write(), lock.read():
+            events.append('nested')
+        reader = threading.Thread(target=read)
+        reader.start()
+        reader.join(0.1)
+        assert reader.is_alive()
+        events.append('written')
+    reader.join()
+    assert events == ['nested', 'written', 'read']
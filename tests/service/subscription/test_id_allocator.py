@@ -0,0 +1,54 @@
+from myproj.service.id_allocator import IdAllocator
+from myproj.service.subscription import SubscriptionRepo
+from myproj.service.subscription_store import SubscriptionStore
+from myproj.model.subscription import Subscription
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+
+def test_allocator_is_monotonic():
+    allocator = IdAllocator.from_ids([3, None, 7, 1])
+    assert allocator.next_id() == 8
+    assert allocator.reserve(3) == range(9, 12)
+    assert allocator.reserve(0) == range(12, 12)
+    allocator.observe(5)
+    allocator.observe(None)
+    assert allocator.next_id() == 12
+    allocator.observe(20)
+    assert allocator.next_id() == 21
+    with pytest.raises(ValueError):
+        allocator.reserve(-1)
+
+
+def test_allocator_is_thread_safe():
+    allocator = IdAllocator()
+
+    def allocate(_):
+        return [allocator.next_id() for _ in range(1000)] + list(allocator.reserve(10))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        ids = [id_ for block in executor.map(allocate, range(16)) for id_ in block]
+    assert sorted(ids) == list(range(1, 16 * 1010 + 1))
+
+
+@pytest.mark.parametrize('repo_cls', [SubscriptionRepo, SubscriptionStore])
+def test_add_after_delete_never_overwrites(repo_cls):
+    repo = repo_cls([Subscription(1, 1, 1, None, 1), Subscription(2, 2, 2, None, 2), Subscription(3, 3, 3, None, 5)])
+    repo.delete(1)
+    added = repo.add_subscription(Subscription(4, 4, 4))
+    assert added.id_ == 6
+    assert len(repo.get_all_subscriptions()) == 3
+    repo.upsert(Subscription(5, 5, 5, None, 10))
+    assert repo.add_subscription({'user_id': 6, 'service_id': 6, 'quantity_per_month': 6}).id_ == 11
+    assert repo.reserve_ids(2) == range(12, 14)
+
+
+@pytest.mark.parametrize('repo_cls', [SubscriptionRepo, SubscriptionStore])
+def test_add_after_id_change_never_overwrites(repo_cls):
+    repo = repo_cls([Subscription(i, i, i, None, i) for i in range(1, 11)])
+    repo.update(1, {'id_': 20})
+    added = repo.add_subscription(Subscription(1, 1, 1))
+    assert added.id_ == 21
+    assert len(repo.get_all_subscriptions()) == 11
+    assert repo.find_by_id(20).user_id == 1
@@ -0,0 +1,94 @@
+from myproj.file_repo.file_reader_factory import DataProcessor, DataFormat, FactoryType
+from myproj.model.service import Service
+from myproj.model.subscription import Subscription
+from myproj.model.user import User, Destination
+from myproj.service.subscription_store import SubscriptionStore
+from myproj.service.persistence import PersistentRepo
+from myproj.service.service import ServiceRepo
+from myproj.service.subscription import SubscriptionRepo
+from myproj.service.user import UserService, UserRepo
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+
+@pytest.fixture
+def paths(tmp_path):
+    return str(tmp_path / 'subscriptions.snap'), str(tmp_path / 'subscriptions.journal')
+
+
+def test_changes_survive_restart(paths):
+    initial = DataProcessor.create_processor(DataFormat.TEXT, FactoryType.FROM_SUBSCRIPTION).process('data/data_subscription.csv')
+    users = UserRepo(DataProcessor.create_processor(DataFormat.TEXT, FactoryType.FROM_USER).process('data/data_user.csv'))
+    services = ServiceRepo(DataProcessor.create_processor(DataFormat.TEXT, FactoryType.FROM_SERVICE).process('data/data_service.csv'))
+
+    with PersistentRepo.open(SubscriptionRepo, *paths, initial_data=initial) as persistent:
+        user_service = UserService(users, services, persistent.repo)
+        added = user_service.subscribe_user_to_service(1, 2, 3)
+        persistent.repo.delete(1)
+        expected = dict(persistent.repo.get_subscriptions())
+        persistent.commit()
+        assert persistent.journal.size() > 0
+
+    with PersistentRepo.open(SubscriptionRepo, *paths) as persistent:
+        assert persistent.repo.get_subscriptions() == expected
+        assert added in persistent.repo.get_subscriptions_by_user_id(1)
+
+
+def test_commit_compacts_large_journal(paths):
+    with PersistentRepo.open(SubscriptionRepo, *paths, compact_bytes=200) as persistent:
+        for _ in range(20):
+            persistent.repo.add_subscription(Subscription(1, 1, 1))
+        persistent.commit()
+        assert persistent.journal.size() == 0
+        assert len(SubscriptionRepo.load_snapshot(paths[0]).get_subscriptions()) == 20
+        persistent.repo.delete(20)
+        expected = dict(persistent.repo.get_subscriptions())
+
+    with PersistentRepo.open(SubscriptionRepo, *paths) as persistent:
+        assert persistent.repo.get_subscriptions() == expected
+        assert len(expected) == 19
+
+
+def test_user_changes_survive_restart(paths):
+    initial = [User('Ana', 'Ruiz', Destination.PN, date(1990, 1, 1), 1),
+               User('Luis', 'Gil', Destination.IC, date(1960, 5, 2), 2)]
+    with PersistentRepo.open(UserRepo, *paths, initial_data=initial) as persistent:
+        assert persistent.repo.get_users_older_than(50, date(2020, 1, 1)) == [initial[1]]
+        persistent.repo.upsert(User('Eva', 'Sanz', Destination.IB, date(1950, 3, 3), 3))
+        persistent.repo.delete(2)
+        expected = dict(persistent.repo.get_all_users())
+
+    with PersistentRepo.open(UserRepo, *paths) as persistent:
+        assert persistent.repo.get_all_users() == expected
+        assert [user.id_ for user in persistent.repo.get_users_older_than(50, date(2020, 1, 1))] == [3]
+
+
+def test_unsupported_repository_class(paths):
+    with pytest.raises(ValueError, match='Unsupported repository class: SubscriptionStore'):
+        PersistentRepo.open(SubscriptionStore, *paths)
+
+
+def test_close_detaches_journal(paths):
+    persistent = PersistentRepo.open(ServiceRepo, str(paths[0]) + '.services', str(paths[1]) + '.services')
+    persistent.close()
+    assert persistent.repo.journal is None
+
+
+@pytest.mark.parametrize('repo_cls, initial', [
+    (SubscriptionRepo, [Subscription(1, 1, 1, None, 1, True), Subscription(2, 1, 1, None, 2, True)]),
+    (ServiceRepo, [Service(1, 'Superfood', 'Food', Decimal('10.00')), Service(2, 'Tea Box', 'Tea', Decimal('5.00'))]),
+])
+def test_id_change_replays_to_the_live_state(paths, repo_cls, initial):
+    with PersistentRepo.open(repo_cls, *paths, initial_data=initial) as persistent:
+        persistent.repo.update(1, {'id_': 5})
+        persistent.repo.update(5, {'id_': 2})
+        expected = dict(persistent.repo.get_subscriptions() if repo_cls is SubscriptionRepo
+                        else persistent.repo.get_services())
+        assert list(expected) == [2]
+        assert expected[2].id_ == 2
+
+    with PersistentRepo.open(repo_cls, *paths) as persistent:
+        assert dict(persistent.repo.get_subscriptions() if repo_cls is SubscriptionRepo
+                    else persistent.repo.get_services()) == expected
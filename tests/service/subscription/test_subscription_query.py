@@ -0,0 +1,98 @@
+from myproj.service.subscription import SubscriptionRepo
+from myproj.service.subscription_store import SubscriptionStore
+from myproj.model.subscription import Subscription
+from decimal import Decimal
+
+import pytest
+
+pytest.importorskip('numpy')
+
+from myproj.service.subscription_query import SubscriptionQuery
+
+
+@pytest.fixture
+def subscription_repo():
+    return SubscriptionRepo([
+        Subscription(1, 1, 1, Decimal("10.00"), 1, True),
+        Subscription(2, 2, 2, Decimal("20.00"), 2, False),
+        Subscription(3, 2, 4, None, 3, True),
+        Subscription(1, 2, 3, Decimal("10.50"), 4, True)
+    ])
+
+
+@pytest.fixture
+def query(subscription_repo):
+    return SubscriptionQuery.from_repo(subscription_repo)
+
+
+def test_query_from_store_skips_deleted_rows(subscription_repo):
+    store = SubscriptionStore(subscription_repo.get_all_subscriptions())
+    store.delete(2)
+    query = SubscriptionQuery.from_repo(store)
+    assert len(query) == 3
+    assert query.ids() == [1, 3, 4]
+
+
+def test_active_subscriptions_per_service(query):
+    assert query.count_by('service_id', query.active_mask()) == {1: 1, 2: 2}
+
+
+def test_monthly_quantity_per_user(query):
+    assert query.sum_by('user_id', 'quantity_per_month') == {1: 4, 2: 2, 3: 4}
+
+
+def test_monthly_quantity_per_user_for_service(query):
+    assert query.sum_by('user_id', 'quantity_per_month', query.equal_mask('service_id', 2)) == {1: 3, 2: 2, 3: 4}
+
+
+def test_discount_per_user_skips_missing_discounts(query):
+    assert query.sum_by('user_id', 'discount') == {1: Decimal('20.50'), 2: Decimal('20.00')}
+    assert query.sum_by('user_id', 'discount', query.active_mask()) == {1: Decimal('20.50')}
+
+
+def test_sums_are_exact_beyond_float_precision():
+    large = 2 ** 53 + 1
+    query = SubscriptionQuery.from_repo(SubscriptionRepo([
+        Subscription(1, 1, large, None, 1, True),
+        Subscription(1, 1, large, None, 2, True),
+        Subscription(2, 1, 1, None, 3, True),
+    ]))
+    assert query.sum_by('user_id', 'quantity_per_month') == {1: 2 * large, 2: 1}
+
+
+def test_sums_beyond_64_bits_are_exact():
+    large = 2 ** 62
+    query = SubscriptionQuery.from_repo(SubscriptionRepo([
+        Subscription(1, 1, large, None, 1, True),
+        Subscription(1, 1, large, None, 2, True),
+        Subscription(1, 1, large, None, 3, True),
+        Subscription(2, 1, 1, None, 4, True),
+    ]))
+    assert query.sum_by('user_id', 'quantity_per_month') == {1: 3 * large, 2: 1}
+    assert query.sum_by('service_id', 'quantity_per_month') == {1: 3 * large + 1}
+
+
+def test_discount_with_too_many_decimals_is_rejected():
+    repo = SubscriptionRepo([Subscription(1, 1, 1, Decimal("0.005"), 1, True)])
+    with pytest.raises(ValueError, match='Discount precision not supported'):
+        SubscriptionQuery.from_repo(repo)
+
+
+def test_discount_greater_than(query):
+    assert query.ids(query.discount_greater_than(Decimal('10'))) == [2, 4]
+    assert query.ids(query.discount_greater_than(Decimal('-1'))) == [1, 2, 4]
+
+
+def test_combined_masks(query):
+    mask = query.active_mask() & query.discount_greater_than(Decimal('10.25'))
+    assert query.ids(mask) == [4]
+
+
+def test_query_matches_python_loop_on_larger_data():
+    subscriptions = [Subscription(i % 101, i % 7, i % 5, Decimal(i % 30), i, bool(i % 3)) for i in range(1, 5001)]
+    query = SubscriptionQuery.from_repo(SubscriptionRepo(subscriptions))
+    expected = {}
+    for subscription in subscriptions:
+        if subscription.is_active():
+            expected[subscription.service_id] = expected.get(subscription.service_id, 0) + 1
+    assert query.count_by('service_id', query.active_mask()) == expected
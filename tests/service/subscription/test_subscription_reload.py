@@ -0,0 +1,92 @@
+from myproj.file_repo.tail import TailReader
+from myproj.service.reload import SubscriptionReloader, ReloadResult
+from myproj.service.subscription import SubscriptionRepo
+from myproj.service.subscription_store import SubscriptionStore
+from myproj.model.subscription import Subscription
+from decimal import Decimal
+import os
+
+import pytest
+
+HEADER = 'User,Service,QuantityMonth,Discount,ID, Active\n'
+
+
+@pytest.fixture
+def subscription_csv(tmp_path):
+    path = tmp_path / 'subscriptions.csv'
+    path.write_text(HEADER + '1,2,2,10,1,0\n3,3,2,15,2,1\n', encoding='utf-8')
+    return path
+
+
+def append(path, text):
+    with open(path, 'a', encoding='utf-8', newline='') as f:
+        f.write(text)
+
+
+def test_tail_reader_returns_only_complete_new_lines(subscription_csv):
+    reader = TailReader()
+    assert reader.read_new_lines(str(subscription_csv)) == (['1,2,2,10,1,0', '3,3,2,15,2,1'], False)
+    assert reader.read_new_lines(str(subscription_csv)) == ([], False)
+    append(subscription_csv, '4,1,1,0,3,1\r\n5,1,1,0,')
+    assert reader.read_new_lines(str(subscription_csv)) == (['4,1,1,0,3,1'], False)
+    append(subscription_csv, '4,1\n')
+    assert reader.read_new_lines(str(subscription_csv)) == (['5,1,1,0,4,1'], False)
+
+
+@pytest.mark.parametrize('content', ['', 'User,Service', HEADER])
+def test_tail_reader_waits_for_header_and_data(tmp_path, content):
+    path = tmp_path / 'subscriptions.csv'
+    path.write_text(content, encoding='utf-8')
+    reader = TailReader()
+    assert reader.read_new_lines(str(path)) == ([], False)
+    path.write_text(HEADER + '1,2,2,10,1,0\n', encoding='utf-8')
+    assert reader.read_new_lines(str(path)) == (['1,2,2,10,1,0'], False)
+
+
+def test_tail_reader_starts_over_when_file_is_rewritten(subscription_csv):
+    reader = TailReader()
+    reader.read_new_lines(str(subscription_csv))
+    subscription_csv.write_text(HEADER + '9,9,9,9,9,1\n', encoding='utf-8')
+    assert reader.read_new_lines(str(subscription_csv)) == (['9,9,9,9,9,1'], True)
+
+    size = os.path.getsize(subscription_csv)
+    with open(subscription_csv, 'r+b') as f:
+        f.seek(size - 4)
+        f.write(b'8,0\n')
+    assert reader.read_new_lines(str(subscription_csv)) == (['9,9,9,9,8,0'], True)
+    assert reader.read_new_lines(str(subscription_csv)) == ([], False)
+
+
+def test_tail_reader_errors(tmp_path):
+    reader = TailReader()
+    with pytest.raises(AttributeError):
+        reader.read_new_lines(str(tmp_path / 'subscriptions.xml'))
+    with pytest.raises(FileNotFoundError):
+        reader.read_new_lines(str(tmp_path / 'missing.csv'))
+
+
+@pytest.mark.parametrize('repo_cls', [SubscriptionRepo, SubscriptionStore])
+def test_reload_upserts_appended_rows(subscription_csv, repo_cls):
+    repo = repo_cls([])
+    reloader = SubscriptionReloader(repo)
+    assert reloader.reload(str(subscription_csv)) == ReloadResult(2, 0)
+    append(subscription_csv, '7,3,1,5,3,1\nnot a row\n1,2,4,0,1,1\n')
+    assert reloader.reload(str(subscription_csv)) == ReloadResult(2, 1)
+
+    assert repo.get_subscriptions() == {
+        1: Subscription(1, 2, 4, Decimal(0), 1, True),
+        2: Subscription(3, 3, 2, Decimal(15), 2, True),
+        3: Subscription(7, 3, 1, Decimal(5), 3, True),
+    }
+    assert repo.get_subscriptions_by_user_id(1) == [Subscription(1, 2, 4, Decimal(0), 1, True)]
+    assert [s.id_ for s in repo.get_subscriptions_by_service_id(3)] == [2, 3]
+    assert sorted(s.id_ for s in repo.get_all_active_subscriptions()) == [1, 2, 3]
+
+
+def test_upsert_keeps_indexes_consistent():
+    repo = SubscriptionRepo([Subscription(1, 1, 1, None, 1, True), Subscription(2, 1, 1, None, 2, True)])
+    repo.upsert(Subscription(5, 2, 1, None, 1, False))
+    assert repo.get_subscriptions_by_user_id(1) == []
+    assert repo.get_subscriptions_by_user_id(5) == [Subscription(5, 2, 1, None, 1, False)]
+    assert repo.get_subscriptions_by_service_id(1) == [Subscription(2, 1, 1, None, 2, True)]
+    assert [s.id_ for s in repo.get_all_active_subscriptions()] == [2]
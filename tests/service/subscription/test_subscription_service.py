@@ -128,3 +128,42 @@ class TestDataToSubscription(unittest.TestCase):
 
 
 
+
+class TestSubscriptionIndexes(unittest.TestCase):
+    def setUp(self):
+        self.subscriptions_repo = SubscriptionRepo([
+            Subscription(1, 1, 1, Decimal("10.00"), 1, True),
+            Subscription(2, 2, 2, Decimal("20.00"), 2, False),
+            Subscription(3, 2, 1, Decimal("30.00"), 3, True)
+        ])
+
+    def test_indexes_follow_added_subscription(self):
+        added_subscription = self.subscriptions_repo.add_subscription(Subscription(1, 2, 1, None))
+
+        self.assertEqual(self.subscriptions_repo.get_subscriptions_by_user_id(1)[-1], added_subscription)
+        self.assertEqual(self.subscriptions_repo.get_subscriptions_by_service_id(2)[-1], added_subscription)
+        self.assertIn(added_subscription, self.subscriptions_repo.get_all_active_subscriptions())
+
+    def test_indexes_follow_updated_subscription(self):
+        self.subscriptions_repo.update(1, {'user_id': 5, 'service_id': 2, 'active': False})
+
+        self.assertEqual(self.subscriptions_repo.get_subscriptions_by_user_id(1), [])
+        self.assertEqual([s.id_ for s in self.subscriptions_repo.get_subscriptions_by_user_id(5)], [1])
+        self.assertEqual([s.id_ for s in self.subscriptions_repo.get_subscriptions_by_service_id(2)], [2, 3, 1])
+        self.assertEqual([s.id_ for s in self.subscriptions_repo.get_all_active_subscriptions()], [3])
+
+    def test_indexes_return_updated_instance(self):
+        self.subscriptions_repo.update(1, {'discount': Decimal("99.00")})
+
+        self.assertEqual(self.subscriptions_repo.get_subscriptions_by_user_id(1)[0].discount, Decimal("99.00"))
+
+    def test_indexes_follow_deleted_subscription(self):
+        self.subscriptions_repo.delete(3)
+
+        self.assertEqual(self.subscriptions_repo.get_subscriptions_by_user_id(3), [])
+        self.assertEqual([s.id_ for s in self.subscriptions_repo.get_subscriptions_by_service_id(2)], [2])
+        self.assertEqual([s.id_ for s in self.subscriptions_repo.get_all_active_subscriptions()], [1])
+
+    def test_unknown_keys_return_empty_lists(self):
+        self.assertEqual(self.subscriptions_repo.get_subscriptions_by_user_id(404), [])
+        self.assertEqual(self.subscriptions_repo.get_subscriptions_by_service_id(404), [])
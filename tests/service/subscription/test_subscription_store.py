@@ -0,0 +1,163 @@
+from myproj.service.subscription import SubscriptionRepo
+from myproj.service.subscription_store import SubscriptionStore
+from myproj.model.subscription import Subscription
+from myproj.file_repo.file_reader_factory import JsonData, TextData
+from decimal import Decimal
+import random
+import tracemalloc
+
+import pytest
+
+
+@pytest.fixture
+def subscriptions():
+    return [
+        Subscription(1, 1, 1, Decimal("10.00"), 1, True),
+        Subscription(2, 2, 2, Decimal("20.00"), 2, False),
+        Subscription(3, 2, 1, None, 3, True)
+    ]
+
+
+@pytest.fixture
+def store(subscriptions):
+    return SubscriptionStore(subscriptions)
+
+
+def test_store_from_text_and_json_matches_repo():
+    rows = [['1', '1', '1', '10.00', '1', '1'], ['2', '1', '2', '20', '2', '0']]
+    for data in (TextData(rows), JsonData(dict(enumerate(rows)))):
+        assert SubscriptionStore(data).get_subscriptions() == SubscriptionRepo(data).get_subscriptions()
+
+
+def test_not_correct_data_to_store():
+    with pytest.raises(ValueError) as e:
+        SubscriptionStore('fake_data')
+    assert str(e.value).startswith('Unsupported')
+
+
+def test_discount_with_too_many_decimals_is_rejected():
+    with pytest.raises(ValueError):
+        SubscriptionStore([Subscription(1, 1, 1, Decimal("0.001"), 1)])
+
+
+def test_invalid_batch_leaves_the_store_unchanged(store, subscriptions):
+    before = store.get_subscriptions()
+    with pytest.raises(ValueError):
+        store.upsert_many([Subscription(9, 9, 9, None, 1), Subscription(1, 1, 1, Decimal("0.001"), 4)])
+    with pytest.raises(ValueError):
+        store.upsert_many([Subscription(9, 9, 9, None, 2), Subscription(1, 1, 2 ** 63, None, 5)])
+    assert store.get_subscriptions() == before
+    assert store.get_subscriptions_by_user_id(9) == []
+
+
+def test_missing_id_is_rejected(store):
+    with pytest.raises(ValueError, match='Subscription ID required'):
+        store.upsert(Subscription(1, 1, 1))
+    with pytest.raises(ValueError, match='Subscription ID required'):
+        store.upsert_many([Subscription(1, 1, 1)])
+    assert len(store) == 3
+
+
+def test_queries_match_repo(store, subscriptions):
+    repo = SubscriptionRepo(subscriptions)
+    assert store.get_subscriptions() == repo.get_subscriptions()
+    assert store.find_by_id(3) == repo.find_by_id(3)
+    assert store.get_subscriptions_by_user_id(1) == repo.get_subscriptions_by_user_id(1)
+    assert store.get_subscriptions_by_service_id(2) == repo.get_subscriptions_by_service_id(2)
+    assert store.get_all_subscriptions() == repo.get_all_subscriptions()
+    assert store.get_all_active_subscriptions() == repo.get_all_active_subscriptions()
+
+
+def test_find_by_id_not_found(store):
+    with pytest.raises(KeyError) as e:
+        store.find_by_id(50)
+    assert str(e.value) == "'Subscription Not Found'"
+
+
+def test_add_subscription(store):
+    added_subscription = store.add_subscription({'user_id': 4, 'service_id': 1, 'quantity_per_month': 2})
+    assert added_subscription == Subscription(4, 1, 2, None, 4, True)
+    assert store.find_by_id(4) == added_subscription
+    assert len(store) == 4
+
+
+def test_update(store):
+    updated_subscription = store.update(1, {'discount': Decimal("99.50"), 'active': False})
+    assert store.find_by_id(1) == updated_subscription
+    assert [s.id_ for s in store.get_all_active_subscriptions()] == [3]
+
+
+def test_update_onto_an_existing_id_matches_repo(subscriptions):
+    store, repo = SubscriptionStore(subscriptions), SubscriptionRepo(subscriptions)
+    for target in (store, repo):
+        target.update(1, {'id_': 2})
+        target.update(3, {'user_id': 4})
+    assert store.get_subscriptions() == repo.get_subscriptions()
+    assert sorted((s.id_, s.user_id) for s in store.get_all_subscriptions()) == [(2, 1), (3, 4)]
+    assert store.get_subscriptions_by_service_id(2) == repo.get_subscriptions_by_service_id(2)
+    assert store.get_subscriptions_by_user_id(1) == repo.get_subscriptions_by_user_id(1)
+    assert len(store) == 2
+
+
+def test_delete_and_compact(store):
+    store.delete(1)
+    assert len(store) == 2
+    store.delete(3)
+    assert len(store) == 1
+    assert store.get_all_subscriptions() == [Subscription(2, 2, 2, Decimal("20.00"), 2, False)]
+    assert store.get_subscriptions_by_service_id(2)[0].id_ == 2
+    with pytest.raises(KeyError):
+        store.delete(3)
+
+
+def test_sparse_ids(store):
+    store._put(Subscription(9, 9, 9, None, 10 ** 9, True))
+    assert store.find_by_id(10 ** 9).user_id == 9
+    store.delete(10 ** 9)
+    with pytest.raises(KeyError):
+        store.find_by_id(10 ** 9)
+
+
+
+def test_64_bit_values(store):
+    large = 2 ** 40
+    store.upsert(Subscription(large, large + 1, large + 2, None, large + 3, True))
+    assert store.find_by_id(large + 3) == Subscription(large, large + 1, large + 2, None, large + 3, True)
+    assert store.get_subscriptions_by_user_id(large)[0].id_ == large + 3
+    with pytest.raises(ValueError) as e:
+        store.upsert(Subscription(2 ** 63, 1, 1, None, 7, True))
+    assert str(e.value) == "Subscription value out of range"
+    assert len(store) == 4
+
+
+def test_key_lookups_follow_updates_deletes_and_compaction():
+    rng = random.Random(7)
+    subscriptions = [Subscription(i % 11, i % 5, 1, None, i, True) for i in range(1, 301)]
+    store, repo = SubscriptionStore(subscriptions), SubscriptionRepo(subscriptions)
+    for id_ in rng.sample(range(1, 301), 200):
+        if rng.random() < 0.8:
+            store.delete(id_)
+            repo.delete(id_)
+        else:
+            data = {'user_id': rng.randrange(11), 'service_id': rng.randrange(5)}
+            store.update(id_, dict(data))
+            repo.update(id_, dict(data))
+    for key in range(11):
+        assert sorted(s.id_ for s in store.get_subscriptions_by_user_id(key)) == \
+            sorted(s.id_ for s in repo.get_subscriptions_by_user_id(key))
+    for key in range(5):
+        assert sorted(s.id_ for s in store.get_subscriptions_by_service_id(key)) == \
+            sorted(s.id_ for s in repo.get_subscriptions_by_service_id(key))
+
+def test_store_uses_less_memory_than_repo():
+    rows = [[str(i % 97), str(i % 13), '2', '12.50', str(i), str(i % 2)] for i in range(1, 20001)]
+
+    def allocated(factory):
+        tracemalloc.start()
+        instance = factory(TextData(rows))
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del instance
+        return size
+
+    assert allocated(SubscriptionStore) * 5 < allocated(SubscriptionRepo)
@@ -0,0 +1,72 @@
+import asyncio
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from myproj.model.service import Service
+from myproj.model.subscription import Subscription
+from myproj.model.user import User, Destination
+from myproj.service.async_user import AsyncUserService
+from myproj.service.service import ServiceRepo
+from myproj.service.subscription import SubscriptionRepo
+from myproj.service.user import UserRepo, UserService
+
+
+@pytest.fixture
+def async_user_service(user_service):
+    return AsyncUserService(user_service)
+
+
+def test_coroutines_match_user_service(async_user_service, user_service, expected_subscription, expected_user_1):
+    async def run():
+        assert await async_user_service.subscriptions_for_user_id(1) == [expected_subscription]
+        assert await async_user_service.users_subscribed_to_service(1) == [expected_user_1]
+        added = await async_user_service.subscribe_user_to_service(1, 2, 5, Decimal('20.00'))
+        assert added == Subscription(1, 2, 5, Decimal('20.00'), 3)
+        return await async_user_service.active_subscriptions_report()
+
+    assert asyncio.run(run()) == user_service.active_subscriptions_report()
+
+
+def test_report_yields_to_the_event_loop_between_chunks():
+    users = [User('User', str(i), Destination.PN, date(1990, 1, 1), i) for i in range(1, 101)]
+    services = [Service(i, f'Service {i}', 'Food', Decimal('10.00')) for i in range(1, 6)]
+    subscriptions = [Subscription(i % 100 + 1, i % 5 + 1, 1, None, i) for i in range(1, 1001)]
+    user_service = UserService(UserRepo(users), ServiceRepo(services), SubscriptionRepo(subscriptions))
+    async_user_service = AsyncUserService(user_service, chunk_size=100)
+
+    async def run():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        await asyncio.sleep(0)
+        start = ticks
+        report = await async_user_service.active_subscriptions_report()
+        task.cancel()
+        return report, ticks - start
+
+    report, ticks = asyncio.run(run())
+    assert report == user_service.active_subscriptions_report()
+    assert ticks >= 9
+
+
+def test_from_files_loads_in_an_executor():
+    async_user_service = asyncio.run(AsyncUserService.from_files('data/data_user.csv', 'data/data_service.csv',
+                                                                 'data/data_subscription.csv'))
+    user_service = async_user_service.user_service
+    assert user_service.user_repo.get_all_users()
+    assert user_service.service_repo.get_services()
+    assert asyncio.run(async_user_service.active_subscriptions_report()) == user_service.active_subscriptions_report()
+
+
+def test_from_files_raises_for_missing_files():
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(AsyncUserService.from_files('data/missing.csv', 'data/data_service.csv',
+                                                'data/data_subscription.csv'))
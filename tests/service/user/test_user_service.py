@@ -1,8 +1,12 @@
 from myproj.model.user import User, Destination
 from myproj.model.service import Service
 from myproj.service.service import ServiceRepo
+from myproj.service.subscription import SubscriptionRepo
+from myproj.service.subscription_store import SubscriptionStore
+from myproj.service.user import SubscriptionTotals, SubscribeResult, UserService
 from myproj.model.subscription import Subscription
-from myproj.file_repo.file_reader_factory import JsonData, TextData
+from myproj.file_repo.file_reader_factory import FactoryType, JsonData, TextData
+from myproj.file_repo.journal import Journal
 from decimal import Decimal
 from datetime import date
 import unittest
@@ -39,3 +43,93 @@ def test_active_subscriptions_report(user_service):
             [Service(1, "Superfood", "Food", Decimal("10.00"))]}
     assert result == expected_report
 
+
+
+def test_active_subscriptions_report_groups_by_user(user_service, expected_user_1):
+    user_service.subscribe_user_to_service(1, 2, 1)
+    result = user_service.active_subscriptions_report()
+    assert result == {expected_user_1: [Service(1, "Superfood", "Food", Decimal("10.00")),
+                                        Service(2, "Superwine", "Wine", Decimal("20.00"))]}
+
+
+def test_active_subscriptions_report_unknown_service(user_service):
+    user_service.subscription_repo.add_subscription(Subscription(1, 404, 1))
+    with pytest.raises(KeyError) as e:
+        user_service.active_subscriptions_report()
+    assert str(e.value) == "'Service Not Found'"
+
+
+def test_active_subscriptions_report_unknown_user(user_service):
+    user_service.subscription_repo.add_subscription(Subscription(404, 1, 1))
+    with pytest.raises(KeyError) as e:
+        user_service.active_subscriptions_report()
+    assert str(e.value) == "'User Not Found'"
+
+
+def test_active_subscriptions_totals(user_service):
+    user_service.subscribe_user_to_service(1, 2, 3)
+    result = user_service.active_subscriptions_totals()
+    assert result == {1: SubscriptionTotals(2, Decimal("60.00"))}
+
+
+def test_subscribe_many(user_service):
+    results = user_service.subscribe_many([
+        (1, 2, 3),
+        (404, 1, 1),
+        (2, 404, 1),
+        (2, 1, 4, Decimal('5.00')),
+        (1,),
+    ])
+    assert results == [
+        SubscribeResult(0, Subscription(1, 2, 3, None, 3)),
+        SubscribeResult(1, error="User Not Found"),
+        SubscribeResult(2, error="Service Not Found"),
+        SubscribeResult(3, Subscription(2, 1, 4, Decimal('5.00'), 4)),
+        SubscribeResult(4, error="Invalid Row"),
+    ]
+    assert [result.ok for result in results] == [True, False, False, True, False]
+    assert user_service.subscription_repo.find_by_id(4) == Subscription(2, 1, 4, Decimal('5.00'), 4)
+    assert user_service.subscriptions_for_user_id(1)[-1] == Subscription(1, 2, 3, None, 3)
+
+
+def test_subscribe_many_matches_single_subscribes(user_service, service_repo_from_list, user_repo_from_list):
+    single = UserService(user_repo_from_list, service_repo_from_list,
+                         SubscriptionRepo(user_service.subscription_repo.get_all_subscriptions()))
+    rows = [(1 + i % 2, 1 + i % 3 % 2, i + 1) for i in range(10)]
+    for row in rows:
+        single.subscribe_user_to_service(*row)
+    user_service.subscribe_many(rows)
+    assert user_service.subscription_repo.get_subscriptions() == single.subscription_repo.get_subscriptions()
+
+
+def test_subscribe_many_reports_malformed_rows(user_service):
+    before = dict(user_service.subscription_repo.get_subscriptions())
+    rows = [None, ([1], 1, 2), (1, 1, 'x'), (1, 1, -5), (1, 1, 0), (1, 1, True), (1, 1, 2, 'x'), 7,
+            (True, 1, 2), (1.0, 1, 2), (1, True, 2), (1, 1.0, 2), (1, 1, 2, None)]
+    results = user_service.subscribe_many(rows)
+    assert [result.error for result in results] == ["Invalid Row"] * 12 + [None]
+    assert len(user_service.subscription_repo.get_subscriptions()) == len(before) + 1
+
+
+def test_subscribe_many_into_store_and_journal(tmp_path, user_service):
+    store = SubscriptionStore(user_service.subscription_repo.get_all_subscriptions())
+    with Journal(str(tmp_path / 'subscriptions.journal'), FactoryType.FROM_SUBSCRIPTION) as journal:
+        user_service.subscription_repo.attach_journal(journal)
+        bulk = UserService(user_service.user_repo, user_service.service_repo, store)
+        rows = [(1 + i % 2, 1 + i % 2, i + 1) for i in range(6)]
+        bulk.subscribe_many(rows)
+        user_service.subscribe_many(rows)
+    assert store.get_subscriptions() == user_service.subscription_repo.get_subscriptions()
+    assert store.get_subscriptions_by_user_id(2) == user_service.subscription_repo.get_subscriptions_by_user_id(2)
+
+    replayed = SubscriptionRepo(store.get_all_subscriptions()[:2])
+    with Journal(str(tmp_path / 'subscriptions.journal'), FactoryType.FROM_SUBSCRIPTION) as journal:
+        journal.replay(replayed)
+    assert replayed.get_subscriptions() == store.get_subscriptions()
+
+
+def test_subscribe_many_without_valid_rows(user_service):
+    before = dict(user_service.subscription_repo.get_subscriptions())
+    assert user_service.subscribe_many([]) == []
+    assert [r.error for r in user_service.subscribe_many([(9, 9, 9)])] == ["User Not Found"]
+    assert user_service.subscription_repo.get_subscriptions() == before
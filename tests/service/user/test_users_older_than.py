@@ -29,3 +29,58 @@ class TestUsersOlderThanWithMockedData(unittest.TestCase):
     @classmethod
     def tearDownClass(cls) -> None:
         cls.mock_today.stop()
+
+
+def age_on(user, today):
+    return today.year - user.birthdate.year - ((today.month, today.day) < (user.birthdate.month, user.birthdate.day))
+
+
+@pytest.fixture
+def dated_users():
+    birthdates = [date(1960, 2, 29), date(1961, 2, 28), date(1961, 3, 1), date(1980, 2, 29), date(1999, 12, 31),
+                  date(2000, 1, 1), date(2000, 2, 29), date(2003, 2, 28), date(2003, 3, 1), date(2020, 6, 15)]
+    return [User('User', str(i), Destination.PN, birthdate, i) for i, birthdate in enumerate(birthdates * 2, 1)]
+
+
+@pytest.mark.parametrize('today', [date(2024, 2, 29), date(2023, 2, 28), date(2023, 3, 1), date(2021, 12, 31)])
+def test_age_queries_match_a_full_scan(dated_users, today):
+    repo = UserRepo(dated_users)
+    for age_min in range(0, 70):
+        assert sorted(user.id_ for user in repo.get_users_older_than(age_min, today)) == \
+            sorted(user.id_ for user in dated_users if age_on(user, today) >= age_min)
+        for age_max in range(age_min, 70, 7):
+            assert sorted(user.id_ for user in repo.get_users_between_ages(age_min, age_max, today)) == \
+                sorted(user.id_ for user in dated_users if age_min <= age_on(user, today) <= age_max)
+
+
+def test_age_queries_are_sorted_and_follow_deletes(dated_users):
+    repo = UserRepo(dated_users)
+    today = date(2024, 2, 29)
+    result = repo.get_users_older_than(18, today)
+    assert [user.birthdate for user in result] == sorted(user.birthdate for user in result)
+
+    repo.delete(1)
+    repo.delete(11)
+    assert all(user.birthdate != date(1960, 2, 29) for user in repo.get_users_older_than(0, today))
+    assert len(repo.get_users_between_ages(0, 150, today)) == len(dated_users) - 2
+    assert repo.get_users_between_ages(30, 20, today) == []
+
+
+def test_age_queries_follow_upserts(dated_users):
+    repo = UserRepo(dated_users)
+    today = date(2024, 2, 29)
+    assert len(repo.get_users_older_than(64, today)) == 2
+    repo.upsert(User('User', 'new', Destination.PN, date(1940, 1, 1), 100))
+    repo.upsert(User('User', 'moved', Destination.PN, date(2020, 1, 1), 1))
+    assert sorted(user.id_ for user in repo.get_users_older_than(64, today)) == [11, 100]
+    repo.delete(100)
+    repo.delete(11)
+    assert repo.get_users_older_than(64, today) == []
+
+
+def test_age_queries_reject_invalid_ages(dated_users):
+    repo = UserRepo(dated_users)
+    with pytest.raises(ValueError):
+        repo.get_users_older_than(-1)
+    with pytest.raises(ValueError):
+        repo.get_users_between_ages(10, 151)